@@ -10,15 +10,16 @@ from typing import Optional, List, Dict, Any
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
-# Rate limiting temporarily disabled for simplicity
-# from slowapi import Limiter, _rate_limit_exceeded_handler
-# from slowapi.util import get_remote_address
-# from slowapi.errors import RateLimitExceeded
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import logging
 
+from health import health_monitor
+from metrics import MetricsMiddleware, metrics
+from rate_limit import RateLimitMiddleware
+from upstream import UpstreamThrottledError, CircuitOpenError, rate_limiters, circuit_breakers, upstream_policy
+
 # Load environment variables
 load_dotenv()
 
@@ -65,15 +66,18 @@ app = FastAPI(
     version="2.0.0"
 )
 
-# Rate limiting temporarily disabled
-# limiter = Limiter(key_func=get_remote_address)
-# app.state.limiter = limiter
-# app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-# CORS configuration
 from config import get_config
 config = get_config()
 
+# Per-client API budgets (added before CORS so rejections still carry CORS headers)
+app.add_middleware(
+    RateLimitMiddleware,
+    limit=config.server.api_rate_limit_max,
+    window_ms=config.server.api_rate_limit_window_ms,
+    redis_url=config.server.rate_limit_redis_url
+)
+
+# CORS configuration
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -85,8 +89,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After"],
 )
 
+# Request metrics (outermost, so rate-limited and CORS-rejected requests are measured too)
+app.add_middleware(MetricsMiddleware)
+
 # Import service modules
 from services.azure_openai import router as openai_router
 from services.computer_vision import router as vision_router
@@ -107,6 +115,47 @@ app.include_router(safety_router, prefix="/api/content-safety", tags=["Content S
 app.include_router(image_router, prefix="/api/image-generation", tags=["Image Generation"])
 app.include_router(document_intelligence_router, prefix="/api/document-intelligence", tags=["Document Intelligence"])
 
+# Upstream throttling that outlasted the wait budget is passed on to the client
+@app.exception_handler(UpstreamThrottledError)
+async def upstream_throttled(request: Request, exc: UpstreamThrottledError):
+    """Translate exhausted upstream capacity into 429 with Retry-After"""
+    return JSONResponse(
+        status_code=429,
+        content={"success": False, "error": str(exc)},
+        headers={"Retry-After": str(max(int(exc.retry_after + 0.999), 1))}
+    )
+
+@app.exception_handler(CircuitOpenError)
+async def upstream_circuit_open(request: Request, exc: CircuitOpenError):
+    """Answer 503 right away while the upstream service's circuit breaker is open"""
+    return JSONResponse(
+        status_code=503,
+        content={"success": False, "error": str(exc)},
+        headers={"Retry-After": str(max(int(exc.retry_after + 0.999), 1))}
+    )
+
+# Background service health probing
+@app.on_event("startup")
+async def start_health_monitor():
+    """Probe every registered service once, then keep the cached results fresh"""
+    await health_monitor.start(config.server.health_probe_interval_seconds)
+
+@app.on_event("shutdown")
+async def stop_health_monitor():
+    """Stop background health probing"""
+    await health_monitor.stop()
+
+# Runtime metrics (default executor, event loop lag, route label sets)
+@app.on_event("startup")
+async def start_metrics():
+    """Instrument the runtime once every route is registered"""
+    await metrics.start(app)
+
+@app.on_event("shutdown")
+async def stop_metrics():
+    """Stop runtime metric sampling"""
+    await metrics.stop()
+
 # Visitor tracking middleware
 @app.middleware("http")
 async def track_visitors(request: Request, call_next):
@@ -153,11 +202,15 @@ async def get_visitor_stats():
 # Health check endpoint
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (serves cached probe results, never calls upstream)"""
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "environment": os.getenv("NODE_ENV", "development")
+        "environment": os.getenv("NODE_ENV", "development"),
+        "services": await health_monitor.report_all(),
+        "upstream_limits": rate_limiters.snapshot(),
+        "circuit_breakers": circuit_breakers.snapshot(),
+        "upstream_latency": upstream_policy.snapshot()
     }
 
 # Configuration status endpoint
@@ -176,6 +229,15 @@ async def config_status():
         }
     }
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Metrics in the Prometheus text exposition format"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=503, detail="Metrics require prometheus_client")
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
 # Mount static files
 app.mount("/styles", StaticFiles(directory="styles"), name="styles")
 app.mount("/js", StaticFiles(directory="js"), name="js")
@@ -127,9 +127,11 @@ class ServerConfig:
     cors_origin: str
     api_rate_limit_max: int
     api_rate_limit_window_ms: int
+    rate_limit_redis_url: Optional[str]
     ssl_enabled: bool
     ssl_cert_path: str
     ssl_key_path: str
+    health_probe_interval_seconds: float
 
     @classmethod
     def from_env(cls) -> 'ServerConfig':
@@ -142,10 +144,52 @@ class ServerConfig:
             environment=os.getenv("NODE_ENV", "development"),
             cors_origin=os.getenv("CORS_ORIGIN", f"{protocol}://localhost:{int(os.getenv('PORT', default_port))}"),
             api_rate_limit_max=int(os.getenv("API_RATE_LIMIT_MAX", 100)),
-            api_rate_limit_window_ms=int(os.getenv("API_RATE_LIMIT_WINDOW_MS", 900000)),
+            api_rate_limit_window_ms=max(int(os.getenv("API_RATE_LIMIT_WINDOW_MS", 900000)), 1000),
+            rate_limit_redis_url=os.getenv("RATE_LIMIT_REDIS_URL") or None,
             ssl_enabled=ssl_enabled,
             ssl_cert_path=os.getenv("SSL_CERT_PATH", "ssl/cert.pem"),
-            ssl_key_path=os.getenv("SSL_KEY_PATH", "ssl/key.pem")
+            ssl_key_path=os.getenv("SSL_KEY_PATH", "ssl/key.pem"),
+            health_probe_interval_seconds=float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", 30))
+        )
+
+@dataclass
+class UpstreamConfig:
+    """Limits for calls to upstream Azure services"""
+    initial_rps: float
+    min_rps: float
+    max_rps: float
+    burst: int
+    max_wait_seconds: float
+    max_retries: int
+    default_timeout_seconds: float
+    hedging: bool
+    breaker_window_seconds: float
+    breaker_min_calls: int
+    breaker_error_rate: float
+    breaker_slow_rate: float
+    breaker_open_seconds: float
+    breaker_probes: int
+
+    @classmethod
+    def from_env(cls) -> 'UpstreamConfig':
+        min_rps = float(os.getenv("UPSTREAM_MIN_RPS", 0.2))
+        max_rps = max(float(os.getenv("UPSTREAM_MAX_RPS", 50)), min_rps)
+
+        return cls(
+            initial_rps=min(max(float(os.getenv("UPSTREAM_INITIAL_RPS", 5)), min_rps), max_rps),
+            min_rps=min_rps,
+            max_rps=max_rps,
+            burst=max(int(os.getenv("UPSTREAM_BURST", 10)), 1),
+            max_wait_seconds=float(os.getenv("UPSTREAM_MAX_WAIT_SECONDS", 5)),
+            max_retries=max(int(os.getenv("UPSTREAM_MAX_RETRIES", 2)), 0),
+            default_timeout_seconds=max(float(os.getenv("UPSTREAM_DEFAULT_TIMEOUT_SECONDS", 30)), 1.0),
+            hedging=os.getenv("UPSTREAM_HEDGING", "true").lower() == "true",
+            breaker_window_seconds=max(float(os.getenv("UPSTREAM_BREAKER_WINDOW_SECONDS", 60)), 1.0),
+            breaker_min_calls=max(int(os.getenv("UPSTREAM_BREAKER_MIN_CALLS", 10)), 1),
+            breaker_error_rate=float(os.getenv("UPSTREAM_BREAKER_ERROR_RATE", 0.5)),
+            breaker_slow_rate=float(os.getenv("UPSTREAM_BREAKER_SLOW_RATE", 0.8)),
+            breaker_open_seconds=max(float(os.getenv("UPSTREAM_BREAKER_OPEN_SECONDS", 30)), 1.0),
+            breaker_probes=max(int(os.getenv("UPSTREAM_BREAKER_PROBES", 3)), 1)
         )
 
 class ConfigManager:
@@ -159,6 +203,7 @@ class ConfigManager:
         self.translator = AzureTranslatorConfig.from_env()
         self.content_safety = AzureContentSafetyConfig.from_env()
         self.server = ServerConfig.from_env()
+        self.upstream = UpstreamConfig.from_env()
     
     def get_service_status(self) -> Dict[str, bool]:
         """Get configuration status for all services"""
@@ -0,0 +1,86 @@
+"""
+Cached Service Health Monitoring
+Probes every registered service on an interval so health endpoints never call upstream
+"""
+import time
+import asyncio
+import inspect
+import logging
+from typing import Dict, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+class HealthMonitor:
+    """Runs registered health probes in the background and serves their cached results"""
+
+    def __init__(self):
+        self._probes: Dict[str, Callable[[], Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, probe: Callable[[], Any]) -> None:
+        """Register (or replace) the probe for a service; probes may be sync or async"""
+        self._probes[name] = probe
+        self._results.pop(name, None)
+        self._checked_at.pop(name, None)
+
+    def is_registered(self, name: str) -> bool:
+        """Whether a probe is registered for a service"""
+        return name in self._probes
+
+    async def start(self, interval_seconds: float) -> None:
+        """Probe every service now, then keep probing in the background"""
+        await self.probe_all()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop the background probing task"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def probe(self, name: str) -> None:
+        """Run one service's probe and cache its result"""
+        probe = self._probes[name]
+        try:
+            result = probe()
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as e:
+            logger.warning(f"Health probe for {name} failed: {str(e)}")
+            result = {"status": "error", "error": str(e)}
+
+        self._results[name] = result
+        self._checked_at[name] = time.time()
+
+    async def probe_all(self) -> None:
+        """Run every registered probe concurrently"""
+        await asyncio.gather(*(self.probe(name) for name in list(self._probes)))
+
+    async def report(self, name: str) -> Dict[str, Any]:
+        """Cached result for a service with its age; probes once if nothing is cached yet"""
+        if name not in self._results:
+            await self.probe(name)
+
+        checked_at = self._checked_at[name]
+        return {
+            **self._results[name],
+            "checked_at": checked_at,
+            "age_seconds": round(time.time() - checked_at, 3)
+        }
+
+    async def report_all(self) -> Dict[str, Dict[str, Any]]:
+        """Cached results for every registered service"""
+        return {name: await self.report(name) for name in self._probes}
+
+    async def _run(self, interval_seconds: float) -> None:
+        """Re-probe all services every interval"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.probe_all()
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
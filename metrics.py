@@ -0,0 +1,269 @@
+"""
+Prometheus Metrics
+Request, upstream and runtime metrics for the /metrics endpoint
+"""
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+logger = logging.getLogger(__name__)
+
+# prometheus_client is optional; without it recording is a no-op and /metrics is unavailable
+try:
+    from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST, Gauge, Histogram, generate_latest
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Upstream calls range from fast lookups to minute-long image generations
+UPSTREAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Event loop lag is sampled this often; lag is how late the sampling task wakes up
+LOOP_LAG_INTERVAL_SECONDS = 0.5
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Label for requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+
+# Paths of requests rejected before routing whose route label is remembered
+UNROUTED_LABEL_CACHE_SIZE = 1024
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """Default executor (used by asyncio.to_thread) that counts busy and queued work items"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__(max_workers=max_workers, thread_name_prefix="asyncio")
+        self.active = 0
+        self.queued = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """Thread limit (resolved from the default when none was given)"""
+        return self._max_workers
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._count_lock:
+            self.queued += 1
+        return super().submit(self._run, fn, args, kwargs)
+
+    def _run(self, fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        with self._count_lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._count_lock:
+                self.active -= 1
+
+class _ScrapeTimeCollector:
+    """Reads gauges and cache counters from their owners when /metrics is scraped"""
+
+    def __init__(self):
+        self.gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+        self.caches: Dict[str, Callable[[], Tuple[int, int]]] = {}
+
+    def collect(self):
+        for name, (documentation, value) in self.gauges.items():
+            try:
+                yield GaugeMetricFamily(name, documentation, value=value())
+            except Exception as e:
+                logger.warning(f"Metric {name} could not be read: {str(e)}")
+
+        lookups = CounterMetricFamily("cache_lookups", "Cache lookups by result", labels=["cache", "result"])
+        ratios = GaugeMetricFamily("cache_hit_ratio", "Share of cache lookups that were hits", labels=["cache"])
+        for cache, stats in self.caches.items():
+            hits, misses = stats()
+            lookups.add_metric([cache, "hit"], hits)
+            lookups.add_metric([cache, "miss"], misses)
+            ratios.add_metric([cache], hits / (hits + misses) if hits + misses else 0.0)
+        yield lookups
+        yield ratios
+
+class Metrics:
+    """Prometheus instruments with cached label children, so recording skips label lookups"""
+
+    def __init__(self):
+        self.enabled = PROMETHEUS_AVAILABLE
+        self.executor: Optional[InstrumentedThreadPoolExecutor] = None
+        self._lag_task: Optional[asyncio.Task] = None
+        self._route_paths: Dict[Any, str] = {}
+        self._unrouted_labels: "OrderedDict[Tuple[str, Optional[str]], str]" = OrderedDict()
+        self._request_children: Dict[Tuple[str, str, str], Any] = {}
+        self._upstream_children: Dict[Tuple[str, str, str], Any] = {}
+        self._upstream_in_flight_children: Dict[str, Any] = {}
+        if not self.enabled:
+            return
+
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "API request latency by route, method and status",
+            ["route", "method", "status"]
+        )
+        self.requests_in_flight = Gauge("http_requests_in_flight", "API requests being handled")
+        self.upstream_duration = Histogram(
+            "upstream_request_duration_seconds",
+            "Upstream Azure call latency by service, operation and status",
+            ["service", "operation", "status"],
+            buckets=UPSTREAM_BUCKETS
+        )
+        self.upstream_in_flight = Gauge("upstream_requests_in_flight", "Upstream Azure calls in progress", ["service"])
+        self.loop_lag = Histogram("event_loop_lag_seconds", "How late the event loop runs a scheduled callback", buckets=LOOP_LAG_BUCKETS)
+        self._collector = _ScrapeTimeCollector()
+        REGISTRY.register(self._collector)
+
+    def register_gauge(self, name: str, documentation: str, value: Callable[[], float]) -> None:
+        """Expose a value read from its owner at scrape time (nothing is recorded on the hot path)"""
+        if self.enabled:
+            self._collector.gauges[name] = (documentation, value)
+
+    def register_cache(self, name: str, stats: Callable[[], Tuple[int, int]]) -> None:
+        """Expose a cache's (hits, misses) counters and hit ratio at scrape time"""
+        if self.enabled:
+            self._collector.caches[name] = stats
+
+    def request_histogram(self, route: str, method: str, status: str):
+        """Histogram child for a request label set, created once"""
+        key = (route, method, status)
+        child = self._request_children.get(key)
+        if child is None:
+            child = self._request_children[key] = self.request_duration.labels(route, method, status)
+        return child
+
+    def observe_upstream(self, service: str, operation: str, status: str, seconds: float) -> None:
+        """Record the latency of one upstream call"""
+        if not self.enabled:
+            return
+        key = (service, operation, status)
+        child = self._upstream_children.get(key)
+        if child is None:
+            child = self._upstream_children[key] = self.upstream_duration.labels(service, operation, status)
+        child.observe(seconds)
+
+    def upstream_started(self, service: str) -> None:
+        """Count an upstream call as in flight"""
+        if self.enabled:
+            self._upstream_gauge(service).inc()
+
+    def upstream_finished(self, service: str) -> None:
+        """Count an upstream call as no longer in flight"""
+        if self.enabled:
+            self._upstream_gauge(service).dec()
+
+    def _upstream_gauge(self, service: str):
+        child = self._upstream_in_flight_children.get(service)
+        if child is None:
+            child = self._upstream_in_flight_children[service] = self.upstream_in_flight.labels(service)
+        return child
+
+    def route_label(self, scope: Scope) -> str:
+        """Route template of a handled request (never the raw path, which would explode label cardinality)"""
+        app = scope.get("app")
+        endpoint = scope.get("endpoint")
+        if endpoint is not None:
+            path = self._route_paths.get(endpoint)
+            if path is not None:
+                return path
+        if app is None or (endpoint is None and "router" in scope):
+            # The router ran and nothing matched
+            return UNMATCHED_ROUTE
+
+        if endpoint is not None:
+            for route in app.routes:
+                if (getattr(route, "endpoint", None) or getattr(route, "app", None)) is endpoint:
+                    self._route_paths[endpoint] = route.path
+                    return route.path
+            return UNMATCHED_ROUTE
+
+        # Requests rejected before routing (e.g. rate limited) are matched here, off the common path
+        key = (scope["path"], scope.get("method"))
+        label = self._unrouted_labels.get(key)
+        if label is None:
+            label = next((route.path for route in app.routes if route.matches(scope)[0] == Match.FULL), UNMATCHED_ROUTE)
+            self._unrouted_labels[key] = label
+            while len(self._unrouted_labels) > UNROUTED_LABEL_CACHE_SIZE:
+                self._unrouted_labels.popitem(last=False)
+        else:
+            self._unrouted_labels.move_to_end(key)
+        return label
+
+    async def start(self, app: Any) -> None:
+        """Instrument the default executor, pre-register route label sets and sample event loop lag"""
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        if self.executor is None:
+            self.executor = InstrumentedThreadPoolExecutor()
+            loop.set_default_executor(self.executor)
+            executor = self.executor
+            self.register_gauge("executor_threads_max", "Worker threads the default executor may start", lambda: executor.max_workers)
+            self.register_gauge("executor_threads_busy", "Default executor threads running a task", lambda: executor.active)
+            self.register_gauge("executor_tasks_queued", "Tasks waiting for a default executor thread", lambda: executor.queued)
+            self.register_gauge("executor_utilization", "Share of default executor threads that are busy", lambda: executor.active / executor.max_workers)
+
+        for route in app.routes:
+            self._route_paths[getattr(route, "endpoint", None) or getattr(route, "app", None)] = route.path
+            for method in getattr(route, "methods", None) or ():
+                self.request_histogram(route.path, method, "200")
+
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(self._sample_loop_lag())
+
+    async def stop(self) -> None:
+        """Stop sampling event loop lag"""
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+            self._lag_task = None
+
+    async def _sample_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + LOOP_LAG_INTERVAL_SECONDS
+            await asyncio.sleep(LOOP_LAG_INTERVAL_SECONDS)
+            self.loop_lag.observe(max(loop.time() - scheduled, 0.0))
+
+    def render(self) -> Tuple[bytes, str]:
+        """Exposition body and content type"""
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+class MetricsMiddleware:
+    """Records latency and in-flight count of every HTTP request"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        metrics.requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.requests_in_flight.dec()
+            metrics.request_histogram(metrics.route_label(scope), scope["method"], status).observe(
+                time.perf_counter() - started
+            )
+
+# Global metrics instance
+metrics = Metrics()
@@ -0,0 +1,210 @@
+"""
+Inbound API Rate Limiting
+Sliding-window request budgets per client, enforced as pure ASGI middleware
+"""
+import json
+import time
+import logging
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+logger = logging.getLogger(__name__)
+
+# The shared backend is optional; without redis each worker enforces its own budget
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Budget units charged per request, by path prefix (first match wins); unlisted API routes cost 1
+ROUTE_COSTS: Tuple[Tuple[str, int], ...] = (
+    ("/api/health", 0),
+    ("/api/visitor-stats", 0),
+    ("/api/config/status", 0),
+    ("/api/image-generation/generate", 20),
+    ("/api/openai/realtime", 5),
+    ("/api/openai/assistant/run", 5),
+    ("/api/openai/", 3),
+    ("/api/document-intelligence/translate", 5),
+    ("/api/document-intelligence/upload", 2),
+    ("/api/document-intelligence/copy", 2),
+)
+
+# Clients tracked in memory before stale entries are pruned early
+MAX_TRACKED_CLIENTS = 100000
+
+def route_cost(path: str) -> int:
+    """Budget units a request to this path costs (0 means it is not limited)"""
+    if not path.startswith("/api/") or path.endswith("/health"):
+        # Static assets, the SPA and health probes are never limited
+        return 0
+    for prefix, cost in ROUTE_COSTS:
+        if path.startswith(prefix):
+            return cost
+    return 1
+
+def _client_key(scope: Scope) -> str:
+    """Budget owner: the client address (headers are client-chosen, so they could mint fresh budgets)"""
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+def _weighted_usage(previous: int, current: int, elapsed_fraction: float) -> float:
+    """Sliding-window estimate: the previous window's count fades out as the current one fills"""
+    return previous * (1 - elapsed_fraction) + current
+
+def _retry_after(limit: int, previous: int, current: int, cost: int, window: float, elapsed: float) -> float:
+    """Seconds until a rejected request of this cost would fit the budget"""
+    if current + cost > limit or previous == 0:
+        return window - elapsed
+    # Wait until enough of the previous window has slid out
+    needed_fraction = 1 - (limit - current - cost) / previous
+    return max(needed_fraction * window - elapsed, 0.0)
+
+class MemoryRateLimitBackend:
+    """Per-process sliding-window counters; each entry is [window_start, current, previous], updated in place"""
+
+    def __init__(self):
+        self._entries: Dict[str, List[float]] = {}
+        self._pruned_at = 0.0
+
+    async def hit(self, key: str, cost: int, limit: int, window: float, now: float) -> Tuple[bool, float, float]:
+        """Charge a request; returns (allowed, weighted usage afterwards, retry-after seconds)"""
+        window_start = now - now % window
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= MAX_TRACKED_CLIENTS:
+                self._prune(window_start, window)
+            entry = self._entries[key] = [window_start, 0, 0]
+        elif entry[0] != window_start:
+            entry[2] = entry[1] if window_start - entry[0] == window else 0
+            entry[1] = 0
+            entry[0] = window_start
+
+        elapsed = now - window_start
+        usage = _weighted_usage(entry[2], entry[1], elapsed / window)
+        if usage + cost > limit:
+            return False, usage, _retry_after(limit, entry[2], entry[1], cost, window, elapsed)
+
+        entry[1] += cost
+        if now - self._pruned_at > window:
+            self._prune(window_start, window)
+        return True, usage + cost, 0.0
+
+    def _prune(self, window_start: float, window: float) -> None:
+        """Forget clients with no requests in the current or previous window"""
+        self._pruned_at = window_start
+        stale = [key for key, entry in self._entries.items() if entry[0] < window_start - window]
+        for key in stale:
+            del self._entries[key]
+
+class RedisRateLimitBackend:
+    """Sliding-window counters in Redis, so every worker enforces one shared budget"""
+
+    def __init__(self, url: str):
+        self._client = redis_asyncio.from_url(url)
+
+    async def hit(self, key: str, cost: int, limit: int, window: float, now: float) -> Tuple[bool, float, float]:
+        """Charge a request; returns (allowed, weighted usage afterwards, retry-after seconds)"""
+        window_index = int(now // window)
+        current_key = f"ratelimit:{key}:{window_index}"
+        previous_key = f"ratelimit:{key}:{window_index - 1}"
+
+        async with self._client.pipeline(transaction=True) as pipeline:
+            pipeline.incrby(current_key, cost)
+            pipeline.expire(current_key, int(window * 2) + 1)
+            pipeline.get(previous_key)
+            current, _, previous = await pipeline.execute()
+        previous = int(previous or 0)
+
+        elapsed = now - window_index * window
+        usage = _weighted_usage(previous, current, elapsed / window)
+        if usage > limit:
+            # Give the units back; a rejected request does not consume budget
+            await self._client.decrby(current_key, cost)
+            return False, usage - cost, _retry_after(limit, previous, current - cost, cost, window, elapsed)
+        return True, usage, 0.0
+
+class RateLimitMiddleware:
+    """Rejects API requests beyond each client's cost-weighted budget and reports RateLimit-* headers"""
+
+    def __init__(self, app: ASGIApp, limit: int, window_ms: int, redis_url: Optional[str] = None):
+        self.app = app
+        self.limit = limit
+        self.window = window_ms / 1000
+        self.local = MemoryRateLimitBackend()
+        self.shared: Optional[RedisRateLimitBackend] = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self.shared = RedisRateLimitBackend(redis_url)
+            else:
+                logger.warning("RATE_LIMIT_REDIS_URL is set but redis is not installed; limits are per worker")
+        # Headers that are the same on every response are encoded once
+        self._static_headers = [
+            (b"ratelimit-limit", str(limit).encode("latin-1")),
+            (b"ratelimit-policy", f"{limit};w={int(self.window)}".encode("latin-1"))
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.limit <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        cost = route_cost(scope["path"])
+        if cost == 0:
+            await self.app(scope, receive, send)
+            return
+
+        now = time.time()
+        key = _client_key(scope)
+        allowed, usage, retry_after = await self._hit(key, cost, now)
+
+        remaining = (b"ratelimit-remaining", b"%d" % max(int(self.limit - usage), 0))
+        reset = (b"ratelimit-reset", b"%d" % int(self.window - now % self.window + 0.999))
+
+        if not allowed:
+            await self._reject(send, [remaining, reset, *self._static_headers], retry_after)
+            return
+
+        await self.app(scope, receive, partial(self._send_with_headers, send, remaining, reset))
+
+    async def _send_with_headers(
+        self,
+        send: Send,
+        remaining: Tuple[bytes, bytes],
+        reset: Tuple[bytes, bytes],
+        message: Message
+    ) -> None:
+        """Forward a response message, adding the RateLimit-* headers to its start"""
+        if message["type"] == "http.response.start":
+            headers = list(message.get("headers", ()))
+            headers.append(remaining)
+            headers.append(reset)
+            headers.extend(self._static_headers)
+            message["headers"] = headers
+        await send(message)
+
+    async def _hit(self, key: str, cost: int, now: float) -> Tuple[bool, float, float]:
+        """Charge the shared budget, falling back to the local one if the backend is unreachable"""
+        if self.shared is not None:
+            try:
+                return await self.shared.hit(key, cost, self.limit, self.window, now)
+            except Exception as e:
+                logger.warning(f"Shared rate limit backend failed, using local limits: {str(e)}")
+        return await self.local.hit(key, cost, self.limit, self.window, now)
+
+    async def _reject(self, send: Send, headers: List[Tuple[bytes, bytes]], retry_after: float) -> None:
+        """Answer 429 without reaching the application"""
+        body = json.dumps({"success": False, "error": "Rate limit exceeded"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": headers + [
+                (b"retry-after", str(max(int(retry_after + 0.999), 1)).encode("latin-1")),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1"))
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
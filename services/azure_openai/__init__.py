@@ -3,13 +3,15 @@ Azure OpenAI Service Module
 Vertical slice architecture for Azure OpenAI integration
 """
 import os
-import time
+import asyncio
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from openai import AzureOpenAI
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -21,7 +23,9 @@ def get_openai_client():
     return AzureOpenAI(
         azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
         api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-05-01-preview")
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-05-01-preview"),
+        # Retries are handled by the shared upstream policy, which also sees every 429
+        max_retries=0
     )
 
 # Pydantic models for request/response
@@ -61,13 +65,23 @@ async def chat_completion(request: Request, chat_request: ChatRequest):
     try:
         client = get_openai_client()
         
-        completion = client.chat.completions.create(
-            model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
-            messages=chat_request.messages,
-            temperature=chat_request.temperature,
-            max_tokens=chat_request.max_tokens,
-            top_p=chat_request.top_p
+        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
+        # Raw responses carry the status and quota headers the rate limiter adapts to
+        response = await call_upstream(
+            "openai",
+            "chat",
+            lambda timeout: client.chat.completions.with_raw_response.create(
+                model=deployment,
+                messages=chat_request.messages,
+                temperature=chat_request.temperature,
+                max_tokens=chat_request.max_tokens,
+                top_p=chat_request.top_p,
+                timeout=timeout
+            ),
+            idempotent=True,
+            deployment=deployment
         )
+        completion = response.parse()
         
         return {
             "success": True,
@@ -77,6 +91,8 @@ async def chat_completion(request: Request, chat_request: ChatRequest):
                 "finish_reason": completion.choices[0].finish_reason
             }
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"OpenAI chat error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -99,7 +115,12 @@ async def create_assistant(request: Request, assistant_request: AssistantRequest
         if assistant_request.tools:
             create_params["tools"] = assistant_request.tools
             
-        assistant = client.beta.assistants.create(**create_params)
+        response = await call_upstream(
+            "openai",
+            "assistants.create",
+            lambda timeout: client.beta.assistants.with_raw_response.create(**create_params, timeout=timeout)
+        )
+        assistant = response.parse()
         
         return {
             "success": True,
@@ -110,6 +131,8 @@ async def create_assistant(request: Request, assistant_request: AssistantRequest
                 "instructions": assistant.instructions
             }
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Assistant creation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,7 +144,12 @@ async def create_thread(request: Request):
     """
     try:
         client = get_openai_client()
-        thread = client.beta.threads.create()
+        response = await call_upstream(
+            "openai",
+            "threads.create",
+            lambda timeout: client.beta.threads.with_raw_response.create(timeout=timeout)
+        )
+        thread = response.parse()
         
         return {
             "success": True,
@@ -130,6 +158,8 @@ async def create_thread(request: Request):
                 "created_at": thread.created_at
             }
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Thread creation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -142,11 +172,17 @@ async def add_message(request: Request, message_request: ThreadMessageRequest):
     try:
         client = get_openai_client()
         
-        message = client.beta.threads.messages.create(
-            thread_id=message_request.thread_id,
-            role="user",
-            content=message_request.content
+        response = await call_upstream(
+            "openai",
+            "messages.create",
+            lambda timeout: client.beta.threads.messages.with_raw_response.create(
+                thread_id=message_request.thread_id,
+                role="user",
+                content=message_request.content,
+                timeout=timeout
+            )
         )
+        message = response.parse()
         
         return {
             "success": True,
@@ -156,6 +192,8 @@ async def add_message(request: Request, message_request: ThreadMessageRequest):
                 "content": message.content[0].text.value if message.content else ""
             }
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Message creation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -169,23 +207,44 @@ async def run_assistant(request: Request, run_request: RunRequest):
         client = get_openai_client()
         
         # Create the run
-        run = client.beta.threads.runs.create(
-            thread_id=run_request.thread_id,
-            assistant_id=run_request.assistant_id
+        response = await call_upstream(
+            "openai",
+            "runs.create",
+            lambda timeout: client.beta.threads.runs.with_raw_response.create(
+                thread_id=run_request.thread_id,
+                assistant_id=run_request.assistant_id,
+                timeout=timeout
+            )
         )
+        run = response.parse()
         
         # Poll for completion
         while run.status in ['queued', 'in_progress', 'cancelling']:
-            time.sleep(1)
-            run = client.beta.threads.runs.retrieve(
-                thread_id=run_request.thread_id,
-                run_id=run.id
+            await asyncio.sleep(1)
+            run_id = run.id
+            response = await call_upstream(
+                "openai",
+                "runs.retrieve",
+                lambda timeout: client.beta.threads.runs.with_raw_response.retrieve(
+                    thread_id=run_request.thread_id,
+                    run_id=run_id,
+                    timeout=timeout
+                ),
+                idempotent=True
             )
+            run = response.parse()
         
         if run.status == 'completed':
-            messages = client.beta.threads.messages.list(
-                thread_id=run_request.thread_id
+            response = await call_upstream(
+                "openai",
+                "messages.list",
+                lambda timeout: client.beta.threads.messages.with_raw_response.list(
+                    thread_id=run_request.thread_id,
+                    timeout=timeout
+                ),
+                idempotent=True
             )
+            messages = response.parse()
             
             # Get the latest assistant message
             assistant_messages = [
@@ -221,6 +280,8 @@ async def run_assistant(request: Request, run_request: RunRequest):
                     "status": run.status
                 }
             }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Run execution error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -235,12 +296,21 @@ async def realtime_api(request: Request, realtime_request: RealtimeRequest):
         client = get_openai_client()
         
         # Get text response from chat API
-        completion = client.chat.completions.create(
-            model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
-            messages=[{"role": "user", "content": realtime_request.message}],
-            temperature=0.7,
-            max_tokens=500
+        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
+        response = await call_upstream(
+            "openai",
+            "chat",
+            lambda timeout: client.chat.completions.with_raw_response.create(
+                model=deployment,
+                messages=[{"role": "user", "content": realtime_request.message}],
+                temperature=0.7,
+                max_tokens=500,
+                timeout=timeout
+            ),
+            idempotent=True,
+            deployment=deployment
         )
+        completion = response.parse()
         
         text_response = completion.choices[0].message.content
         
@@ -290,7 +360,12 @@ async def realtime_api(request: Request, realtime_request: RealtimeRequest):
                     
                     # Make TTS request
                     logger.info(f"Making TTS request to: {tts_url}")
-                    response = requests.post(tts_url, headers=headers, data=ssml)
+                    response = await call_upstream(
+                        "speech",
+                        "synthesize",
+                        lambda timeout: requests.post(tts_url, headers=headers, data=ssml, timeout=timeout),
+                        idempotent=True
+                    )
                     
                     if response.status_code == 200:
                         # Direct TTS returns audio immediately
@@ -318,6 +393,8 @@ async def realtime_api(request: Request, realtime_request: RealtimeRequest):
                 "message": f"{'Avatar video' if video_url else 'Audio'} generated using {'Azure Speech Services (' + (realtime_request.voiceName or 'en-US-AvaMultilingualNeural') + ')' if audio_data else 'Browser Text-to-Speech'}" if "audio" in realtime_request.outputModalities else None
             }
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Realtime API error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -334,4 +411,4 @@ async def health():
         "service": "Azure OpenAI",
         "configured": configured,
         "deployment": os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "Not configured")
-    }
\ No newline at end of file
+    }
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 import requests
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -33,13 +35,21 @@ async def analyze_image(request: Request, analysis_request: ImageAnalysisRequest
         }
         data = {'url': analysis_request.image_url}
         
-        response = requests.post(url, headers=headers, params=params, json=data)
+        response = await call_upstream(
+            "vision",
+            "analyze",
+            lambda timeout: requests.post(url, headers=headers, params=params, json=data, timeout=timeout),
+            idempotent=True,
+            hedge=True
+        )
         response.raise_for_status()
         
         return {
             "success": True,
             "data": response.json()
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Vision API error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -54,4 +64,4 @@ async def health():
     return {
         "service": "Azure Computer Vision",
         "configured": configured
-    }
\ No newline at end of file
+    }
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 import requests
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -33,13 +35,21 @@ async def analyze_content(request: Request, safety_request: ContentSafetyRequest
             'categories': safety_request.categories
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = await call_upstream(
+            "content_safety",
+            "analyze",
+            lambda timeout: requests.post(url, headers=headers, json=data, timeout=timeout),
+            idempotent=True,
+            hedge=True
+        )
         response.raise_for_status()
         
         return {
             "success": True,
             "data": response.json()
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Content Safety error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -54,4 +64,4 @@ async def health():
     return {
         "service": "Azure Content Safety",
         "configured": configured
-    }
\ No newline at end of file
+    }
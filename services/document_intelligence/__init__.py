@@ -4,6 +4,8 @@ import logging
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from health import health_monitor
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -20,16 +22,15 @@ except ImportError as e:
     missing_deps.append("azure-ai-translation-document")
 
 try:
-    from azure.storage.blob import BlobServiceClient
-    from azure.identity import DefaultAzureCredential
+    from azure.storage.blob.aio import BlobServiceClient
+    from azure.identity.aio import DefaultAzureCredential
+    import aiohttp
 except ImportError as e:
     DEPENDENCIES_AVAILABLE = False
-    missing_deps.append("azure-storage-blob, azure-identity")
+    missing_deps.append("azure-storage-blob, azure-identity, aiohttp")
 
-# Basic health check endpoint (always available)
-@router.get("/health")
-async def health_check():
-    """Health check endpoint"""
+def _health_status():
+    """Configuration-only health status, served while the full service (and its storage probe) is not loaded"""
     if DEPENDENCIES_AVAILABLE:
         try:
             # Try to check actual configuration
@@ -64,6 +65,14 @@ async def health_check():
             "message": f"Install missing packages: {', '.join(missing_deps)}"
         }
 
+# Basic health check endpoint (always available)
+@router.get("/health")
+async def health_check():
+    """Health check endpoint serving the cached storage probe, or the configuration status without it"""
+    if health_monitor.is_registered("document_intelligence"):
+        return await health_monitor.report("document_intelligence")
+    return _health_status()
+
 # Stub endpoints when dependencies are missing
 if not DEPENDENCIES_AVAILABLE:
     logger.warning(f"Document Intelligence running in limited mode - missing dependencies: {', '.join(missing_deps)}")
@@ -80,7 +89,7 @@ if not DEPENDENCIES_AVAILABLE:
     async def job_status_stub(job_id: str):
         return {"error": "Service not available", "missing_dependencies": missing_deps}
 
-    @router.get("/download/{blob_name}")
+    @router.get("/download/{blob_name:path}")
     async def download_stub(blob_name: str):
         return {"error": "Service not available", "missing_dependencies": missing_deps}
 
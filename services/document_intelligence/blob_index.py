@@ -0,0 +1,272 @@
+"""Local SQLite index of the blobs in the service containers"""
+import sqlite3
+import asyncio
+import logging
+import threading
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Blobs per listing page read by the sweep
+SWEEP_PAGE_SIZE = 1000
+
+# Listing pages reconciled per container on each periodic sweep after the first full pass
+SWEEP_PAGES_PER_RUN = 50
+
+class BlobIndex:
+    """Indexed copy of blob listings, kept current by the service's own writes and an incremental sweep
+
+    Queries are indexed lookups on a local file, so they run inline on the event
+    loop; a lock serializes access to the shared connection.
+    """
+
+    def __init__(self):
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+        # Rows written by the service carry the current sweep id so a running sweep keeps them
+        self._sweep_id = 0
+        # Where each container's reconciliation continues: (last reconciled name, listing token)
+        self._cursors: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Shared connection, created with the schema on first use"""
+        if self._connection is None:
+            connection = sqlite3.connect(get_config().document_index_db, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    container TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    original_filename TEXT,
+                    job_id TEXT,
+                    owner TEXT,
+                    sweep INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (container, name)
+                );
+                CREATE INDEX IF NOT EXISTS blobs_last_modified ON blobs (container, last_modified);
+                CREATE INDEX IF NOT EXISTS blobs_job_id ON blobs (job_id);
+                CREATE INDEX IF NOT EXISTS blobs_owner ON blobs (owner, container, name);
+            """)
+            self._connection = connection
+        return self._connection
+
+    @property
+    def ready(self) -> bool:
+        """Whether a full sweep has populated the index since startup"""
+        return self._ready.is_set()
+
+    async def wait_ready(self) -> None:
+        """Wait until the first sweep has completed"""
+        await self._ready.wait()
+
+    def close(self) -> None:
+        """Close the index database"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def upsert(self, container: str, blob: Dict[str, Any], job_id: Optional[str] = None, owner: Optional[str] = None) -> None:
+        """Record a blob the service wrote, keeping known job and owner details"""
+        metadata = blob.get("metadata") or {}
+        with self._lock, self.connection:
+            self.connection.execute("""
+                INSERT INTO blobs (container, name, size, etag, last_modified, content_type,
+                                   original_filename, job_id, owner, sweep)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (container, name) DO UPDATE SET
+                    size = excluded.size,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_type = COALESCE(excluded.content_type, content_type),
+                    original_filename = COALESCE(excluded.original_filename, original_filename),
+                    job_id = COALESCE(excluded.job_id, job_id),
+                    owner = COALESCE(excluded.owner, owner),
+                    sweep = excluded.sweep
+            """, (
+                container, blob["name"], blob.get("size") or 0, blob.get("etag"), blob.get("last_modified"),
+                blob.get("content_type"), metadata.get("original_filename"),
+                job_id or metadata.get("job_id"), owner or metadata.get("owner"), self._sweep_id
+            ))
+
+    def remove(self, container: str, names: Iterable[str]) -> None:
+        """Forget deleted blobs"""
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM blobs WHERE container = ? AND name = ?",
+                ((container, name) for name in names)
+            )
+
+    def get(self, container: str, name: str) -> Optional[Dict[str, Any]]:
+        """Indexed blob, shaped like BlobStorageManager's blob dictionaries"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT * FROM blobs WHERE container = ? AND name = ?", (container, name)
+            ).fetchone()
+        return self._to_blob(row) if row else None
+
+    def list_page(
+        self,
+        container: str,
+        prefix: Optional[str] = None,
+        page_size: int = 100,
+        after: Optional[str] = None,
+        owner: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """One page of blobs ordered by name, starting after the given name"""
+        clauses, params = ["container = ?"], [container]
+        if prefix:
+            # Range scan on the primary key instead of LIKE, which would need escaping
+            clauses.append("name >= ? AND name < ?")
+            params.extend([prefix, prefix + "\U0010ffff"])
+        if after:
+            clauses.append("name > ?")
+            params.append(after)
+        if owner:
+            clauses.append("owner = ?")
+            params.append(owner)
+        if job_id:
+            clauses.append("job_id = ?")
+            params.append(job_id)
+
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT * FROM blobs WHERE {' AND '.join(clauses)} ORDER BY name LIMIT ?",
+                (*params, page_size)
+            ).fetchall()
+        return [self._to_blob(row) for row in rows]
+
+    def expired(self, container: str, cutoff_iso: str, limit: int, after: str = "") -> List[str]:
+        """Names (after the given name, in name order) of blobs last modified before the cutoff"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT name FROM blobs WHERE container = ? AND name > ? AND last_modified < ? "
+                "ORDER BY name LIMIT ?",
+                (container, after, cutoff_iso, limit)
+            ).fetchall()
+        return [row["name"] for row in rows]
+
+    async def sweep(self, blob_storage, max_pages: Optional[int] = SWEEP_PAGES_PER_RUN) -> int:
+        """Reconcile the next slice of each container's listing with the index
+
+        Listing pages come back in name order, so each page covers a contiguous name range:
+        indexed rows inside that range that the page does not contain were deleted. Every
+        run resumes where the previous one stopped, so its cost is bounded by max_pages
+        rather than by the container size; None reconciles the whole container at once.
+        """
+        config = get_config()
+        with self._lock:
+            sweep_id = (self.connection.execute("SELECT COALESCE(MAX(sweep), 0) FROM blobs").fetchone()[0]) + 1
+        self._sweep_id = sweep_id
+
+        seen = 0
+        for container in (config.source_container_name, config.target_container_name):
+            after, token = self._cursors.get(container, ("", None))
+            pages = 0
+            while max_pages is None or pages < max_pages:
+                blobs, token = await blob_storage.list_blobs_page(
+                    container,
+                    page_size=SWEEP_PAGE_SIZE,
+                    continuation_token=token,
+                    include_metadata=True
+                )
+                pages += 1
+                if not blobs and token:
+                    # An empty page mid-listing covers no name range
+                    continue
+                seen += len(blobs)
+                # The last page also owns everything after it, up to the end of the container
+                until = blobs[-1]["name"] if token else None
+                self._apply_sweep_page(container, blobs, sweep_id, after, until)
+                if token is None:
+                    break
+                after = until
+
+            self._cursors[container] = (after, token) if token else ("", None)
+
+        if max_pages is None:
+            self._ready.set()
+        logger.info(f"Blob index sweep reconciled {seen} blobs")
+        return seen
+
+    async def run_sweep(self, blob_storage) -> None:
+        """Background loop reconciling the index (runs for the life of the app)"""
+        interval = get_config().index_sweep_minutes * 60
+        while True:
+            try:
+                # The first pass after startup is complete so listings can rely on the index
+                await self.sweep(blob_storage, None if not self.ready else SWEEP_PAGES_PER_RUN)
+            except Exception as e:
+                logger.error(f"Blob index sweep failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def _apply_sweep_page(
+        self,
+        container: str,
+        blobs: List[Dict[str, Any]],
+        sweep_id: int,
+        after: str,
+        until: Optional[str]
+    ) -> None:
+        """Upsert one listing page and drop indexed rows in its name range (after, until] it lacks"""
+        with self._lock, self.connection:
+            self.connection.executemany("""
+                INSERT INTO blobs (container, name, size, etag, last_modified, content_type,
+                                   original_filename, job_id, owner, sweep)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (container, name) DO UPDATE SET
+                    size = excluded.size,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_type = excluded.content_type,
+                    original_filename = COALESCE(excluded.original_filename, original_filename),
+                    job_id = COALESCE(excluded.job_id, job_id),
+                    owner = COALESCE(excluded.owner, owner),
+                    sweep = excluded.sweep
+            """, [
+                (
+                    container, blob["name"], blob["size"] or 0, blob["etag"], blob["last_modified"],
+                    blob["content_type"], blob["metadata"].get("original_filename"),
+                    blob["metadata"].get("job_id"), blob["metadata"].get("owner"), sweep_id
+                )
+                for blob in blobs
+            ])
+
+            # Rows written by the service during the sweep carry sweep_id and are kept
+            if until is None:
+                removed = self.connection.execute(
+                    "DELETE FROM blobs WHERE container = ? AND name > ? AND sweep < ?",
+                    (container, after, sweep_id)
+                ).rowcount
+            else:
+                removed = self.connection.execute(
+                    "DELETE FROM blobs WHERE container = ? AND name > ? AND name <= ? AND sweep < ?",
+                    (container, after, until, sweep_id)
+                ).rowcount
+        if removed:
+            logger.info(f"Blob index sweep removed {removed} stale entries from {container}")
+
+    @staticmethod
+    def _to_blob(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "name": row["name"],
+            "size": row["size"],
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "content_type": row["content_type"],
+            "metadata": {
+                key: row[key] for key in ("original_filename", "job_id", "owner") if row[key]
+            }
+        }
+
+# Global blob index instance
+blob_index = BlobIndex()
@@ -1,27 +1,67 @@
 """Secure blob storage operations for Document Intelligence"""
-import os
+import time
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime, timezone, timedelta
-from azure.storage.blob import BlobServiceClient, BlobClient, ContainerClient
-from azure.core.exceptions import AzureError, ResourceNotFoundError, ResourceExistsError
+from azure.storage.blob import ContentSettings
+from azure.storage.blob.aio import BlobServiceClient
+from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError
 from fastapi import UploadFile
 import asyncio
+import hashlib
 from .config import get_config, validate_file_format, validate_file_size
 from .security import security_manager
-from .models import DocumentUploadResponse, DownloadResponse, ErrorResponse
+from .content_index import content_index, HASH_CHUNK_SIZE
+from .download_cache import download_cache
+from .blob_index import blob_index
+from .models import (
+    DocumentUploadResponse, DownloadResponse, RetentionCleanupResult, BlobCopyResult
+)
 
 logger = logging.getLogger(__name__)
 
+# Blobs returned per page by list_blobs_page unless the caller asks otherwise
+DEFAULT_LIST_PAGE_SIZE = 100
+
+# Server-side copies in flight at the same time for bulk and prefix copies
+COPY_MAX_CONCURRENT = 64
+
+# Copy status polling backoff bounds in seconds
+COPY_POLL_INITIAL_SECONDS = 0.1
+COPY_POLL_MAX_SECONDS = 5.0
+
+# Pending copies are aborted after this long
+COPY_TIMEOUT_SECONDS = 3600
+
+# The blob batch API accepts at most 256 sub-requests per batch
+RETENTION_BATCH_SIZE = 256
+
+# Batch delete requests in flight at the same time during retention cleanup
+RETENTION_MAX_CONCURRENT_BATCHES = 8
+
+
 class BlobStorageManager:
     """Manages secure blob storage operations"""
 
     def __init__(self):
         self.config = get_config()
         self.security = security_manager
+        self._containers_ready = False
+        self._containers_lock = asyncio.Lock()
+        self.last_retention: Optional[RetentionCleanupResult] = None
 
     async def ensure_containers_exist(self) -> bool:
-        """Ensure source and target containers exist with proper security settings"""
+        """Ensure source and target containers exist with proper security settings (once per process)"""
+        if self._containers_ready:
+            return True
+
+        async with self._containers_lock:
+            if not self._containers_ready:
+                self._containers_ready = await self._bootstrap_containers()
+        return self._containers_ready
+
+    async def _bootstrap_containers(self) -> bool:
+        """Create the source, target and glossary containers if they are missing"""
         try:
             blob_service_client = self.security.get_blob_service_client()
 
@@ -39,6 +79,13 @@ class BlobStorageManager:
                 "Target container for translated documents"
             )
 
+            # Create glossary container
+            await self._create_secure_container(
+                blob_service_client,
+                self.config.glossary_container_name,
+                "Glossaries registered for custom terminology"
+            )
+
             logger.info("Storage containers verified/created successfully")
             return True
 
@@ -46,6 +93,18 @@ class BlobStorageManager:
             logger.error(f"Failed to ensure containers exist: {str(e)}")
             return False
 
+    async def check_storage_access(self) -> bool:
+        """Probe storage with a single container properties call"""
+        try:
+            container_client = self.security.get_blob_service_client().get_container_client(
+                self.config.source_container_name
+            )
+            await container_client.get_container_properties()
+            return True
+        except Exception as e:
+            logger.warning(f"Storage health check failed: {str(e)}")
+            return False
+
     async def _create_secure_container(
         self,
         blob_service_client: BlobServiceClient,
@@ -58,7 +117,7 @@ class BlobStorageManager:
 
             # Check if container exists
             try:
-                await asyncio.to_thread(container_client.get_container_properties)
+                await container_client.get_container_properties()
                 logger.info(f"Container '{container_name}' already exists")
                 return
             except ResourceNotFoundError:
@@ -71,8 +130,7 @@ class BlobStorageManager:
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
 
-            await asyncio.to_thread(
-                container_client.create_container,
+            await container_client.create_container(
                 metadata=metadata,
                 public_access=None  # Private container
             )
@@ -95,7 +153,8 @@ class BlobStorageManager:
     async def upload_document(
         self,
         file: UploadFile,
-        container_name: Optional[str] = None
+        container_name: Optional[str] = None,
+        owner: Optional[str] = None
     ) -> DocumentUploadResponse:
         """Upload document to secure blob storage"""
         try:
@@ -103,14 +162,36 @@ class BlobStorageManager:
             container_name = container_name or self.config.source_container_name
 
             # Validate file
-            file_content = await file.read()
-            await file.seek(0)  # Reset file pointer
-
             if not validate_file_format(file.filename):
                 raise ValueError(f"Unsupported file format: {file.filename}")
 
-            if not validate_file_size(len(file_content)):
-                raise ValueError(f"File too large. Maximum size: {self.config.max_file_size_mb}MB")
+            # Hash the spooled upload chunk by chunk instead of reading it into memory
+            content_hash, file_size = await self._hash_upload(file)
+
+            # Identical content the same owner already uploaded is reused, not stored again
+            if container_name == self.config.source_container_name:
+                existing = await self._find_duplicate(content_hash, owner)
+                if existing is not None:
+                    upload_url = await self.security.get_download_sas_url(container_name, existing)
+
+                    self.security.audit_log("document_upload_deduplicated", {
+                        "blob_name": existing,
+                        "original_filename": file.filename,
+                        "container": container_name,
+                        "file_size": file_size
+                    })
+
+                    return DocumentUploadResponse(
+                        success=True,
+                        blob_name=existing,
+                        upload_url=upload_url,
+                        container_name=container_name,
+                        file_size=file_size,
+                        content_type=file.content_type or "application/octet-stream",
+                        message=f"Document '{file.filename}' matches existing document '{existing}'",
+                        content_hash=content_hash,
+                        deduplicated=True
+                    )
 
             # Generate secure blob name
             blob_name = self.security.sanitize_blob_name(file.filename)
@@ -127,27 +208,42 @@ class BlobStorageManager:
                 "original_filename": file.filename,
                 "content_type": file.content_type,
                 "upload_timestamp": datetime.now(timezone.utc).isoformat(),
-                "file_size": str(len(file_content)),
+                "file_size": str(file_size),
+                "content_sha256": content_hash,
                 "uploaded_by": "document_intelligence_service"
             }
+            if owner:
+                metadata["owner"] = owner
 
-            await asyncio.to_thread(
-                blob_client.upload_blob,
-                file_content,
+            upload_result = await blob_client.upload_blob(
+                self._read_chunks(file),
+                length=file_size,
                 metadata=metadata,
-                content_type=file.content_type,
+                content_settings=ContentSettings(content_type=file.content_type),
                 overwrite=True
             )
 
+            if container_name == self.config.source_container_name:
+                content_index.record_source(content_hash, blob_name, file_size, owner)
+
+            blob_index.upsert(container_name, {
+                "name": blob_name,
+                "size": file_size,
+                "etag": upload_result.get("etag"),
+                "last_modified": upload_result["last_modified"].isoformat() if upload_result.get("last_modified") else None,
+                "content_type": file.content_type,
+                "metadata": metadata
+            })
+
             # Generate secure upload URL for confirmation
-            upload_url = self.security.get_download_sas_url(container_name, blob_name)
+            upload_url = await self.security.get_download_sas_url(container_name, blob_name)
 
             # Audit log the upload
             self.security.audit_log("document_uploaded", {
                 "blob_name": blob_name,
                 "original_filename": file.filename,
                 "container": container_name,
-                "file_size": len(file_content)
+                "file_size": file_size
             })
 
             logger.info(f"Document uploaded successfully: {blob_name}")
@@ -157,15 +253,49 @@ class BlobStorageManager:
                 blob_name=blob_name,
                 upload_url=upload_url,
                 container_name=container_name,
-                file_size=len(file_content),
+                file_size=file_size,
                 content_type=file.content_type or "application/octet-stream",
-                message=f"Document '{file.filename}' uploaded successfully as '{blob_name}'"
+                message=f"Document '{file.filename}' uploaded successfully as '{blob_name}'",
+                content_hash=content_hash
             )
 
         except Exception as e:
             logger.error(f"Document upload failed: {str(e)}")
             raise
 
+    async def _hash_upload(self, file: UploadFile) -> Tuple[str, int]:
+        """SHA-256 and size of an upload, enforcing the size limit as it is read"""
+        digest = hashlib.sha256()
+        size = 0
+        await file.seek(0)
+        while chunk := await file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+            if not validate_file_size(size):
+                raise ValueError(f"File too large. Maximum size: {self.config.max_file_size_mb}MB")
+        await file.seek(0)  # Reset file pointer
+        return digest.hexdigest(), size
+
+    @staticmethod
+    async def _read_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+        """Stream an upload to storage without holding it in memory"""
+        while chunk := await file.read(HASH_CHUNK_SIZE):
+            yield chunk
+
+    async def _find_duplicate(self, content_hash: str, owner: Optional[str]) -> Optional[str]:
+        """Owner's existing source blob with this content, if the index knows one that still exists
+
+        Uploads are only deduplicated per owner, so nobody is handed a blob that is
+        listed and access-checked as someone else's.
+        """
+        existing = content_index.find_source(content_hash, owner)
+        if existing is None:
+            return None
+        if await self.find_blob(existing, self.config.source_container_name) is None:
+            content_index.forget_source(content_hash, owner)
+            return None
+        return existing
+
     async def get_download_url(
         self,
         blob_name: str,
@@ -183,14 +313,10 @@ class BlobStorageManager:
             )
 
             # Get blob properties
-            properties = await asyncio.to_thread(blob_client.get_blob_properties)
+            properties = await blob_client.get_blob_properties()
 
-            # Generate secure download URL
-            download_url = self.security.get_download_sas_url(container_name, blob_name)
-
-            # Calculate expiry time
-            expires_at = datetime.now(timezone.utc) + \
-                        timedelta(hours=self.config.sas_token_expiry_hours)
+            # Generate secure download URL (signed locally, possibly reused from cache)
+            download_url, expires_at = await self.security.get_download_sas_url_with_expiry(container_name, blob_name)
 
             # Audit log the download request
             self.security.audit_log("download_url_generated", {
@@ -215,40 +341,214 @@ class BlobStorageManager:
             logger.error(f"Failed to generate download URL: {str(e)}")
             raise
 
-    async def list_blobs(
+    async def download_blob_bytes(
         self,
+        blob_name: str,
+        container_name: Optional[str] = None
+    ) -> bytes:
+        """Download a (small) blob's content into memory"""
+        try:
+            container_name = container_name or self.config.source_container_name
+
+            blob_service_client = self.security.get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=container_name,
+                blob=blob_name
+            )
+
+            downloader = await blob_client.download_blob()
+            return await downloader.readall()
+
+        except ResourceNotFoundError:
+            logger.warning(f"Blob not found: {blob_name} in container {container_name}")
+            raise ValueError(f"Document '{blob_name}' not found")
+        except Exception as e:
+            logger.error(f"Failed to download blob: {str(e)}")
+            raise
+
+    async def open_blob_download(
+        self,
+        blob_name: str,
         container_name: Optional[str] = None,
-        prefix: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """List blobs in a container"""
+        offset: int = 0,
+        length: Optional[int] = None
+    ):
+        """Start downloading a blob; the returned downloader already holds the first chunk"""
+        container_name = container_name or self.config.target_container_name
+
+        blob_service_client = self.security.get_blob_service_client()
+        blob_client = blob_service_client.get_blob_client(
+            container=container_name,
+            blob=blob_name
+        )
+        return await blob_client.download_blob(offset=offset, length=length)
+
+    async def stream_blob(
+        self,
+        blob_name: str,
+        container_name: Optional[str] = None,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream (a byte range of) a blob in chunks without buffering it"""
+        if length == 0:
+            return
+
+        downloader = await self.open_blob_download(blob_name, container_name, offset, length)
+        async for chunk in downloader.chunks():
+            yield chunk
+
+    async def upload_blob_bytes(
+        self,
+        blob_name: str,
+        data: bytes,
+        container_name: Optional[str] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Write content produced by the service (e.g. a translation) to a blob"""
+        try:
+            container_name = container_name or self.config.target_container_name
+
+            blob_service_client = self.security.get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=container_name,
+                blob=blob_name
+            )
+
+            await blob_client.upload_blob(
+                data,
+                metadata=metadata,
+                content_settings=ContentSettings(content_type=content_type) if content_type else None,
+                overwrite=True
+            )
+
+            logger.info(f"Blob written: {blob_name} in container {container_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to write blob: {str(e)}")
+            raise
+
+    @staticmethod
+    def _blob_info(blob: Any, include_metadata: bool) -> Dict[str, Any]:
+        """Convert listed blob or blob properties into the service's blob dictionary"""
+        blob_info = {
+            "name": blob.name,
+            "size": blob.size,
+            "etag": blob.etag,
+            "last_modified": blob.last_modified.isoformat() if blob.last_modified else None,
+            "content_type": blob.content_settings.content_type if blob.content_settings else None
+        }
+        if include_metadata:
+            blob_info["metadata"] = blob.metadata or {}
+        return blob_info
+
+    async def list_blobs_page(
+        self,
+        container_name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+        include_metadata: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page of blobs; returns the page and the token for the next one (None when done)"""
         try:
             container_name = container_name or self.config.source_container_name
 
             blob_service_client = self.security.get_blob_service_client()
             container_client = blob_service_client.get_container_client(container_name)
 
+            pages = container_client.list_blobs(
+                name_starts_with=prefix,
+                include=["metadata"] if include_metadata else None,
+                results_per_page=page_size
+            ).by_page(continuation_token=continuation_token)
+
             blobs = []
-            # Use sync iteration in a thread
-            blob_list = await asyncio.to_thread(
-                lambda: list(container_client.list_blobs(name_starts_with=prefix))
-            )
+            async for page in pages:
+                async for blob in page:
+                    blobs.append(self._blob_info(blob, include_metadata))
+                break
+
+            return blobs, pages.continuation_token or None
+
+        except Exception as e:
+            logger.error(f"Failed to list blobs: {str(e)}")
+            raise
+
+    async def iter_blobs(
+        self,
+        container_name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        include_metadata: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream blobs in a container without holding the whole listing in memory"""
+        container_name = container_name or self.config.source_container_name
+
+        blob_service_client = self.security.get_blob_service_client()
+        container_client = blob_service_client.get_container_client(container_name)
 
-            for blob in blob_list:
-                blob_info = {
-                    "name": blob.name,
-                    "size": blob.size,
-                    "last_modified": blob.last_modified.isoformat() if blob.last_modified else None,
-                    "content_type": blob.content_settings.content_type if blob.content_settings else None,
-                    "metadata": blob.metadata or {}
-                }
-                blobs.append(blob_info)
+        async for blob in container_client.list_blobs(
+            name_starts_with=prefix,
+            include=["metadata"] if include_metadata else None
+        ):
+            yield self._blob_info(blob, include_metadata)
 
-            return blobs
+    async def list_blobs(
+        self,
+        container_name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        include_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """List every blob in a container (prefer list_blobs_page or iter_blobs for large containers)"""
+        try:
+            return [
+                blob async for blob in self.iter_blobs(container_name, prefix, include_metadata)
+            ]
 
         except Exception as e:
             logger.error(f"Failed to list blobs: {str(e)}")
             raise
 
+    async def find_blob(
+        self,
+        blob_name: str,
+        container_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a blob in the local index, checking storage only when the index has no entry"""
+        container_name = container_name or self.config.source_container_name
+
+        blob = blob_index.get(container_name, blob_name)
+        if blob is None:
+            blob = await self.get_blob_info(blob_name, container_name)
+            if blob is not None:
+                blob_index.upsert(container_name, blob)
+        return blob
+
+    async def get_blob_info(
+        self,
+        blob_name: str,
+        container_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a single blob with one properties call; returns None if it does not exist"""
+        try:
+            container_name = container_name or self.config.source_container_name
+
+            blob_service_client = self.security.get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=container_name,
+                blob=blob_name
+            )
+
+            properties = await blob_client.get_blob_properties()
+            return self._blob_info(properties, include_metadata=True)
+
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get blob properties: {str(e)}")
+            raise
+
     async def delete_blob(
         self,
         blob_name: str,
@@ -264,7 +564,9 @@ class BlobStorageManager:
                 blob=blob_name
             )
 
-            await asyncio.to_thread(blob_client.delete_blob)
+            await blob_client.delete_blob()
+            download_cache.invalidate(container_name, blob_name)
+            blob_index.remove(container_name, [blob_name])
 
             # Audit log the deletion
             self.security.audit_log("blob_deleted", {
@@ -289,55 +591,142 @@ class BlobStorageManager:
         source_container: Optional[str] = None,
         target_container: Optional[str] = None
     ) -> bool:
-        """Copy blob between containers"""
+        """Copy blob between containers, waiting until the copy reaches a final state"""
+        result = await self._copy_one(
+            source_blob_name,
+            target_blob_name,
+            source_container or self.config.source_container_name,
+            target_container or self.config.target_container_name
+        )
+        if result.status != "success":
+            logger.error(f"Blob copy failed with status: {result.status}")
+        return result.status == "success"
+
+    async def copy_blobs(
+        self,
+        copies: List[Tuple[str, str]],
+        source_container: Optional[str] = None,
+        target_container: Optional[str] = None
+    ) -> List[BlobCopyResult]:
+        """Run many server-side copies concurrently; copies are (source_blob, target_blob) pairs"""
+        source_container = source_container or self.config.source_container_name
+        target_container = target_container or self.config.target_container_name
+        copy_slots = asyncio.Semaphore(COPY_MAX_CONCURRENT)
+
+        async def copy(source_blob: str, target_blob: str) -> BlobCopyResult:
+            async with copy_slots:
+                return await self._copy_one(source_blob, target_blob, source_container, target_container)
+
+        return list(await asyncio.gather(*(copy(source, target) for source, target in copies)))
+
+    async def copy_prefix(
+        self,
+        prefix: str,
+        source_container: Optional[str] = None,
+        target_container: Optional[str] = None,
+        target_prefix: str = ""
+    ) -> List[BlobCopyResult]:
+        """Copy every blob under a prefix, starting copies while the listing is still streaming
+
+        Raises ValueError when the copies would land under the prefix being listed, since
+        the streamed listing would then pick them up and copy them again.
+        """
+        source_container = source_container or self.config.source_container_name
+        target_container = target_container or self.config.target_container_name
+        if source_container == target_container and f"{target_prefix}{prefix}".startswith(prefix):
+            raise ValueError(
+                f"Copying '{prefix}' to '{target_prefix}{prefix}' in the same container would copy the copies"
+            )
+        copy_slots = asyncio.Semaphore(COPY_MAX_CONCURRENT)
+        pending: List[asyncio.Task] = []
+
+        async def copy(source_blob: str) -> BlobCopyResult:
+            try:
+                return await self._copy_one(
+                    source_blob,
+                    f"{target_prefix}{source_blob}",
+                    source_container,
+                    target_container
+                )
+            finally:
+                copy_slots.release()
+
         try:
-            source_container = source_container or self.config.source_container_name
-            target_container = target_container or self.config.target_container_name
+            async for blob in self.iter_blobs(source_container, prefix):
+                await copy_slots.acquire()
+                pending.append(asyncio.create_task(copy(blob["name"])))
+            return list(await asyncio.gather(*pending))
 
-            blob_service_client = self.security.get_blob_service_client()
+        except Exception as e:
+            logger.error(f"Failed to copy prefix '{prefix}': {str(e)}")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
 
-            # Source blob URL
-            source_blob_url = f"https://{self.config.storage_account_name}.blob.core.windows.net/{source_container}/{source_blob_name}"
+    async def _copy_one(
+        self,
+        source_blob_name: str,
+        target_blob_name: str,
+        source_container: str,
+        target_container: str
+    ) -> BlobCopyResult:
+        """Start one server-side copy and poll it with backoff until it finishes"""
+        result = BlobCopyResult(source_blob=source_blob_name, target_blob=target_blob_name, status="failed")
+        try:
+            # The copy source is read by the storage service itself, so it needs its own SAS
+            source_blob_url = await self.security.get_download_sas_url(source_container, source_blob_name)
 
-            # Target blob client
+            blob_service_client = self.security.get_blob_service_client()
             target_blob_client = blob_service_client.get_blob_client(
                 container=target_container,
                 blob=target_blob_name
             )
 
-            # Start copy operation
-            copy_props = await asyncio.to_thread(
-                target_blob_client.start_copy_from_url,
-                source_blob_url
-            )
-
-            # Wait for copy to complete (for small files this should be immediate)
-            # For large files, you might want to implement polling
-            await asyncio.sleep(1)
-
-            # Check copy status
-            props = await asyncio.to_thread(target_blob_client.get_blob_properties)
-
-            if props.copy.status == "success":
+            copy_props = await target_blob_client.start_copy_from_url(source_blob_url)
+            status = copy_props.get("copy_status")
+
+            # Copies within an account usually complete synchronously; only pending ones are polled
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + COPY_TIMEOUT_SECONDS
+            delay = COPY_POLL_INITIAL_SECONDS
+            while status == "pending":
+                if loop.time() >= deadline:
+                    await target_blob_client.abort_copy(copy_props["copy_id"])
+                    result.status = "timeout"
+                    result.error_message = f"Copy did not finish within {COPY_TIMEOUT_SECONDS} seconds"
+                    return result
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, COPY_POLL_MAX_SECONDS)
+
+                props = await target_blob_client.get_blob_properties()
+                status = props.copy.status
+                if status in ("failed", "aborted"):
+                    result.error_message = props.copy.status_description
+
+            result.status = status or "failed"
+            if result.status == "success":
+                copied = await self.get_blob_info(target_blob_name, target_container)
+                if copied is not None:
+                    blob_index.upsert(target_container, copied)
                 logger.info(f"Blob copied successfully: {source_blob_name} -> {target_blob_name}")
-                return True
-            else:
-                logger.error(f"Blob copy failed with status: {props.copy.status}")
-                return False
 
         except Exception as e:
-            logger.error(f"Failed to copy blob: {str(e)}")
-            raise
+            logger.warning(f"Failed to copy blob {source_blob_name}: {str(e)}")
+            result.error_message = str(e)
+
+        return result
 
     async def get_container_sas_urls(self) -> Tuple[str, str]:
         """Get SAS URLs for source and target containers"""
         try:
-            source_url = self.security.get_container_sas_url(
+            source_url = await self.security.get_container_sas_url(
                 self.config.source_container_name,
                 "rl"  # read, list
             )
 
-            target_url = self.security.get_container_sas_url(
+            target_url = await self.security.get_container_sas_url(
                 self.config.target_container_name,
                 "racwl"  # read, add, create, write, list
             )
@@ -348,35 +737,100 @@ class BlobStorageManager:
             logger.error(f"Failed to generate container SAS URLs: {str(e)}")
             raise
 
-    async def cleanup_old_blobs(self, days_old: int = 7) -> int:
-        """Clean up blobs older than specified days"""
-        try:
-            cleanup_count = 0
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
+    async def cleanup_old_blobs(self, days_old: int = 7) -> RetentionCleanupResult:
+        """Delete blobs older than the given number of days using concurrent batch deletes"""
+        started = time.monotonic()
+        cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=days_old)).isoformat()
+        containers = [self.config.source_container_name, self.config.target_container_name]
+        result = RetentionCleanupResult(days_old=days_old, containers=containers)
+
+        # Bounds the number of batch requests in flight; selection waits when it is exhausted
+        batch_slots = asyncio.Semaphore(RETENTION_MAX_CONCURRENT_BATCHES)
+        pending: List[asyncio.Task] = []
 
-            for container_name in [self.config.source_container_name, self.config.target_container_name]:
-                blob_service_client = self.security.get_blob_service_client()
+        async def delete_batch(container_client, blob_names: List[str]) -> None:
+            try:
+                deleted, failed = await self._delete_blob_batch(container_client, blob_names)
+                blob_index.remove(container_client.container_name, deleted)
+                for blob_name in deleted:
+                    download_cache.invalidate(container_client.container_name, blob_name)
+                result.blobs_deleted += len(deleted)
+                result.blobs_failed += failed
+            except Exception as e:
+                logger.warning(f"Batch delete of {len(blob_names)} blobs failed: {str(e)}")
+                result.blobs_failed += len(blob_names)
+            finally:
+                batch_slots.release()
+
+        try:
+            blob_service_client = self.security.get_blob_service_client()
+            for container_name in containers:
                 container_client = blob_service_client.get_container_client(container_name)
 
-                # Use sync iteration in a thread
-                blob_list = await asyncio.to_thread(
-                    lambda: list(container_client.list_blobs())
-                )
+                # Expired blobs are selected from the local index in name order, one batch at a time
+                after = ""
+                while True:
+                    batch = blob_index.expired(container_name, cutoff_iso, RETENTION_BATCH_SIZE, after)
+                    if not batch:
+                        break
+                    after = batch[-1]
+                    result.blobs_scanned += len(batch)
 
-                for blob in blob_list:
-                    if blob.last_modified and blob.last_modified < cutoff_date:
-                        try:
-                            await self.delete_blob(blob.name, container_name)
-                            cleanup_count += 1
-                        except Exception as e:
-                            logger.warning(f"Failed to delete old blob {blob.name}: {str(e)}")
+                    await batch_slots.acquire()
+                    pending.append(asyncio.create_task(delete_batch(container_client, batch)))
+                    result.batches += 1
 
-            logger.info(f"Cleaned up {cleanup_count} old blobs")
-            return cleanup_count
+            await asyncio.gather(*pending)
 
         except Exception as e:
             logger.error(f"Failed to cleanup old blobs: {str(e)}")
-            return 0
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        result.duration_seconds = round(time.monotonic() - started, 3)
+        if result.duration_seconds > 0:
+            result.blobs_per_second = round(result.blobs_deleted / result.duration_seconds, 1)
+        self.last_retention = result
+
+        logger.info(
+            f"Retention cleanup deleted {result.blobs_deleted} of {result.blobs_scanned} expired blobs "
+            f"({result.blobs_failed} failed) in {result.batches} batches, "
+            f"{result.duration_seconds}s, {result.blobs_per_second} blobs/s"
+        )
+
+        # Audit log one summary per run instead of a line per blob
+        self.security.audit_log("retention_cleanup", result.model_dump())
+
+        return result
+
+    async def _delete_blob_batch(self, container_client, blob_names: List[str]) -> Tuple[List[str], int]:
+        """Delete up to 256 blobs in one batch request, returning (deleted names, failed count)"""
+        deleted: List[str] = []
+        failed = 0
+        responses = await container_client.delete_blobs(*blob_names, raise_on_any_failure=False)
+        index = 0
+        async for response in responses:
+            # Sub-responses come back in request order; 404 means the blob is already gone
+            if response.status_code in (202, 404):
+                deleted.append(blob_names[index])
+            else:
+                failed += 1
+            index += 1
+        return deleted, failed
+
+    async def run_retention(self) -> None:
+        """Background loop applying the blob retention policy (runs for the life of the app)"""
+        interval = self.config.retention_interval_hours * 3600
+
+        # Expired blobs are selected from the index, so wait for its first sweep
+        await blob_index.wait_ready()
+        while True:
+            try:
+                await self.cleanup_old_blobs(self.config.blob_retention_days)
+            except Exception as e:
+                logger.error(f"Retention cleanup run failed: {str(e)}")
+            await asyncio.sleep(interval)
 
 # Global blob storage manager instance
 blob_storage = BlobStorageManager()
\ No newline at end of file
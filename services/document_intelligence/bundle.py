@@ -0,0 +1,105 @@
+"""Streaming ZIP bundles of translation job outputs"""
+import io
+import time
+import asyncio
+import logging
+import zipfile
+from typing import List, Tuple, AsyncIterator, Optional
+
+from .blob_storage import blob_storage
+
+logger = logging.getLogger(__name__)
+
+# Blob chunks buffered between the storage reader and the archive writer
+BUNDLE_PREFETCH_CHUNKS = 4
+
+class _ZipStream(io.RawIOBase):
+    """Write-only, unseekable sink collecting archive bytes until they are drained to the client"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def _read_blobs(entries: List[Tuple[str, str]], container_name: str, queue: asyncio.Queue) -> None:
+    """Feed blob chunks to the archive writer, opening the next blob while the current one streams"""
+    next_open: Optional[asyncio.Task] = None
+    try:
+        if entries:
+            next_open = asyncio.create_task(blob_storage.open_blob_download(entries[0][0], container_name))
+
+        for index, (_, entry_name) in enumerate(entries):
+            downloader = await next_open
+            next_open = None
+            if index + 1 < len(entries):
+                next_open = asyncio.create_task(
+                    blob_storage.open_blob_download(entries[index + 1][0], container_name)
+                )
+
+            await queue.put(("start", entry_name))
+            async for chunk in downloader.chunks():
+                await queue.put(("data", chunk))
+            await queue.put(("end", None))
+
+        await queue.put(("done", None))
+
+    except Exception as e:
+        await queue.put(("error", e))
+    finally:
+        if next_open is not None:
+            next_open.cancel()
+
+async def stream_bundle(entries: List[Tuple[str, str]], container_name: str) -> AsyncIterator[bytes]:
+    """Stream a ZIP archive of (blob_name, archive_name) entries with constant memory use"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=BUNDLE_PREFETCH_CHUNKS)
+    reader = asyncio.create_task(_read_blobs(entries, container_name, queue))
+    sink = _ZipStream()
+    # Translated documents are mostly compressed formats already, so entries are stored as-is
+    archive = zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+    entry = None
+
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind == "start":
+                info = zipfile.ZipInfo(value, date_time=time.localtime()[:6])
+                entry = archive.open(info, "w", force_zip64=True)
+            elif kind == "data":
+                entry.write(value)
+            elif kind == "end":
+                entry.close()
+                entry = None
+            elif kind == "error":
+                raise value
+            else:
+                break
+
+            data = sink.drain()
+            if data:
+                yield data
+
+        # Writes the central directory
+        archive.close()
+        yield sink.drain()
+
+    except Exception as e:
+        logger.error(f"Bundle stream aborted: {str(e)}")
+        raise
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+        # An aborted archive is finished into the sink but never sent, so the client's copy stays unterminated
+        if entry is not None:
+            entry.close()
+        archive.close()
@@ -20,12 +20,42 @@ class DocumentIntelligenceConfig:
     # Container Configuration
     source_container_name: str = "document-source"
     target_container_name: str = "document-target"
+    glossary_container_name: str = "document-glossaries"
 
     # Security Configuration
     use_managed_identity: bool = True
     sas_token_expiry_hours: int = 1
+    user_delegation_key_lifetime_hours: int = 24
     max_file_size_mb: int = 100
 
+    # Small text-like documents skip the batch API and use the Text Translator
+    fast_path_max_kb: int = 32
+    fast_path_formats: tuple = ('.txt', '.html')
+
+    # Translation job scheduling
+    translation_workers: int = 4
+    translation_queue_max_size: int = 1000
+
+    # Opt-in splitting of large PDFs into page ranges translated in parallel
+    pdf_split_pages_per_part: int = 20
+    pdf_split_min_pages: int = 40
+    pdf_split_processes: int = 2
+
+    # Retention policy (0 days disables the periodic cleanup)
+    blob_retention_days: int = 0
+    retention_interval_hours: int = 6
+
+    # Local index of content hashes and blobs
+    document_index_db: str = "document_index.db"
+    index_sweep_minutes: int = 60
+
+    # Disk cache for proxied downloads (0 MB disables it)
+    download_cache_dir: str = ".download_cache"
+    download_cache_max_mb: int = 512
+
+    # Supported languages list revalidation interval (also the client max-age)
+    languages_refresh_seconds: int = 3600
+
     # Supported file formats
     supported_formats: tuple = (
         '.pdf', '.docx', '.pptx', '.xlsx',
@@ -62,11 +92,36 @@ def get_config() -> DocumentIntelligenceConfig:
     # Container names
     source_container = os.getenv("DOCUMENT_SOURCE_CONTAINER", "document-source")
     target_container = os.getenv("DOCUMENT_TARGET_CONTAINER", "document-target")
+    glossary_container = os.getenv("DOCUMENT_GLOSSARY_CONTAINER", "document-glossaries")
 
     # Security settings
     sas_expiry_hours = int(os.getenv("SAS_TOKEN_EXPIRY_HOURS", "1"))
+    delegation_key_lifetime_hours = int(os.getenv("USER_DELEGATION_KEY_LIFETIME_HOURS", "24"))
     max_file_size = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
 
+    # Fast path settings (0 disables the fast path)
+    fast_path_max_kb = int(os.getenv("FAST_PATH_MAX_KB", "32"))
+
+    # Scheduling settings
+    translation_workers = int(os.getenv("TRANSLATION_WORKERS", "4"))
+    translation_queue_max_size = int(os.getenv("TRANSLATION_QUEUE_MAX_SIZE", "1000"))
+
+    # PDF split settings
+    pdf_split_pages_per_part = int(os.getenv("PDF_SPLIT_PAGES_PER_PART", "20"))
+    pdf_split_min_pages = int(os.getenv("PDF_SPLIT_MIN_PAGES", "40"))
+    pdf_split_processes = int(os.getenv("PDF_SPLIT_PROCESSES", "2"))
+
+    # Retention settings
+    blob_retention_days = int(os.getenv("BLOB_RETENTION_DAYS", "0"))
+    retention_interval_hours = int(os.getenv("RETENTION_INTERVAL_HOURS", "6"))
+
+    # Caching settings
+    document_index_db = os.getenv("DOCUMENT_INDEX_DB", "document_index.db")
+    index_sweep_minutes = int(os.getenv("INDEX_SWEEP_MINUTES", "60"))
+    download_cache_dir = os.getenv("DOWNLOAD_CACHE_DIR", ".download_cache")
+    download_cache_max_mb = int(os.getenv("DOWNLOAD_CACHE_MAX_MB", "512"))
+    languages_refresh_seconds = int(os.getenv("LANGUAGES_REFRESH_SECONDS", "3600"))
+
     return DocumentIntelligenceConfig(
         translator_endpoint=translator_endpoint,
         translator_text_endpoint=translator_text_endpoint,
@@ -76,9 +131,25 @@ def get_config() -> DocumentIntelligenceConfig:
         storage_account_key=storage_account_key,
         source_container_name=source_container,
         target_container_name=target_container,
+        glossary_container_name=glossary_container,
         use_managed_identity=use_managed_identity,
         sas_token_expiry_hours=sas_expiry_hours,
-        max_file_size_mb=max_file_size
+        # Delegation keys must outlive the SAS tokens they sign; Azure caps them at 7 days
+        user_delegation_key_lifetime_hours=min(max(delegation_key_lifetime_hours, sas_expiry_hours + 1), 7 * 24),
+        max_file_size_mb=max_file_size,
+        fast_path_max_kb=fast_path_max_kb,
+        translation_workers=max(translation_workers, 1),
+        translation_queue_max_size=translation_queue_max_size,
+        pdf_split_pages_per_part=max(pdf_split_pages_per_part, 1),
+        pdf_split_min_pages=pdf_split_min_pages,
+        pdf_split_processes=max(pdf_split_processes, 1),
+        blob_retention_days=max(blob_retention_days, 0),
+        retention_interval_hours=max(retention_interval_hours, 1),
+        languages_refresh_seconds=max(languages_refresh_seconds, 60),
+        document_index_db=document_index_db,
+        index_sweep_minutes=max(index_sweep_minutes, 1),
+        download_cache_dir=download_cache_dir,
+        download_cache_max_mb=max(download_cache_max_mb, 0)
     )
 
 def validate_file_format(filename: str) -> bool:
@@ -86,6 +157,14 @@ def validate_file_format(filename: str) -> bool:
     config = get_config()
     return any(filename.lower().endswith(fmt) for fmt in config.supported_formats)
 
+def is_fast_path_eligible(filename: str, file_size_bytes: int) -> bool:
+    """Check if a document is small and text-like enough for synchronous translation"""
+    config = get_config()
+    return (
+        file_size_bytes <= config.fast_path_max_kb * 1024
+        and any(filename.lower().endswith(fmt) for fmt in config.fast_path_formats)
+    )
+
 def validate_file_size(file_size_bytes: int) -> bool:
     """Validate if file size is within limits"""
     config = get_config()
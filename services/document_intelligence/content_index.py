@@ -0,0 +1,143 @@
+"""Local content-hash index used to deduplicate uploads and reuse translations"""
+import sqlite3
+import logging
+import threading
+from typing import Optional, List
+from datetime import datetime, timezone
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Read size used when hashing uploads
+HASH_CHUNK_SIZE = 1024 * 1024
+
+class ContentIndex:
+    """SQLite-backed map of content hashes to source blobs and their translations
+
+    Lookups are single-row primary key queries on a local file, so they run inline
+    on the event loop; a lock serializes access to the shared connection.
+    """
+
+    def __init__(self):
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.translation_hits = 0
+        self.translation_misses = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Shared connection, created with the schema on first use"""
+        if self._connection is None:
+            connection = sqlite3.connect(get_config().document_index_db, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(source_documents)")]
+            if columns and "owner" not in columns:
+                # Hashes recorded before uploads were deduplicated per owner; they are only a cache
+                connection.execute("DROP TABLE source_documents")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS source_documents (
+                    content_hash TEXT NOT NULL,
+                    owner TEXT NOT NULL,
+                    blob_name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (content_hash, owner)
+                );
+                CREATE INDEX IF NOT EXISTS source_documents_blob_name ON source_documents (blob_name);
+                CREATE TABLE IF NOT EXISTS translations (
+                    content_hash TEXT NOT NULL,
+                    target_language TEXT NOT NULL,
+                    options_key TEXT NOT NULL,
+                    target_blob TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (content_hash, target_language, options_key)
+                );
+            """)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the index database"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def find_source(self, content_hash: str, owner: Optional[str] = None) -> Optional[str]:
+        """Blob name of an earlier upload with the same content by the same owner"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT blob_name FROM source_documents WHERE content_hash = ? AND owner = ?",
+                (content_hash, owner or "")
+            ).fetchone()
+        return row[0] if row else None
+
+    def hash_for_blob(self, blob_name: str) -> Optional[str]:
+        """Content hash of an indexed source blob"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT content_hash FROM source_documents WHERE blob_name = ?", (blob_name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record_source(self, content_hash: str, blob_name: str, size: int, owner: Optional[str] = None) -> None:
+        """Remember which blob holds a given owner's copy of some content"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO source_documents VALUES (?, ?, ?, ?, ?)",
+                (content_hash, owner or "", blob_name, size, datetime.now(timezone.utc).isoformat())
+            )
+
+    def forget_source(self, content_hash: str, owner: Optional[str] = None) -> None:
+        """Drop an owner's copy whose blob no longer exists; translations go with the last copy"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM source_documents WHERE content_hash = ? AND owner = ?", (content_hash, owner or "")
+            )
+            self.connection.execute(
+                "DELETE FROM translations WHERE content_hash = ? "
+                "AND NOT EXISTS (SELECT 1 FROM source_documents WHERE content_hash = ?)",
+                (content_hash, content_hash)
+            )
+
+    def find_translation(self, content_hash: str, target_language: str, options_key: str) -> Optional[str]:
+        """Target blob of an earlier translation of the same content and options"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT target_blob FROM translations "
+                "WHERE content_hash = ? AND target_language = ? AND options_key = ?",
+                (content_hash, target_language, options_key)
+            ).fetchone()
+        if row:
+            self.translation_hits += 1
+            return row[0]
+        self.translation_misses += 1
+        return None
+
+    def record_translation(self, content_hash: str, target_language: str, options_key: str, target_blob: str) -> None:
+        """Remember a finished translation for reuse"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                (content_hash, target_language, options_key, target_blob, datetime.now(timezone.utc).isoformat())
+            )
+
+    def forget_translation(self, content_hash: str, target_language: str, options_key: str) -> None:
+        """Drop a translation whose target blob no longer exists"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM translations WHERE content_hash = ? AND target_language = ? AND options_key = ?",
+                (content_hash, target_language, options_key)
+            )
+
+def translation_options_key(
+    source_language: Optional[str],
+    category: Optional[str],
+    glossary_url: Optional[str],
+    glossary_ids: Optional[List[str]] = None
+) -> str:
+    """Everything besides content and target language that changes a translation's output"""
+    return "|".join([source_language or "", category or "", glossary_url or "", ",".join(sorted(glossary_ids or []))])
+
+# Global content index instance
+content_index = ContentIndex()
@@ -0,0 +1,253 @@
+"""Size-bounded local disk cache for proxied document downloads"""
+import os
+import re
+import asyncio
+import hashlib
+import logging
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, Mapping, BinaryIO
+from starlette.responses import Response
+from starlette.types import Scope, Receive, Send
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Chunk size for reading cached files when the server cannot sendfile
+FILE_CHUNK_SIZE = 256 * 1024
+
+# Downloads of the same blob before it is admitted to the cache
+ADMIT_AFTER_DOWNLOADS = 2
+
+# Number of blobs whose download counts are remembered for admission
+MAX_TRACKED_BLOBS = 10000
+
+# Names of the files the cache writes: committed entries and in-progress downloads
+ENTRY_NAME = re.compile(r"[0-9a-f]{64}")
+TEMP_PREFIX = "download-"
+TEMP_SUFFIX = ".part"
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a Range header cannot be served for the resource size"""
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range 'bytes=' header into an inclusive (start, end); None means the whole file"""
+    if not range_header:
+        return None
+
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # Multipart ranges are not supported; fall back to the full content
+        return None
+
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            suffix = int(end_text)
+            if suffix <= 0:
+                raise RangeNotSatisfiable(range_header)
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+
+    if start >= size or start > end:
+        raise RangeNotSatisfiable(range_header)
+    return start, min(end, size - 1)
+
+@dataclass
+class CacheEntry:
+    """A blob held in the download cache"""
+    path: str
+    etag: str
+    size: int
+
+class DownloadCache:
+    """LRU disk cache of blob content keyed by container, blob name and ETag"""
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._downloads: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._directory: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Configured cache capacity (0 disables the cache)"""
+        return get_config().download_cache_max_mb * 1024 * 1024
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is in use"""
+        return self.max_bytes > 0
+
+    @property
+    def directory(self) -> str:
+        """Cache directory; leftovers from earlier processes are discarded since their ETags are unknown"""
+        if self._directory is None:
+            directory = get_config().download_cache_dir
+            os.makedirs(directory, exist_ok=True)
+            self._discard_leftovers(directory)
+            self._directory = directory
+        return self._directory
+
+    @staticmethod
+    def _discard_leftovers(directory: str) -> None:
+        """Delete the files an earlier process wrote, leaving anything else in the directory alone"""
+        for entry in os.scandir(directory):
+            owned = ENTRY_NAME.fullmatch(entry.name) or (
+                entry.name.startswith(TEMP_PREFIX) and entry.name.endswith(TEMP_SUFFIX)
+            )
+            if owned and entry.is_file(follow_symlinks=False):
+                try:
+                    os.unlink(entry.path)
+                except OSError as e:
+                    logger.warning(f"Could not remove stale cache file {entry.path}: {str(e)}")
+
+    @staticmethod
+    def _key(container_name: str, blob_name: str) -> str:
+        return f"{container_name}/{blob_name}"
+
+    def lookup(self, container_name: str, blob_name: str, etag: str) -> Optional[CacheEntry]:
+        """Cached copy of a blob if it still matches the blob's current ETag"""
+        key = self._key(container_name, blob_name)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.etag != etag:
+            # The blob changed since it was cached
+            self._evict(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def open_entry(self, container_name: str, blob_name: str, etag: str) -> Optional[BinaryIO]:
+        """Open the cached copy of a blob if it still matches the blob's current ETag
+
+        The open handle keeps the content readable even if the entry is evicted
+        while the response is still being sent.
+        """
+        entry = self.lookup(container_name, blob_name, etag)
+        if entry is None:
+            return None
+        try:
+            return open(entry.path, "rb")
+        except OSError:
+            # The file was removed behind the cache's back
+            self._evict(self._key(container_name, blob_name))
+            return None
+
+    def should_admit(self, container_name: str, blob_name: str, size: int) -> bool:
+        """Count a download and decide whether the blob is hot enough (and small enough) to cache"""
+        if not self.enabled or size > self.max_bytes // 4:
+            return False
+
+        key = self._key(container_name, blob_name)
+        count = self._downloads.pop(key, 0) + 1
+        self._downloads[key] = count
+        while len(self._downloads) > MAX_TRACKED_BLOBS:
+            self._downloads.popitem(last=False)
+        return count >= ADMIT_AFTER_DOWNLOADS
+
+    def open_temp(self) -> Tuple[int, str]:
+        """Temporary file that a download is written to before it is committed"""
+        return tempfile.mkstemp(dir=self.directory, prefix=TEMP_PREFIX, suffix=TEMP_SUFFIX)
+
+    def commit(self, container_name: str, blob_name: str, etag: str, temp_path: str, size: int) -> None:
+        """Move a fully written download into the cache, evicting the least recently used entries"""
+        key = self._key(container_name, blob_name)
+        self._evict(key)
+
+        path = os.path.join(self.directory, hashlib.sha256(f"{key}:{etag}".encode("utf-8")).hexdigest())
+        os.replace(temp_path, path)
+        self._entries[key] = CacheEntry(path=path, etag=etag, size=size)
+        self._size += size
+
+        while self._size > self.max_bytes and self._entries:
+            self._evict(next(iter(self._entries)))
+
+    def invalidate(self, container_name: str, blob_name: str) -> None:
+        """Drop a blob from the cache (e.g. after it was deleted or overwritten)"""
+        self._evict(self._key(container_name, blob_name))
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+class CachedFileResponse(Response):
+    """Serves (part of) an open cached file, using zero-copy sendfile when the ASGI server offers it
+
+    The response owns the file and closes it once sent.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        offset: int,
+        length: int,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None
+    ):
+        self.file = file
+        self.offset = offset
+        self.length = length
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+        self.headers["content-length"] = str(length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        with self.file as file:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers
+            })
+
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.fileno(),
+                    "offset": self.offset,
+                    "count": self.length,
+                    "more_body": False
+                })
+                return
+
+            file.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await asyncio.to_thread(file.read, min(FILE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+# Global download cache instance
+download_cache = DownloadCache()
@@ -0,0 +1,244 @@
+"""Throughput model for estimating translation job completion times"""
+import os
+import json
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+
+from .config import get_config
+from .models import TranslationStatus, TranslationJobType
+
+logger = logging.getLogger(__name__)
+
+# Prior used until a format has enough observations: fixed overhead plus seconds per work unit
+DEFAULT_OVERHEAD_SECONDS = 20.0
+DEFAULT_SECONDS_PER_UNIT = 6.0
+
+# Each new observation multiplies the weight of older ones by this factor
+OBSERVATION_DECAY = 0.97
+
+# Observations needed before the overhead is fitted instead of taken from the prior
+MIN_FIT_OBSERVATIONS = 3
+
+# Per-language speed factors are kept within this range
+LANGUAGE_FACTOR_BOUNDS = (0.25, 4.0)
+
+# Recorded durations replayed into the model at startup
+REPLAY_OBSERVATIONS = 2000
+
+# Bounds of the poll interval suggested to clients
+MIN_POLL_SECONDS = 2.0
+MAX_POLL_SECONDS = 60.0
+
+# Model key for multi-document jobs, whose work is measured in documents rather than bytes
+BATCH_FORMAT = "batch"
+
+@dataclass
+class ThroughputFit:
+    """Exponentially weighted least-squares fit of duration = overhead + rate * work"""
+    weight: float = 0.0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    observations: int = 0
+
+    def observe(self, work: float, seconds: float) -> None:
+        """Add one finished job, discounting older ones"""
+        self.weight = self.weight * OBSERVATION_DECAY + 1
+        self.sum_x = self.sum_x * OBSERVATION_DECAY + work
+        self.sum_y = self.sum_y * OBSERVATION_DECAY + seconds
+        self.sum_xx = self.sum_xx * OBSERVATION_DECAY + work * work
+        self.sum_xy = self.sum_xy * OBSERVATION_DECAY + work * seconds
+        self.observations += 1
+
+    def predict(self, work: float) -> float:
+        """Expected duration in seconds for the given amount of work"""
+        if self.weight <= 0:
+            return DEFAULT_OVERHEAD_SECONDS + DEFAULT_SECONDS_PER_UNIT * work
+
+        mean_x = self.sum_x / self.weight
+        mean_y = self.sum_y / self.weight
+        variance = self.sum_xx / self.weight - mean_x * mean_x
+
+        if self.observations >= MIN_FIT_OBSERVATIONS and variance > 1e-9:
+            rate = max((self.sum_xy / self.weight - mean_x * mean_y) / variance, 0.0)
+            overhead = max(mean_y - rate * mean_x, 0.0)
+        else:
+            # Too few (or too similar) jobs to separate overhead from rate: keep the prior overhead
+            overhead = min(DEFAULT_OVERHEAD_SECONDS, mean_y)
+            rate = (mean_y - overhead) / mean_x if mean_x > 0 else DEFAULT_SECONDS_PER_UNIT
+        return overhead + rate * work
+
+def job_format(job: Dict[str, Any]) -> str:
+    """Model key of a job: the source file extension, or BATCH_FORMAT for multi-document jobs"""
+    if job["job_type"] == TranslationJobType.BATCH:
+        return BATCH_FORMAT
+    return os.path.splitext(job["source_blob"])[1].lower() or "unknown"
+
+def job_work(job: Dict[str, Any]) -> float:
+    """Amount of work in a job: megabytes times target languages, or documents for batches"""
+    if job["job_type"] == TranslationJobType.BATCH:
+        return float(max(job["documents_total"], 1))
+    return max(job["source_bytes"] / (1024 * 1024), 0.01) * len(job["target_languages"])
+
+class ThroughputModel:
+    """Learns per-format translation throughput from finished jobs and estimates completion times
+
+    Every finished job is recorded in the local index database, so the model survives
+    restarts and the raw durations remain available for capacity planning.
+    """
+
+    def __init__(self):
+        self._fits: Dict[str, ThroughputFit] = {}
+        self._language_factors: Dict[str, float] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Shared connection, created with the schema on first use"""
+        if self._connection is None:
+            connection = sqlite3.connect(get_config().document_index_db, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS job_durations (
+                    job_id TEXT PRIMARY KEY,
+                    format TEXT NOT NULL,
+                    source_bytes INTEGER NOT NULL,
+                    page_count INTEGER,
+                    documents INTEGER NOT NULL,
+                    target_languages TEXT NOT NULL,
+                    work REAL NOT NULL,
+                    duration_seconds REAL NOT NULL,
+                    finished_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS job_durations_finished_at ON job_durations (finished_at);
+            """)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the index database"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _ensure_loaded(self) -> None:
+        """Replay recent recorded durations into the model once per process"""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with self._lock:
+                rows = self.connection.execute(
+                    "SELECT format, work, duration_seconds, target_languages FROM ("
+                    "SELECT * FROM job_durations ORDER BY finished_at DESC LIMIT ?"
+                    ") ORDER BY finished_at",
+                    (REPLAY_OBSERVATIONS,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load recorded job durations: {str(e)}")
+            return
+
+        for file_format, work, seconds, languages in rows:
+            self._learn(file_format, work, seconds, json.loads(languages))
+        if rows:
+            logger.info(f"Throughput model loaded {len(rows)} recorded job durations")
+
+    def _learn(self, file_format: str, work: float, seconds: float, target_languages: List[str]) -> None:
+        """Update the format fit and the languages' speed factors with one observation"""
+        fit = self._fits.setdefault(file_format, ThroughputFit())
+        expected = fit.predict(work) * self._language_factor(target_languages)
+
+        # Languages absorb what the format fit does not explain, moving slowly towards the observed ratio
+        if expected > 0:
+            ratio = seconds / expected
+            for language in target_languages:
+                factor = self._language_factors.get(language, 1.0) * ratio ** 0.1
+                self._language_factors[language] = min(max(factor, LANGUAGE_FACTOR_BOUNDS[0]), LANGUAGE_FACTOR_BOUNDS[1])
+
+        fit.observe(work, seconds / self._language_factor(target_languages))
+
+    def _language_factor(self, target_languages: List[str]) -> float:
+        """Average speed factor of a job's target languages"""
+        if not target_languages:
+            return 1.0
+        return sum(self._language_factors.get(language, 1.0) for language in target_languages) / len(target_languages)
+
+    def observe(self, job: Dict[str, Any]) -> None:
+        """Record a job that just completed (jobs served from cache never started and are skipped)"""
+        started_at = job.get("started_at")
+        if started_at is None:
+            return
+
+        self._ensure_loaded()
+        finished_at = datetime.now(timezone.utc)
+        seconds = max((finished_at - started_at).total_seconds(), 0.0)
+        file_format, work = job_format(job), job_work(job)
+        self._learn(file_format, work, seconds, job["target_languages"])
+
+        try:
+            with self._lock, self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO job_durations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job["job_id"], file_format, job["source_bytes"], job.get("page_count"),
+                        job["documents_total"], json.dumps(job["target_languages"]), work, seconds,
+                        finished_at.isoformat()
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to record duration of job {job['job_id']}: {str(e)}")
+
+    def predict_duration(self, job: Dict[str, Any]) -> float:
+        """Expected processing time of a job once a worker picks it up"""
+        self._ensure_loaded()
+        fit = self._fits.get(job_format(job)) or ThroughputFit()
+        return fit.predict(job_work(job)) * self._language_factor(job["target_languages"])
+
+    def remaining_seconds(self, job: Dict[str, Any], now: datetime) -> float:
+        """Expected processing time left for a job, blending the model with observed progress"""
+        predicted = self.predict_duration(job)
+        started_at = job.get("started_at")
+        if started_at is None:
+            return predicted
+
+        elapsed = max((now - started_at).total_seconds(), 0.0)
+        remaining = max(predicted - elapsed, 0.0)
+
+        total = job["documents_total"]
+        finished = (job["documents_completed"] + job["documents_failed"]) / total if total else 0.0
+        if 0 < finished < 1:
+            remaining = (remaining + elapsed * (1 - finished) / finished) / 2
+        return max(remaining, MIN_POLL_SECONDS)
+
+    def estimate(
+        self,
+        job: Dict[str, Any],
+        queued: bool,
+        running_jobs: List[Dict[str, Any]],
+        queued_ahead: List[Dict[str, Any]],
+        workers: int
+    ) -> Tuple[Optional[datetime], Optional[float]]:
+        """Estimated completion time and suggested poll interval (seconds); None for finished jobs"""
+        if job["status"] in (TranslationStatus.COMPLETED, TranslationStatus.FAILED, TranslationStatus.CANCELLED):
+            return None, None
+
+        now = datetime.now(timezone.utc)
+        remaining = self.remaining_seconds(job, now)
+        if queued:
+            # The work ahead of the job is shared by every worker
+            backlog = sum(self.remaining_seconds(other, now) for other in running_jobs)
+            backlog += sum(self.predict_duration(other) for other in queued_ahead)
+            remaining += backlog / max(workers, 1)
+
+        poll_seconds = min(max(remaining / 4, MIN_POLL_SECONDS), MAX_POLL_SECONDS)
+        return now + timedelta(seconds=remaining), round(poll_seconds, 1)
+
+# Global throughput model instance
+throughput_model = ThroughputModel()
@@ -1,47 +1,120 @@
 """Full Document Intelligence service implementation"""
 import os
+import json
+import time
 import uuid
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form, BackgroundTasks
-from azure.ai.translation.document import DocumentTranslationClient
-from azure.core.credentials import AzureKeyCredential
-from azure.core.exceptions import AzureError
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse, JSONResponse, Response
+from azure.ai.translation.document import DocumentTranslationInput, TranslationTarget, TranslationGlossary
 import requests
 
-from .config import get_config, validate_file_format, validate_file_size
+from .config import get_config, validate_file_format, validate_file_size, is_fast_path_eligible
 from .models import (
     DocumentTranslationRequest, DocumentUploadResponse, TranslationJobResponse,
-    TranslationJobRequest, DownloadResponse, JobStatusResponse,
+    TranslationJobRequest, BatchTranslationJobRequest, DownloadResponse, JobStatusResponse,
     SupportedLanguagesResponse, HealthCheckResponse, FileValidationResponse,
-    ErrorResponse, TranslationStatus
+    TranslationStatus, TranslationJobType, DocumentStatusDetail,
+    LanguageStatusDetail, BlobInfo, BlobListResponse, BulkCopyRequest, BulkCopyResponse,
+    GlossaryResponse, MAX_DOCUMENTS_PER_BATCH
 )
 from .security import security_manager
-from .blob_storage import blob_storage
+from .blob_storage import blob_storage, DEFAULT_LIST_PAGE_SIZE
+from .jobs import (
+    translation_jobs, job_events, update_job, apply_document_statuses,
+    calculate_progress, job_status_payload, job_completion_payload, TERMINAL_JOB_STATUSES
+)
+from .poller import translation_poller, OperationResult
+from .scheduler import translation_scheduler, QueueFullError
+from .languages import supported_languages, parse_scopes
+from .content_index import content_index, translation_options_key
+from .blob_index import blob_index
+from .bundle import stream_bundle
+from .eta import throughput_model
+from .pdf_split import pdf_splitter
+from .glossary import glossary_registry
+from .download_cache import download_cache, parse_range, RangeNotSatisfiable, CachedFileResponse
+from health import health_monitor
+from metrics import metrics
+from upstream import call_upstream, UpstreamThrottledError
 
 logger = logging.getLogger(__name__)
 
-# In-memory job storage (in production, use Redis or database)
-translation_jobs: Dict[str, Dict[str, Any]] = {}
+# Seconds between keep-alive comments on an idle job event stream
+EVENT_STREAM_HEARTBEAT_SECONDS = 15
+
+# Continuation tokens for index-backed listings start with this marker
+INDEX_TOKEN_PREFIX = "idx:"
+
+# Largest page a client may request from the blob listing endpoint (Azure's own page limit)
+MAX_LIST_PAGE_SIZE = 5000
+
+# The Text Translator accepts at most 50,000 characters per request across all targets
+TEXT_TRANSLATOR_MAX_CHARACTERS = 50000
+
+# Virtual folder (in the source container) holding the page-range parts of split PDFs
+PDF_PARTS_FOLDER = "_pdf_parts"
+
+# Background tasks owned by the service (kept referenced so they are not garbage collected)
+_background_tasks: List[asyncio.Task] = []
 
 def register_routes(router: APIRouter):
     """Register all the full service routes"""
 
+    @router.on_event("startup")
+    async def start_background_tasks():
+        """Start long-running service tasks"""
+        try:
+            config = get_config()
+        except ValueError as e:
+            logger.warning(f"Document Intelligence background tasks not started: {str(e)}")
+            return
+
+        await translation_poller.start()
+        await translation_scheduler.start()
+
+        # Unreachable storage must not hold up startup; uploads retry the bootstrap on first use
+        _background_tasks.append(asyncio.create_task(_bootstrap_storage()))
+        if config.use_managed_identity:
+            _background_tasks.append(asyncio.create_task(security_manager.run_delegation_key_refresh()))
+        _background_tasks.append(asyncio.create_task(supported_languages.run_refresh()))
+        _background_tasks.append(asyncio.create_task(blob_index.run_sweep(blob_storage)))
+        if config.blob_retention_days > 0:
+            _background_tasks.append(asyncio.create_task(blob_storage.run_retention()))
+
+    @router.on_event("shutdown")
+    async def stop_background_tasks():
+        """Stop long-running service tasks"""
+        for task in _background_tasks:
+            task.cancel()
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+        _background_tasks.clear()
+
+        await translation_scheduler.stop()
+        await translation_poller.stop()
+        await security_manager.close()
+        content_index.close()
+        blob_index.close()
+        throughput_model.close()
+        pdf_splitter.close()
+
     @router.post("/upload", response_model=DocumentUploadResponse)
     async def upload_document(
-        background_tasks: BackgroundTasks,
         file: UploadFile = File(...),
-        container: Optional[str] = Form(None)
+        container: Optional[str] = Form(None),
+        owner: Optional[str] = Form(None)
     ):
         """Upload a document for translation"""
         try:
-            # Ensure containers exist
-            background_tasks.add_task(blob_storage.ensure_containers_exist)
+            # Ensure containers exist (a no-op once bootstrapped)
+            await blob_storage.ensure_containers_exist()
 
             # Upload document
-            response = await blob_storage.upload_document(file, container)
+            response = await blob_storage.upload_document(file, container, owner)
 
             logger.info(f"Document uploaded: {response.blob_name}")
             return response
@@ -53,11 +126,45 @@ def register_routes(router: APIRouter):
             logger.error(f"Upload error: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+    @router.post("/glossaries", response_model=GlossaryResponse)
+    async def register_glossary(file: UploadFile = File(...)):
+        """Register a glossary once and get an ID to reference it from translation requests"""
+        try:
+            await blob_storage.ensure_containers_exist()
+            response = await glossary_registry.register(file)
+
+            logger.info(f"Glossary registered: {response.glossary_id} (deduplicated: {response.deduplicated})")
+            return response
+
+        except ValueError as e:
+            logger.warning(f"Glossary validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Glossary registration error: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Glossary registration failed: {str(e)}")
+
+    @router.get("/glossaries/{glossary_id}", response_model=GlossaryResponse)
+    async def get_glossary(glossary_id: str):
+        """Look up a registered glossary"""
+        resolved = await glossary_registry.resolve(glossary_id.lower())
+        if resolved is None:
+            raise HTTPException(status_code=404, detail=f"Glossary '{glossary_id}' not found")
+
+        blob_name, file_format = resolved
+        info = await blob_storage.get_blob_info(blob_name, get_config().glossary_container_name)
+        if info is None:
+            raise HTTPException(status_code=404, detail=f"Glossary '{glossary_id}' not found")
+        return GlossaryResponse(
+            glossary_id=glossary_id.lower(),
+            file_format=file_format,
+            file_size=info["size"] or 0,
+            original_filename=info["metadata"].get("original_filename")
+        )
+
     @router.post("/translate", response_model=TranslationJobResponse)
     async def start_translation(
         request: Request,
-        translation_request: TranslationJobRequest,
-        background_tasks: BackgroundTasks
+        translation_request: TranslationJobRequest
     ):
         """Start document translation job"""
         try:
@@ -68,55 +175,97 @@ def register_routes(router: APIRouter):
 
             # Verify source blob exists
             try:
-                source_blobs = await blob_storage.list_blobs(
-                    config.source_container_name,
-                    translation_request.source_blob_name
+                source_blob = await blob_storage.find_blob(
+                    translation_request.source_blob_name,
+                    config.source_container_name
                 )
-                if not source_blobs:
+                if source_blob is None:
                     raise HTTPException(
                         status_code=404,
                         detail=f"Source document '{translation_request.source_blob_name}' not found"
                     )
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Failed to verify source blob: {str(e)}")
                 raise HTTPException(status_code=500, detail="Failed to verify source document")
 
+            await _verify_glossaries(translation_request.translation_config)
+
             # Create job record
-            job_record = {
-                "job_id": job_id,
-                "status": TranslationStatus.PENDING,
-                "source_container": config.source_container_name,
-                "target_container": config.target_container_name,
-                "source_blob": translation_request.source_blob_name,
-                "target_blob": None,
-                "source_language": translation_request.translation_config.source_language,
-                "target_language": translation_request.translation_config.target_language,
-                "created_at": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc),
-                "documents_total": 1,
-                "documents_completed": 0,
-                "documents_failed": 0,
-                "error_message": None,
-                "azure_operation_id": None
-            }
+            job_record = _new_job_record(
+                job_id,
+                TranslationJobType.SINGLE,
+                translation_request.source_blob_name,
+                translation_request.translation_config,
+                [translation_request.source_blob_name],
+                source_blob["size"] or 0
+            )
 
             translation_jobs[job_id] = job_record
 
-            # Start translation in background
-            background_tasks.add_task(
-                _process_translation_job,
+            # Content translated before with the same options is reused without calling Azure
+            content_hash = source_blob["metadata"].get("content_sha256") or content_index.hash_for_blob(source_blob["name"])
+            cached_documents = await _find_cached_translations(job_record, content_hash) if content_hash else None
+            if cached_documents is not None:
+                apply_document_statuses(
+                    job_id,
+                    cached_documents,
+                    status=TranslationStatus.COMPLETED,
+                    target_blob=cached_documents[0].target_blob,
+                    cache_hit=True
+                )
+
+                security_manager.audit_log("translation_job_cache_hit", {
+                    "job_id": job_id,
+                    "source_blob": translation_request.source_blob_name,
+                    "target_languages": translation_request.translation_config.target_languages
+                })
+
+                return TranslationJobResponse(**job_record)
+
+            # Small text-like documents are translated synchronously in one round trip;
+            # the Text Translator cannot apply glossaries, so those always take the batch API
+            fast_path = (
+                is_fast_path_eligible(source_blob["name"], source_blob["size"] or 0)
+                and not translation_request.translation_config.glossary_ids
+                and not translation_request.translation_config.glossary_url
+            )
+
+            # Large PDFs can be translated as page ranges in parallel (opt-in, needs pypdf)
+            split_pdf = (
+                translation_request.split_pdf
+                and not fast_path
+                and source_blob["name"].lower().endswith(".pdf")
+            )
+            if split_pdf and not pdf_splitter.available:
+                logger.warning(f"PDF splitting requested for job {job_id} but pypdf is not installed")
+                split_pdf = False
+
+            # Queue the translation for a worker
+            if fast_path:
+                process_job = _process_fast_translation_job
+            elif split_pdf:
+                process_job = _process_split_translation_job
+            else:
+                process_job = _process_translation_job
+            queue_position = await _schedule_job(
                 job_id,
-                translation_request
+                lambda: process_job(job_id, translation_request),
+                translation_request.priority,
+                source_blob["size"] or 0
             )
 
             # Security audit
             security_manager.audit_log("translation_job_started", {
                 "job_id": job_id,
                 "source_blob": translation_request.source_blob_name,
-                "target_language": translation_request.translation_config.target_language
+                "fast_path": fast_path,
+                "split_pdf": split_pdf,
+                "target_languages": translation_request.translation_config.target_languages
             })
 
-            return TranslationJobResponse(**job_record)
+            return TranslationJobResponse(**job_record, queue_position=queue_position)
 
         except HTTPException:
             raise
@@ -124,6 +273,52 @@ def register_routes(router: APIRouter):
             logger.error(f"Translation job creation failed: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to start translation: {str(e)}")
 
+    @router.post("/translate/batch", response_model=TranslationJobResponse)
+    async def start_batch_translation(batch_request: BatchTranslationJobRequest):
+        """Start a multi-document translation job as a single Azure operation"""
+        try:
+            job_id = str(uuid.uuid4())
+
+            await _verify_glossaries(batch_request.translation_config)
+
+            blob_names, source_bytes = await _resolve_batch_documents(batch_request)
+            job_record = _new_job_record(
+                job_id,
+                TranslationJobType.BATCH,
+                batch_request.prefix or "",
+                batch_request.translation_config,
+                blob_names,
+                source_bytes
+            )
+
+            translation_jobs[job_id] = job_record
+
+            # Queue the translation for a worker
+            queue_position = await _schedule_job(
+                job_id,
+                lambda: _process_batch_translation_job(job_id, batch_request, blob_names),
+                batch_request.priority,
+                source_bytes
+            )
+
+            # Security audit
+            security_manager.audit_log("batch_translation_job_started", {
+                "job_id": job_id,
+                "prefix": batch_request.prefix,
+                "documents_requested": len(blob_names),
+                "target_languages": batch_request.translation_config.target_languages
+            })
+
+            return TranslationJobResponse(**job_record, queue_position=queue_position)
+
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Batch translation job creation failed: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to start batch translation: {str(e)}")
+
     @router.get("/job/{job_id}", response_model=JobStatusResponse)
     async def get_job_status(job_id: str):
         """Get translation job status"""
@@ -132,25 +327,24 @@ def register_routes(router: APIRouter):
                 raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
             job = translation_jobs[job_id]
-
-            # Calculate progress
-            total = job["documents_total"]
-            completed = job["documents_completed"]
-            failed = job["documents_failed"]
-
-            progress_percentage = (completed / total * 100) if total > 0 else 0
+            estimated_completion, poll_seconds = _estimate_completion(job_id, job)
 
             return JobStatusResponse(
                 job_id=job_id,
                 status=job["status"],
-                progress_percentage=progress_percentage,
-                documents_total=total,
-                documents_completed=completed,
-                documents_failed=failed,
+                progress_percentage=calculate_progress(job),
+                documents_total=job["documents_total"],
+                documents_completed=job["documents_completed"],
+                documents_failed=job["documents_failed"],
                 created_at=job["created_at"],
                 updated_at=job["updated_at"],
-                estimated_completion=None,  # Could implement estimation logic
-                error_details=[job["error_message"]] if job["error_message"] else None
+                estimated_completion=estimated_completion,
+                error_details=_collect_error_details(job),
+                documents=job["documents"],
+                languages=job["languages"],
+                queue_position=translation_scheduler.queue_position(job_id),
+                suggested_poll_seconds=poll_seconds,
+                cache_hit=job["cache_hit"]
             )
 
         except HTTPException:
@@ -159,7 +353,120 @@ def register_routes(router: APIRouter):
             logger.error(f"Failed to get job status: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to retrieve job status: {str(e)}")
 
-    @router.get("/download/{blob_name}", response_model=DownloadResponse)
+    @router.get("/job/{job_id}/events")
+    async def stream_job_events(job_id: str, request: Request):
+        """Stream job status, per-document progress and completion as Server-Sent Events"""
+        if job_id not in translation_jobs:
+            raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+
+        # Subscribe before taking the snapshot so no update falls in between
+        queue = job_events.subscribe(job_id)
+
+        async def event_stream():
+            try:
+                job = translation_jobs[job_id]
+                if job["status"] in TERMINAL_JOB_STATUSES:
+                    yield _format_sse("completed", job_completion_payload(job))
+                    return
+
+                yield _format_sse("status", job_status_payload(job))
+
+                while not await request.is_disconnected():
+                    try:
+                        event, data = await asyncio.wait_for(queue.get(), EVENT_STREAM_HEARTBEAT_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                        continue
+
+                    yield _format_sse(event, data)
+                    if event == "completed":
+                        return
+            finally:
+                job_events.unsubscribe(job_id, queue)
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @router.get("/download/{blob_name:path}/content")
+    async def download_document_content(
+        blob_name: str,
+        request: Request,
+        container: Optional[str] = None
+    ):
+        """Proxy a document's content for clients that cannot reach storage directly"""
+        try:
+            config = get_config()
+            container = container or config.target_container_name
+            if container not in (config.source_container_name, config.target_container_name):
+                raise HTTPException(status_code=400, detail=f"Unknown container '{container}'")
+
+            info = await blob_storage.get_blob_info(blob_name, container)
+            if info is None:
+                raise HTTPException(status_code=404, detail=f"Document '{blob_name}' not found")
+
+            etag, size = info["etag"], info["size"]
+            headers = {
+                "ETag": etag,
+                "Accept-Ranges": "bytes",
+                "Content-Disposition": f'attachment; filename="{os.path.basename(blob_name)}"'
+            }
+
+            if etag in request.headers.get("if-none-match", ""):
+                return Response(status_code=304, headers=headers)
+
+            # A Range is only honoured if the client's copy is still current
+            range_header = request.headers.get("range")
+            if_range = request.headers.get("if-range")
+            if if_range and if_range != etag:
+                range_header = None
+            try:
+                byte_range = parse_range(range_header, size)
+            except RangeNotSatisfiable:
+                return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+
+            start, end = byte_range or (0, size - 1)
+            length = end - start + 1
+            status_code = 206 if byte_range else 200
+            if byte_range:
+                headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            media_type = info["content_type"] or "application/octet-stream"
+
+            # Security audit
+            security_manager.audit_log("document_content_downloaded", {
+                "blob_name": blob_name,
+                "container": container,
+                "range": range_header
+            })
+
+            if download_cache.enabled and container == config.target_container_name:
+                cached = download_cache.open_entry(container, blob_name, etag)
+                if cached is not None:
+                    return CachedFileResponse(cached, start, length, status_code, headers, media_type)
+
+                if byte_range is None and download_cache.should_admit(container, blob_name, size):
+                    stream = _stream_into_cache(blob_name, container, etag, size)
+                    headers["Content-Length"] = str(length)
+                    return StreamingResponse(stream, status_code=status_code, headers=headers, media_type=media_type)
+
+            headers["Content-Length"] = str(length)
+            return StreamingResponse(
+                blob_storage.stream_blob(blob_name, container, start, length),
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Document content download failed: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to download document: {str(e)}")
+
+    # Registered after the /content route, which the catch-all path parameter would otherwise shadow
+    @router.get("/download/{blob_name:path}", response_model=DownloadResponse)
     async def download_document(
         blob_name: str,
         container: Optional[str] = None
@@ -183,25 +490,137 @@ def register_routes(router: APIRouter):
             logger.error(f"Download URL generation failed: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to generate download URL: {str(e)}")
 
-    @router.get("/languages", response_model=SupportedLanguagesResponse)
-    async def get_supported_languages():
-        """Get supported languages for translation"""
+    @router.get("/blobs", response_model=BlobListResponse)
+    async def list_blobs(
+        container: Optional[str] = None,
+        prefix: Optional[str] = None,
+        page_size: int = Query(DEFAULT_LIST_PAGE_SIZE, ge=1, le=MAX_LIST_PAGE_SIZE),
+        continuation_token: Optional[str] = None,
+        include_metadata: bool = False,
+        owner: Optional[str] = None,
+        job_id: Optional[str] = None
+    ):
+        """List one page of blobs; pass the returned continuation_token to get the next page"""
         try:
             config = get_config()
+            container = container or config.source_container_name
+            if container not in (config.source_container_name, config.target_container_name):
+                raise HTTPException(status_code=400, detail=f"Unknown container '{container}'")
+
+            live_token = continuation_token and not continuation_token.startswith(INDEX_TOKEN_PREFIX)
+            if blob_index.ready and not live_token:
+                # Served from the local index; the token is the last name returned
+                after = continuation_token[len(INDEX_TOKEN_PREFIX):] if continuation_token else None
+                blobs = blob_index.list_page(container, prefix, page_size, after, owner, job_id)
+                next_token = f"{INDEX_TOKEN_PREFIX}{blobs[-1]['name']}" if len(blobs) == page_size else None
+                if not include_metadata:
+                    for blob in blobs:
+                        blob.pop("metadata")
+            elif owner or job_id:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Blob index is still loading, owner and job filters are not available yet",
+                    headers={"Retry-After": "30"}
+                )
+            else:
+                # Until the first index sweep finishes, page through storage directly
+                blobs, next_token = await blob_storage.list_blobs_page(
+                    container,
+                    prefix,
+                    page_size,
+                    continuation_token,
+                    include_metadata
+                )
 
-            # Call Azure Translator Text API languages endpoint (not the batch endpoint)
-            url = f"{config.translator_text_endpoint}/languages?api-version=3.0"
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            return BlobListResponse(
+                container_name=container,
+                blobs=[BlobInfo(**blob) for blob in blobs],
+                continuation_token=next_token
+            )
 
-            languages_data = response.json()
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Blob listing failed: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to list blobs: {str(e)}")
+
+    @router.post("/copy", response_model=BulkCopyResponse)
+    async def copy_blobs(copy_request: BulkCopyRequest):
+        """Copy blobs (an explicit list or a whole prefix) between the service containers"""
+        try:
+            config = get_config()
+            source_container = copy_request.source_container or config.source_container_name
+            target_container = copy_request.target_container or config.target_container_name
+            for container in (source_container, target_container):
+                if container not in (config.source_container_name, config.target_container_name):
+                    raise HTTPException(status_code=400, detail=f"Unknown container '{container}'")
+
+            started = time.monotonic()
+            if copy_request.prefix is not None:
+                copies = await blob_storage.copy_prefix(
+                    copy_request.prefix,
+                    source_container,
+                    target_container,
+                    copy_request.target_prefix
+                )
+            else:
+                copies = await blob_storage.copy_blobs(
+                    [(name, f"{copy_request.target_prefix}{name}") for name in copy_request.blob_names],
+                    source_container,
+                    target_container
+                )
+            succeeded = sum(1 for copy in copies if copy.status == "success")
 
-            return SupportedLanguagesResponse(
-                translation=languages_data.get("translation", {}),
-                transliteration=languages_data.get("transliteration"),
-                dictionary=languages_data.get("dictionary")
+            # Security audit
+            security_manager.audit_log("blobs_copied", {
+                "source_container": source_container,
+                "target_container": target_container,
+                "prefix": copy_request.prefix,
+                "copies_total": len(copies),
+                "copies_succeeded": succeeded
+            })
+
+            return BulkCopyResponse(
+                source_container=source_container,
+                target_container=target_container,
+                copies_total=len(copies),
+                copies_succeeded=succeeded,
+                copies_failed=len(copies) - succeeded,
+                duration_seconds=round(time.monotonic() - started, 3),
+                copies=copies
             )
 
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Bulk copy failed: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to copy blobs: {str(e)}")
+
+    @router.get("/languages", response_model=SupportedLanguagesResponse)
+    async def get_supported_languages(request: Request, scope: Optional[str] = None):
+        """Get supported languages for translation (served from cache, revalidated in the background)"""
+        try:
+            try:
+                scopes = parse_scopes(scope)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            languages_data, etag = await supported_languages.get(scopes)
+            headers = {
+                "ETag": etag,
+                "Cache-Control": f"public, max-age={get_config().languages_refresh_seconds}"
+            }
+
+            if etag in request.headers.get("if-none-match", ""):
+                return Response(status_code=304, headers=headers)
+
+            body = SupportedLanguagesResponse(**languages_data)
+            return JSONResponse(content=jsonable_encoder(body, exclude_none=True), headers=headers)
+
+        except (HTTPException, UpstreamThrottledError):
+            raise
         except requests.RequestException as e:
             logger.error(f"Failed to fetch supported languages: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to retrieve supported languages")
@@ -245,26 +664,53 @@ def register_routes(router: APIRouter):
             logger.error(f"File validation failed: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
+    @router.get("/job/{job_id}/bundle")
+    async def download_job_bundle(job_id: str):
+        """Stream every translated document of a job as one ZIP archive"""
+        if job_id not in translation_jobs:
+            raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+
+        job = translation_jobs[job_id]
+        target_blobs = list(dict.fromkeys(
+            doc.target_blob for doc in job["documents"]
+            if doc.status == "Succeeded" and doc.target_blob
+        ))
+        if not target_blobs:
+            raise HTTPException(status_code=409, detail=f"Job '{job_id}' has no translated documents yet")
+
+        # Security audit
+        security_manager.audit_log("job_bundle_downloaded", {
+            "job_id": job_id,
+            "documents": len(target_blobs)
+        })
+
+        return StreamingResponse(
+            stream_bundle([(blob, blob) for blob in target_blobs], job["target_container"]),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="translation-{job_id}.zip"'}
+        )
+
     @router.get("/jobs", response_model=List[JobStatusResponse])
     async def list_jobs(limit: int = 50):
         """List translation jobs"""
         try:
             jobs = []
             for job_id, job_data in list(translation_jobs.items())[-limit:]:
-                total = job_data["documents_total"]
-                completed = job_data["documents_completed"]
-                progress = (completed / total * 100) if total > 0 else 0
-
+                estimated_completion, poll_seconds = _estimate_completion(job_id, job_data)
                 jobs.append(JobStatusResponse(
                     job_id=job_id,
                     status=job_data["status"],
-                    progress_percentage=progress,
-                    documents_total=total,
-                    documents_completed=completed,
+                    progress_percentage=calculate_progress(job_data),
+                    documents_total=job_data["documents_total"],
+                    documents_completed=job_data["documents_completed"],
                     documents_failed=job_data["documents_failed"],
                     created_at=job_data["created_at"],
                     updated_at=job_data["updated_at"],
-                    error_details=[job_data["error_message"]] if job_data["error_message"] else None
+                    estimated_completion=estimated_completion,
+                    error_details=_collect_error_details(job_data),
+                    queue_position=translation_scheduler.queue_position(job_id),
+                    suggested_poll_seconds=poll_seconds,
+                    cache_hit=job_data["cache_hit"]
                 ))
 
             return jobs
@@ -282,15 +728,17 @@ def register_routes(router: APIRouter):
 
             job = translation_jobs[job_id]
 
-            if job["status"] in [TranslationStatus.COMPLETED, TranslationStatus.FAILED, TranslationStatus.CANCELLED]:
+            if job["status"] in TERMINAL_JOB_STATUSES:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Cannot cancel job in '{job['status']}' status"
                 )
 
-            # Update job status
-            job["status"] = TranslationStatus.CANCELLED
-            job["updated_at"] = datetime.now(timezone.utc)
+            # Update job status, then stop the work wherever it is
+            update_job(job_id, status=TranslationStatus.CANCELLED)
+
+            if not translation_scheduler.cancel_queued(job_id) and job["azure_operation_id"]:
+                await _cancel_operation(job["azure_operation_id"])
 
             # Security audit
             security_manager.audit_log("translation_job_cancelled", {
@@ -305,138 +753,681 @@ def register_routes(router: APIRouter):
             logger.error(f"Failed to cancel job: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to cancel job: {str(e)}")
 
-    # Override the basic health check with full functionality version
-    @router.get("/health", response_model=HealthCheckResponse)
-    async def health_check_full():
-        """Comprehensive health check endpoint"""
-        try:
-            config = get_config()
+    health_monitor.register("document_intelligence", _probe_health)
 
-            # Check if translator is configured
-            translator_configured = bool(
-                config.translator_api_key and
-                config.translator_endpoint
-            )
+    # Read at scrape time, so the scheduler and caches carry no metrics code
+    metrics.register_gauge("translation_jobs_queued", "Translation jobs waiting for a worker", lambda: translation_scheduler.queue_depth)
+    metrics.register_gauge("translation_jobs_running", "Translation jobs held by a worker", lambda: translation_scheduler.running_count)
+    metrics.register_gauge("translation_workers", "Configured translation workers", lambda: translation_scheduler.worker_count)
+    metrics.register_cache("document_downloads", lambda: (download_cache.hits, download_cache.misses))
+    metrics.register_cache("translation_results", lambda: (content_index.translation_hits, content_index.translation_misses))
 
-            # Check if storage is accessible
-            storage_accessible = False
-            try:
-                await blob_storage.ensure_containers_exist()
-                storage_accessible = True
-            except Exception as e:
-                logger.warning(f"Storage health check failed: {str(e)}")
+async def _bootstrap_storage() -> None:
+    """Open the shared storage client and create any missing containers"""
+    # One async storage client shared by every request for the life of the process
+    await security_manager.open()
+    await blob_storage.ensure_containers_exist()
 
-            # Determine overall status
-            if translator_configured and storage_accessible:
-                status = "healthy"
-            elif translator_configured or storage_accessible:
-                status = "degraded"
-            else:
-                status = "unhealthy"
-
-            return HealthCheckResponse(
-                status=status,
-                configured=translator_configured,
-                storage_accessible=storage_accessible,
-                translator_accessible=translator_configured,
-                managed_identity_enabled=config.use_managed_identity,
-                supported_formats=list(config.supported_formats),
-                max_file_size_mb=config.max_file_size_mb
-            )
+async def _probe_health() -> Dict[str, Any]:
+    """Health probe run in the background by the health monitor"""
+    try:
+        config = get_config()
 
-        except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
-            return HealthCheckResponse(
-                status="unhealthy",
-                configured=False,
-                storage_accessible=False,
-                translator_accessible=False,
-                managed_identity_enabled=False,
-                supported_formats=[],
-                max_file_size_mb=0
+        # Check if translator is configured
+        translator_configured = bool(
+            config.translator_api_key and
+            config.translator_endpoint
+        )
+
+        # Check if storage is accessible
+        storage_accessible = await blob_storage.check_storage_access()
+
+        # Determine overall status
+        if translator_configured and storage_accessible:
+            status = "healthy"
+        elif translator_configured or storage_accessible:
+            status = "degraded"
+        else:
+            status = "unhealthy"
+
+        response = HealthCheckResponse(
+            status=status,
+            configured=translator_configured,
+            storage_accessible=storage_accessible,
+            translator_accessible=translator_configured,
+            managed_identity_enabled=config.use_managed_identity,
+            supported_formats=list(config.supported_formats),
+            max_file_size_mb=config.max_file_size_mb,
+            last_retention=blob_storage.last_retention
+        )
+
+    except Exception as e:
+        logger.error(f"Health check failed: {str(e)}")
+        response = HealthCheckResponse(
+            status="unhealthy",
+            configured=False,
+            storage_accessible=False,
+            translator_accessible=False,
+            managed_identity_enabled=False,
+            supported_formats=[],
+            max_file_size_mb=0
+        )
+
+    return jsonable_encoder(response)
+
+def _new_job_record(
+    job_id: str,
+    job_type: TranslationJobType,
+    source_blob: str,
+    translation_config: DocumentTranslationRequest,
+    source_blob_names: List[str],
+    source_bytes: int = 0
+) -> Dict[str, Any]:
+    """Build the in-memory record for a new translation job"""
+    now = datetime.now(timezone.utc)
+    target_languages = translation_config.target_languages
+    return {
+        "job_id": job_id,
+        "job_type": job_type,
+        "status": TranslationStatus.PENDING,
+        "source_container": get_config().source_container_name,
+        "target_container": get_config().target_container_name,
+        "source_blob": source_blob,
+        "target_blob": None,
+        "source_language": translation_config.source_language,
+        "target_language": target_languages[0],
+        "target_languages": target_languages,
+        "created_at": now,
+        "updated_at": now,
+        "documents_total": len(source_blob_names) * len(target_languages),
+        "documents_completed": 0,
+        "documents_failed": 0,
+        "documents": [
+            DocumentStatusDetail(source_blob=name, target_language=language, status="NotStarted")
+            for name in source_blob_names
+            for language in target_languages
+        ],
+        "languages": [
+            LanguageStatusDetail(target_language=language, status=TranslationStatus.PENDING)
+            for language in target_languages
+        ],
+        "error_message": None,
+        "azure_operation_id": None,
+        "source_bytes": source_bytes,
+        "page_count": None,
+        "started_at": None,
+        "options_key": translation_options_key(
+            translation_config.source_language,
+            translation_config.category,
+            translation_config.glossary_url,
+            translation_config.glossary_ids
+        ),
+        "cache_hit": False
+    }
+
+async def _verify_glossaries(translation_config: DocumentTranslationRequest) -> None:
+    """Reject unknown glossary IDs before a job is queued"""
+    for glossary_id in translation_config.glossary_ids or []:
+        if await glossary_registry.resolve(glossary_id) is None:
+            raise HTTPException(status_code=400, detail=f"Glossary '{glossary_id}' not found")
+
+async def _find_cached_translations(job: Dict[str, Any], content_hash: str) -> Optional[List[DocumentStatusDetail]]:
+    """Earlier translations of this content into every requested language, or None if any is missing"""
+    config = get_config()
+    cached = {
+        language: content_index.find_translation(content_hash, language, job["options_key"])
+        for language in job["target_languages"]
+    }
+    if not all(cached.values()):
+        return None
+
+    # Targets can be deleted outside the service, and the blob index only notices at its next
+    # sweep, so every target is confirmed with a HEAD request rather than the index
+    target_infos = await asyncio.gather(*(
+        blob_storage.get_blob_info(target_blob, config.target_container_name)
+        for target_blob in cached.values()
+    ))
+    missing = [language for language, info in zip(cached, target_infos) if info is None]
+    for language in missing:
+        content_index.forget_translation(content_hash, language, job["options_key"])
+    blob_index.remove(config.target_container_name, (cached[language] for language in missing))
+    if missing:
+        return None
+
+    return [
+        DocumentStatusDetail(
+            source_blob=job["source_blob"],
+            target_blob=target_blob,
+            target_language=language,
+            status="Succeeded"
+        )
+        for language, target_blob in cached.items()
+    ]
+
+async def _index_translated_documents(job_id: str, documents: List[DocumentStatusDetail]) -> None:
+    """Add a job's translated documents to the blob index"""
+    config = get_config()
+    target_blobs = [doc.target_blob for doc in documents if doc.status == "Succeeded" and doc.target_blob]
+    infos = await asyncio.gather(
+        *(blob_storage.get_blob_info(target_blob, config.target_container_name) for target_blob in target_blobs),
+        return_exceptions=True
+    )
+    for info in infos:
+        if isinstance(info, dict):
+            blob_index.upsert(config.target_container_name, info, job_id=job_id)
+
+def _remember_translations(job_id: str, documents: List[DocumentStatusDetail]) -> None:
+    """Index finished translations so identical content is not translated again"""
+    job = translation_jobs[job_id]
+    for doc in documents:
+        if doc.status != "Succeeded" or not doc.target_blob or not doc.target_language:
+            continue
+        content_hash = content_index.hash_for_blob(doc.source_blob)
+        if content_hash:
+            content_index.record_translation(
+                content_hash,
+                doc.target_language.lower(),
+                job["options_key"],
+                doc.target_blob
             )
 
+async def _stream_into_cache(blob_name: str, container: str, etag: str, size: int):
+    """Stream a blob to the client while writing it to the download cache"""
+    fd, temp_path = download_cache.open_temp()
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as cache_file:
+            async for chunk in blob_storage.stream_blob(blob_name, container):
+                await asyncio.to_thread(cache_file.write, chunk)
+                written += len(chunk)
+                yield chunk
+
+        # Only a complete download becomes a cache entry
+        if written == size:
+            download_cache.commit(container, blob_name, etag, temp_path, size)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+async def _resolve_batch_documents(batch_request: BatchTranslationJobRequest) -> Tuple[List[str], int]:
+    """A batch's source blob names and their summed size, so batches queue by size like single jobs
+
+    Prefixes are expanded here so every document gets the same per-file target names as list
+    batches and single jobs; the staged parts of split PDFs are never part of a batch.
+    """
+    container = get_config().source_container_name
+    if batch_request.prefix is not None:
+        blobs = []
+        async for blob in blob_storage.iter_blobs(container, batch_request.prefix or None):
+            if blob["name"].startswith(f"{PDF_PARTS_FOLDER}/"):
+                continue
+            if len(blobs) == MAX_DOCUMENTS_PER_BATCH:
+                raise ValueError(f"A batch can contain at most {MAX_DOCUMENTS_PER_BATCH} documents")
+            blobs.append(blob)
+        if not blobs:
+            raise ValueError(f"No source documents match prefix '{batch_request.prefix}'")
+        return [blob["name"] for blob in blobs], sum((blob["size"] or 0) for blob in blobs)
+
+    blobs = await asyncio.gather(*(
+        blob_storage.find_blob(name, container) for name in batch_request.blob_names
+    ))
+    return batch_request.blob_names, sum((blob["size"] or 0) for blob in blobs if blob is not None)
+
+async def _schedule_job(job_id: str, run, priority: int, source_bytes: int = 0) -> int:
+    """Hand a job to the scheduler, dropping its record if the queue is full"""
+    try:
+        return await translation_scheduler.submit(job_id, run, priority, source_bytes)
+    except QueueFullError as e:
+        translation_jobs.pop(job_id, None)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+
+async def _cancel_operation(operation_id: str) -> None:
+    """Cancel an Azure translation operation so it stops processing (and billing)"""
+    try:
+        await translation_poller.client.cancel_translation(operation_id)
+    except Exception as e:
+        logger.warning(f"Failed to cancel translation operation {operation_id}: {str(e)}")
+    finally:
+        translation_poller.untrack(operation_id)
+
+def _estimate_completion(job_id: str, job: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[float]]:
+    """Completion estimate and poll interval from the throughput model and the jobs ahead in the queue"""
+    queued = translation_scheduler.is_queued(job_id)
+    running_jobs, queued_ahead = [], []
+    if queued:
+        running_jobs = [translation_jobs[other] for other in translation_scheduler.running_job_ids if other in translation_jobs]
+        queued_ahead = [translation_jobs[other] for other in translation_scheduler.jobs_ahead(job_id) if other in translation_jobs]
+    return throughput_model.estimate(job, queued, running_jobs, queued_ahead, translation_scheduler.worker_count)
+
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Serialize one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def _collect_error_details(job: Dict[str, Any]) -> Optional[List[str]]:
+    """Gather job-level and per-document error messages"""
+    errors = [job["error_message"]] if job["error_message"] else []
+    errors.extend(
+        f"{doc.source_blob} ({doc.target_language}): {doc.error_message}"
+        for doc in job.get("documents", [])
+        if doc.error_message
+    )
+    return errors or None
+
+def _blob_url_from_container_url(container_sas_url: str, blob_name: str) -> str:
+    """Address a single blob with an existing container SAS URL"""
+    base, _, sas_token = container_sas_url.partition("?")
+    return f"{base}/{blob_name}?{sas_token}"
+
+def _target_blob_name(source_blob_name: str, target_language: str) -> str:
+    """Name of the translated output for a single source blob, under its language folder"""
+    return f"{target_language}/translated_{source_blob_name}"
+
+def _build_file_inputs(
+    source_container_url: str,
+    target_container_url: str,
+    blob_names: List[str],
+    translation_config: DocumentTranslationRequest,
+    glossaries: Optional[List[TranslationGlossary]] = None
+) -> List[DocumentTranslationInput]:
+    """One File-type input per source blob, all signed with the container SAS tokens"""
+    return [
+        DocumentTranslationInput(
+            source_url=_blob_url_from_container_url(source_container_url, name),
+            targets=[
+                TranslationTarget(
+                    target_url=_blob_url_from_container_url(
+                        target_container_url,
+                        _target_blob_name(name, language)
+                    ),
+                    language=language,
+                    category_id=translation_config.category,
+                    glossaries=glossaries
+                )
+                for language in translation_config.target_languages
+            ],
+            source_language=translation_config.source_language,
+            storage_type="File"
+        )
+        for name in blob_names
+    ]
+
+async def _submit_operation(job_id: str, inputs: List[DocumentTranslationInput]) -> Optional[OperationResult]:
+    """Submit one Azure translation operation and wait for its result; None if the job was cancelled"""
+    job = translation_jobs[job_id]
+
+    # Only the submission talks to Azure here; the central poller watches it from then on
+    operation = await translation_poller.client.begin_translation(inputs)
+
+    # Store operation details
+    update_job(job_id, azure_operation_id=operation.id)
+
+    # The job may have been cancelled while the operation was being submitted
+    if job["status"] == TranslationStatus.CANCELLED:
+        await _cancel_operation(operation.id)
+        return None
+
+    result = await translation_poller.track(job_id, operation.id, job["source_bytes"])
+    if result.status == "Cancelled" and job["status"] == TranslationStatus.CANCELLED:
+        return None
+    return result
+
+async def _run_translation_operation(job_id: str, inputs: List[DocumentTranslationInput]) -> None:
+    """Submit one Azure translation operation and track it until it finishes"""
+    job = translation_jobs[job_id]
+
+    result = await _submit_operation(job_id, inputs)
+    if result is None:
+        return
+
+    documents = result.documents
+    succeeded = [doc for doc in documents if doc.status == "Succeeded"]
+
+    # Update job with results
+    if succeeded:
+        _remember_translations(job_id, documents)
+        await _index_translated_documents(job_id, documents)
+        apply_document_statuses(
+            job_id,
+            documents,
+            status=TranslationStatus.COMPLETED,
+            target_blob=succeeded[0].target_blob if job["job_type"] == TranslationJobType.SINGLE else None
+        )
+    else:
+        apply_document_statuses(
+            job_id,
+            documents,
+            status=TranslationStatus.FAILED,
+            error_message=result.error_message or job["error_message"] or "No documents were translated"
+        )
+
+def _mark_job_failed(job_id: str, error: Exception) -> None:
+    """Record a job-level failure and audit it"""
+    job = translation_jobs.get(job_id)
+    if job is None or job["status"] in TERMINAL_JOB_STATUSES:
+        return
+
+    for summary in job["languages"]:
+        if summary.status != TranslationStatus.COMPLETED:
+            summary.status = TranslationStatus.FAILED
+
+    update_job(
+        job_id,
+        status=TranslationStatus.FAILED,
+        documents_failed=max(job["documents_total"] - job["documents_completed"], 1),
+        error_message=str(error)
+    )
+
+    logger.error(f"Translation job {job_id} failed: {str(error)}")
+
+    # Security audit
+    security_manager.audit_log("translation_job_failed", {
+        "job_id": job_id,
+        "error": str(error)
+    })
+
 async def _process_translation_job(job_id: str, translation_request: TranslationJobRequest):
     """Background task to process translation job"""
     try:
-        config = get_config()
         job = translation_jobs[job_id]
 
         # Update job status
-        job["status"] = TranslationStatus.RUNNING
-        job["updated_at"] = datetime.now(timezone.utc)
+        update_job(job_id, status=TranslationStatus.RUNNING)
 
         # Get container SAS URLs
         source_url, target_url = await blob_storage.get_container_sas_urls()
-
-        # Initialize Azure Document Translation client
-        credential = AzureKeyCredential(config.translator_api_key)
-        client = DocumentTranslationClient(
-            endpoint=config.translator_endpoint,
-            credential=credential
+        glossaries = await glossary_registry.translation_glossaries(
+            translation_request.translation_config.glossary_ids,
+            translation_request.translation_config.glossary_url
         )
 
-        # Generate URLs for the specific blob
-        source_blob_url = security_manager.get_download_sas_url(
-            config.source_container_name,
-            translation_request.source_blob_name
+        inputs = _build_file_inputs(
+            source_url,
+            target_url,
+            [translation_request.source_blob_name],
+            translation_request.translation_config,
+            glossaries
         )
 
-        # Generate target blob name
-        target_blob_name = f"translated_{translation_request.source_blob_name}"
-        target_blob_url = security_manager.get_upload_sas_url(
-            config.target_container_name,
-            target_blob_name
-        )
-
-        # Start translation using single document format
-        kwargs = {
-            "source_url": source_blob_url,
-            "target_url": target_blob_url,
-            "target_language": translation_request.translation_config.target_language
-        }
+        await _run_translation_operation(job_id, inputs)
 
-        # Add optional source language
-        if translation_request.translation_config.source_language:
-            kwargs["source_language"] = translation_request.translation_config.source_language
+        logger.info(f"Translation job {job_id} completed with status: {job['status']}")
 
-        operation = await asyncio.to_thread(
-            client.begin_translation,
-            **kwargs
+    except Exception as e:
+        _mark_job_failed(job_id, e)
+
+def _pdf_part_names(job_id: str, part_count: int) -> List[str]:
+    """Source blob names of a split PDF's page-range parts, in page order"""
+    return [f"{PDF_PARTS_FOLDER}/{job_id}/part-{index:04d}.pdf" for index in range(part_count)]
+
+async def _merge_translated_parts(
+    source_blob_name: str,
+    language: str,
+    part_names: List[str],
+    documents: List[DocumentStatusDetail]
+) -> DocumentStatusDetail:
+    """Merge one language's translated parts back into a single PDF in page order"""
+    config = get_config()
+    by_part = {doc.source_blob: doc for doc in documents if (doc.target_language or "").lower() == language}
+    part_docs = [by_part.get(name) for name in part_names]
+
+    failed = [doc for doc in part_docs if doc is None or doc.status != "Succeeded" or not doc.target_blob]
+    if failed:
+        reasons = [doc.error_message for doc in failed if doc is not None and doc.error_message]
+        return DocumentStatusDetail(
+            source_blob=source_blob_name,
+            target_language=language,
+            status="Failed",
+            error_message=f"{len(failed)} of {len(part_names)} parts were not translated"
+            + (f": {reasons[0]}" if reasons else "")
         )
 
-        # Store operation details
-        job["azure_operation_id"] = operation.id if hasattr(operation, 'id') else None
+    contents = await asyncio.gather(*(
+        blob_storage.download_blob_bytes(doc.target_blob, config.target_container_name)
+        for doc in part_docs
+    ))
+    merged = await pdf_splitter.merge(list(contents))
+
+    target_blob_name = _target_blob_name(source_blob_name, language)
+    await blob_storage.upload_blob_bytes(
+        target_blob_name,
+        merged,
+        config.target_container_name,
+        content_type="application/pdf"
+    )
+    return DocumentStatusDetail(
+        source_blob=source_blob_name,
+        target_blob=target_blob_name,
+        target_language=language,
+        status="Succeeded",
+        characters_charged=sum(doc.characters_charged or 0 for doc in part_docs)
+    )
+
+async def _delete_pdf_parts(part_names: List[str], target_languages: List[str]) -> None:
+    """Remove a split job's intermediate part blobs (best effort; retention catches leftovers)"""
+    config = get_config()
+    deletions = [blob_storage.delete_blob(name, config.source_container_name) for name in part_names]
+    deletions.extend(
+        blob_storage.delete_blob(_target_blob_name(name, language), config.target_container_name)
+        for name in part_names
+        for language in target_languages
+    )
+    results = await asyncio.gather(*deletions, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        logger.warning(f"Failed to delete {len(errors)} PDF part blobs: {str(errors[0])}")
+
+async def _process_split_translation_job(job_id: str, translation_request: TranslationJobRequest):
+    """Background task translating a large PDF as page-range parts in one multi-document operation"""
+    try:
+        config = get_config()
+        job = translation_jobs[job_id]
+        translation_config = translation_request.translation_config
+        source_blob_name = translation_request.source_blob_name
 
-        # Wait for completion
-        result = await asyncio.to_thread(operation.result)
+        # Update job status
+        update_job(job_id, status=TranslationStatus.RUNNING)
+
+        content = await blob_storage.download_blob_bytes(source_blob_name, config.source_container_name)
+        page_count, parts = await pdf_splitter.split(content)
+        job["page_count"] = page_count
+        del content
+        if parts is None:
+            logger.info(f"Translation job {job_id} PDF is too short to split, translating it whole")
+            await _process_translation_job(job_id, translation_request)
+            return
+
+        part_names = _pdf_part_names(job_id, len(parts))
+        try:
+            await asyncio.gather(*(
+                blob_storage.upload_blob_bytes(
+                    name,
+                    part,
+                    config.source_container_name,
+                    content_type="application/pdf",
+                    metadata={"job_id": job_id}
+                )
+                for name, part in zip(part_names, parts)
+            ))
+            del parts
+
+            source_url, target_url = await blob_storage.get_container_sas_urls()
+            glossaries = await glossary_registry.translation_glossaries(
+                translation_config.glossary_ids,
+                translation_config.glossary_url
+            )
 
-        # Update job with results
-        if result:
-            job["status"] = TranslationStatus.COMPLETED
-            job["documents_completed"] = 1
-            job["target_blob"] = f"translated_{translation_request.source_blob_name}"
+            # Azure translates the parts concurrently; progress is reported per part meanwhile
+            result = await _submit_operation(
+                job_id,
+                _build_file_inputs(source_url, target_url, part_names, translation_config, glossaries)
+            )
+            if result is None:
+                return
+
+            documents = list(await asyncio.gather(*(
+                _merge_translated_parts(source_blob_name, language, part_names, result.documents)
+                for language in translation_config.target_languages
+            )))
+        finally:
+            await _delete_pdf_parts(part_names, translation_config.target_languages)
+
+        if job["status"] == TranslationStatus.CANCELLED:
+            return
+
+        # Report one merged document per language again instead of the parts
+        job["documents_total"] = len(documents)
+
+        succeeded = [doc for doc in documents if doc.status == "Succeeded"]
+        if succeeded:
+            _remember_translations(job_id, documents)
+            await _index_translated_documents(job_id, documents)
+            apply_document_statuses(
+                job_id,
+                documents,
+                status=TranslationStatus.COMPLETED,
+                target_blob=succeeded[0].target_blob
+            )
         else:
-            job["status"] = TranslationStatus.FAILED
-            job["documents_failed"] = 1
-            job["error_message"] = "Translation completed but no result returned"
+            apply_document_statuses(
+                job_id,
+                documents,
+                status=TranslationStatus.FAILED,
+                error_message=result.error_message or "No documents were translated"
+            )
 
-        job["updated_at"] = datetime.now(timezone.utc)
+        logger.info(f"Translation job {job_id} completed as {len(part_names)} PDF parts with status: {job['status']}")
 
-        logger.info(f"Translation job {job_id} completed with status: {job['status']}")
+    except Exception as e:
+        _mark_job_failed(job_id, e)
+
+async def _translate_text_document(
+    text: str,
+    text_type: str,
+    translation_config: DocumentTranslationRequest
+) -> Dict[str, str]:
+    """Translate a text document into every target language with one Text Translator call
+
+    The call goes through the translator's shared rate limiter and circuit breaker, so
+    UpstreamThrottledError propagates while the Translator is throttled or unavailable.
+    """
+    config = get_config()
+
+    params = [("api-version", "3.0"), ("textType", text_type)]
+    params.extend(("to", language) for language in translation_config.target_languages)
+    if translation_config.source_language:
+        params.append(("from", translation_config.source_language))
+    if translation_config.category:
+        params.append(("category", translation_config.category))
+
+    headers = security_manager.get_translator_headers()
+    response = await call_upstream(
+        "translator",
+        "translate_text",
+        lambda timeout: requests.post(
+            f"{config.translator_text_endpoint}/translate",
+            params=params,
+            headers=headers,
+            json=[{"text": text}],
+            timeout=timeout
+        ),
+        idempotent=True
+    )
+    response.raise_for_status()
+
+    translations = response.json()[0]["translations"]
+    return {translation["to"].lower(): translation["text"] for translation in translations}
+
+async def _process_fast_translation_job(job_id: str, translation_request: TranslationJobRequest):
+    """Background task translating a small text-like document in a single round trip"""
+    try:
+        config = get_config()
+        translation_config = translation_request.translation_config
+        source_blob_name = translation_request.source_blob_name
+
+        # Update job status
+        update_job(job_id, status=TranslationStatus.RUNNING)
+
+        content = await blob_storage.download_blob_bytes(source_blob_name, config.source_container_name)
+
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            text = None
+
+        # Anything the Text Translator cannot take goes through the batch API instead
+        if text is None or len(text) * len(translation_config.target_languages) > TEXT_TRANSLATOR_MAX_CHARACTERS:
+            logger.info(f"Translation job {job_id} not eligible for fast path, using batch translation")
+            await _process_translation_job(job_id, translation_request)
+            return
+
+        is_html = source_blob_name.lower().endswith(".html")
+        translations = await _translate_text_document(text, "html" if is_html else "plain", translation_config)
+
+        documents = []
+        for language in translation_config.target_languages:
+            target_blob_name = _target_blob_name(source_blob_name, language)
+            await blob_storage.upload_blob_bytes(
+                target_blob_name,
+                translations[language].encode("utf-8"),
+                config.target_container_name,
+                content_type="text/html; charset=utf-8" if is_html else "text/plain; charset=utf-8"
+            )
+            documents.append(DocumentStatusDetail(
+                source_blob=source_blob_name,
+                target_blob=target_blob_name,
+                target_language=language,
+                status="Succeeded",
+                characters_charged=len(text)
+            ))
+
+        # A cancelled job keeps its status; the uploaded targets are simply not reported
+        if translation_jobs[job_id]["status"] == TranslationStatus.CANCELLED:
+            return
+
+        # Update job with results
+        _remember_translations(job_id, documents)
+        await _index_translated_documents(job_id, documents)
+        apply_document_statuses(
+            job_id,
+            documents,
+            status=TranslationStatus.COMPLETED,
+            target_blob=documents[0].target_blob
+        )
+
+        logger.info(f"Translation job {job_id} completed via fast path")
 
     except Exception as e:
-        # Update job with error
-        job = translation_jobs.get(job_id, {})
-        job["status"] = TranslationStatus.FAILED
-        job["documents_failed"] = 1
-        job["error_message"] = str(e)
-        job["updated_at"] = datetime.now(timezone.utc)
+        _mark_job_failed(job_id, e)
 
-        logger.error(f"Translation job {job_id} failed: {str(e)}")
+async def _process_batch_translation_job(job_id: str, batch_request: BatchTranslationJobRequest, blob_names: List[str]):
+    """Background task to translate many documents in a single Azure operation"""
+    try:
+        job = translation_jobs[job_id]
 
-        # Security audit
-        security_manager.audit_log("translation_job_failed", {
-            "job_id": job_id,
-            "error": str(e)
-        })
\ No newline at end of file
+        # Update job status
+        update_job(job_id, status=TranslationStatus.RUNNING)
+
+        # Get container SAS URLs
+        source_url, target_url = await blob_storage.get_container_sas_urls()
+        glossaries = await glossary_registry.translation_glossaries(
+            batch_request.translation_config.glossary_ids,
+            batch_request.translation_config.glossary_url
+        )
+
+        inputs = _build_file_inputs(
+            source_url,
+            target_url,
+            blob_names,
+            batch_request.translation_config,
+            glossaries
+        )
+
+        await _run_translation_operation(job_id, inputs)
+
+        logger.info(
+            f"Batch translation job {job_id} finished with status: {job['status']} "
+            f"({job['documents_completed']}/{job['documents_total']} documents translated)"
+        )
+
+    except Exception as e:
+        _mark_job_failed(job_id, e)
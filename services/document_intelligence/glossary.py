@@ -0,0 +1,138 @@
+"""Glossary registry for Document Intelligence custom terminology"""
+import os
+import hashlib
+import logging
+from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timezone
+from azure.ai.translation.document import TranslationGlossary
+from azure.storage.blob import ContentSettings
+from fastapi import UploadFile
+
+from .config import get_config
+from .security import security_manager
+from .models import GlossaryResponse
+
+logger = logging.getLogger(__name__)
+
+# Glossary file formats accepted by Azure Document Translation, by extension
+GLOSSARY_FORMATS = {
+    ".tsv": "TSV",
+    ".tab": "TSV",
+    ".csv": "CSV",
+    ".xlf": "XLIFF",
+    ".xliff": "XLIFF"
+}
+
+# Azure Document Translation rejects glossaries larger than 10 MB
+MAX_GLOSSARY_SIZE_BYTES = 10 * 1024 * 1024
+
+class GlossaryRegistry:
+    """Stores glossaries once by content hash and resolves glossary IDs for translation requests"""
+
+    def __init__(self):
+        # glossary_id -> (blob name, file format); glossaries are immutable, so entries never go stale
+        self._known: Dict[str, Tuple[str, str]] = {}
+
+    async def register(self, file: UploadFile) -> GlossaryResponse:
+        """Store an uploaded glossary, reusing the existing copy if the same content was registered before"""
+        config = get_config()
+        extension = os.path.splitext(file.filename or "")[1].lower()
+        file_format = GLOSSARY_FORMATS.get(extension)
+        if file_format is None:
+            raise ValueError(
+                f"Unsupported glossary format: {file.filename}. "
+                f"Supported formats: {', '.join(sorted(GLOSSARY_FORMATS))}"
+            )
+
+        content = await file.read(MAX_GLOSSARY_SIZE_BYTES + 1)
+        if len(content) > MAX_GLOSSARY_SIZE_BYTES:
+            raise ValueError("Glossary too large. Maximum size: 10MB")
+        if not content:
+            raise ValueError("Glossary is empty")
+
+        glossary_id = hashlib.sha256(content).hexdigest()
+        existing = await self.resolve(glossary_id)
+        if existing is not None:
+            return GlossaryResponse(
+                glossary_id=glossary_id,
+                file_format=existing[1],
+                file_size=len(content),
+                original_filename=file.filename,
+                deduplicated=True
+            )
+
+        blob_name = f"{glossary_id}{extension}"
+        blob_client = security_manager.get_blob_service_client().get_blob_client(
+            container=config.glossary_container_name,
+            blob=blob_name
+        )
+        await blob_client.upload_blob(
+            content,
+            metadata={
+                "original_filename": file.filename,
+                "file_format": file_format,
+                "upload_timestamp": datetime.now(timezone.utc).isoformat()
+            },
+            content_settings=ContentSettings(content_type=file.content_type),
+            overwrite=True
+        )
+        self._known[glossary_id] = (blob_name, file_format)
+
+        # Audit log the registration
+        security_manager.audit_log("glossary_registered", {
+            "glossary_id": glossary_id,
+            "original_filename": file.filename,
+            "file_size": len(content)
+        })
+
+        return GlossaryResponse(
+            glossary_id=glossary_id,
+            file_format=file_format,
+            file_size=len(content),
+            original_filename=file.filename
+        )
+
+    async def resolve(self, glossary_id: str) -> Optional[Tuple[str, str]]:
+        """Blob name and file format of a registered glossary, or None if it is unknown"""
+        known = self._known.get(glossary_id)
+        if known is not None:
+            return known
+
+        # Registered by another process: one small prefix listing finds it
+        container_client = security_manager.get_blob_service_client().get_container_client(
+            get_config().glossary_container_name
+        )
+        async for blob in container_client.list_blobs(name_starts_with=glossary_id):
+            file_format = GLOSSARY_FORMATS.get(os.path.splitext(blob.name)[1].lower())
+            if file_format is not None and blob.name.startswith(f"{glossary_id}."):
+                self._known[glossary_id] = (blob.name, file_format)
+                return self._known[glossary_id]
+        return None
+
+    async def translation_glossaries(
+        self,
+        glossary_ids: Optional[List[str]],
+        glossary_url: Optional[str] = None
+    ) -> Optional[List[TranslationGlossary]]:
+        """Glossaries for begin_translation, signed with (cached) read SAS URLs"""
+        glossaries = []
+        for glossary_id in glossary_ids or []:
+            resolved = await self.resolve(glossary_id)
+            if resolved is None:
+                raise ValueError(f"Glossary '{glossary_id}' not found")
+            blob_name, file_format = resolved
+            glossary_url_signed = await security_manager.get_download_sas_url(
+                get_config().glossary_container_name,
+                blob_name
+            )
+            glossaries.append(TranslationGlossary(glossary_url_signed, file_format=file_format))
+
+        if glossary_url:
+            # Caller-hosted glossary; its URL must already grant read access
+            extension = os.path.splitext(glossary_url.split("?", 1)[0])[1].lower()
+            glossaries.append(TranslationGlossary(glossary_url, file_format=GLOSSARY_FORMATS.get(extension, "TSV")))
+
+        return glossaries or None
+
+# Global glossary registry instance
+glossary_registry = GlossaryRegistry()
@@ -0,0 +1,209 @@
+"""Translation job store and job event publishing for Document Intelligence"""
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Set, Tuple
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, unquote
+from fastapi.encoders import jsonable_encoder
+
+from .config import get_config
+from .models import TranslationStatus, DocumentStatusDetail, LanguageStatusDetail
+from .eta import throughput_model
+
+logger = logging.getLogger(__name__)
+
+# Job statuses that will not change any more
+TERMINAL_JOB_STATUSES = {TranslationStatus.COMPLETED, TranslationStatus.FAILED, TranslationStatus.CANCELLED}
+
+# Azure per-document statuses that will not change any more
+TERMINAL_DOCUMENT_STATUSES = {"Succeeded", "Failed", "Cancelled", "ValidationFailed"}
+
+# Events buffered per subscriber before the oldest ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# In-memory job storage (in production, use Redis or database)
+translation_jobs: Dict[str, Dict[str, Any]] = {}
+
+class JobEventBus:
+    """In-process pub/sub for translation job updates"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Register a subscriber queue for a job's events"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue"""
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[job_id]
+
+    def publish(self, job_id: str, event: str, data: Dict[str, Any]) -> None:
+        """Deliver an event to every subscriber of a job without blocking the publisher"""
+        for queue in self._subscribers.get(job_id, ()):
+            if queue.full():
+                # A slow consumer loses its oldest event rather than stalling job processing
+                queue.get_nowait()
+            queue.put_nowait((event, data))
+
+    def subscriber_count(self, job_id: str) -> int:
+        """Number of active subscribers for a job"""
+        return len(self._subscribers.get(job_id, ()))
+
+# Global job event bus instance
+job_events = JobEventBus()
+
+def calculate_progress(job: Dict[str, Any]) -> float:
+    """Percentage of documents that reached a final state"""
+    total = job["documents_total"]
+    finished = job["documents_completed"] + job["documents_failed"]
+    return min(finished / total * 100, 100.0) if total > 0 else 0.0
+
+def job_status_payload(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact status summary published on every job update"""
+    return jsonable_encoder({
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "progress_percentage": calculate_progress(job),
+        "documents_total": job["documents_total"],
+        "documents_completed": job["documents_completed"],
+        "documents_failed": job["documents_failed"],
+        "updated_at": job["updated_at"],
+        "error_message": job["error_message"]
+    })
+
+def job_completion_payload(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Final job summary including per-document and per-language results"""
+    payload = job_status_payload(job)
+    payload.update(jsonable_encoder({
+        "target_blob": job["target_blob"],
+        "documents": job["documents"],
+        "languages": job["languages"]
+    }))
+    return payload
+
+def _leaves_terminal_status(job: Dict[str, Any], changes: Dict[str, Any]) -> bool:
+    """Whether changes would move a finished (e.g. cancelled) job to another status"""
+    return job["status"] in TERMINAL_JOB_STATUSES and changes.get("status", job["status"]) != job["status"]
+
+def update_job(job_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+    """Apply changes to a job record and publish them to subscribers
+
+    A job never leaves a terminal status: late writes from a processor that was
+    still working when the job was cancelled are dropped.
+    """
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return None
+
+    previous_status = job["status"]
+    if _leaves_terminal_status(job, changes):
+        logger.info(f"Ignoring {changes['status']} update for job {job_id} already {previous_status}")
+        return job
+    job.update(changes)
+    job["updated_at"] = datetime.now(timezone.utc)
+
+    # Processing time (not queue time) is what the throughput model learns from
+    if job["status"] == TranslationStatus.RUNNING and job.get("started_at") is None:
+        job["started_at"] = job["updated_at"]
+    elif job["status"] == TranslationStatus.COMPLETED and previous_status != TranslationStatus.COMPLETED:
+        throughput_model.observe(job)
+
+    if job["status"] in TERMINAL_JOB_STATUSES:
+        job_events.publish(job_id, "completed", job_completion_payload(job))
+    else:
+        job_events.publish(job_id, "status", job_status_payload(job))
+    return job
+
+def update_job_documents(job_id: str, documents: List[DocumentStatusDetail]) -> None:
+    """Replace a job's per-document view, publishing each document whose status changed"""
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return
+
+    previous: Dict[Tuple[str, Optional[str]], str] = {
+        (doc.source_blob, doc.target_language): doc.status for doc in job["documents"]
+    }
+    job["documents"] = documents
+
+    for doc in documents:
+        if previous.get((doc.source_blob, doc.target_language)) != doc.status:
+            job_events.publish(job_id, "document", jsonable_encoder(doc))
+
+def blob_name_from_url(blob_url: Optional[str], container_name: str) -> Optional[str]:
+    """Extract the blob name from a (possibly SAS-signed) blob URL"""
+    if not blob_url:
+        return None
+    path = unquote(urlsplit(blob_url).path).lstrip("/")
+    container_prefix = f"{container_name}/"
+    return path[len(container_prefix):] if path.startswith(container_prefix) else path
+
+def to_document_detail(document: Any) -> DocumentStatusDetail:
+    """Convert an Azure DocumentStatus into the service's per-document model"""
+    config = get_config()
+    error = getattr(document, "error", None)
+    return DocumentStatusDetail(
+        source_blob=blob_name_from_url(document.source_document_url, config.source_container_name) or "",
+        target_blob=blob_name_from_url(document.translated_document_url, config.target_container_name),
+        target_language=document.translated_to,
+        status=document.status,
+        characters_charged=document.characters_charged or 0,
+        error_message=error.message if error else None
+    )
+
+def apply_document_statuses(job_id: str, documents: List[DocumentStatusDetail], **changes: Any) -> None:
+    """Replace the job's per-document view and derive its counters from it"""
+    job = translation_jobs[job_id]
+    if _leaves_terminal_status(job, changes):
+        return
+    update_job_documents(job_id, documents)
+    update_job(
+        job_id,
+        documents_total=max(len(documents), job["documents_total"]),
+        documents_completed=sum(1 for doc in documents if doc.status == "Succeeded"),
+        documents_failed=sum(
+            1 for doc in documents
+            if doc.status in TERMINAL_DOCUMENT_STATUSES and doc.status != "Succeeded"
+        ),
+        languages=summarize_languages(job["target_languages"], documents),
+        **changes
+    )
+
+def summarize_languages(
+    target_languages: List[str],
+    documents: List[DocumentStatusDetail]
+) -> List[LanguageStatusDetail]:
+    """Aggregate per-document results into one status per target language"""
+    summaries = []
+    for language in target_languages:
+        language_docs = [doc for doc in documents if (doc.target_language or "").lower() == language]
+        completed = [doc for doc in language_docs if doc.status == "Succeeded"]
+        failed = [
+            doc for doc in language_docs
+            if doc.status in TERMINAL_DOCUMENT_STATUSES and doc.status != "Succeeded"
+        ]
+
+        if language_docs and len(completed) + len(failed) < len(language_docs):
+            status = TranslationStatus.RUNNING
+        elif completed:
+            status = TranslationStatus.COMPLETED
+        elif failed:
+            status = TranslationStatus.FAILED
+        else:
+            status = TranslationStatus.PENDING
+
+        summaries.append(LanguageStatusDetail(
+            target_language=language,
+            status=status,
+            documents_completed=len(completed),
+            documents_failed=len(failed),
+            target_blobs=[doc.target_blob for doc in completed if doc.target_blob]
+        ))
+    return summaries
@@ -0,0 +1,109 @@
+"""Cached Translator supported-languages list for Document Intelligence"""
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from typing import Optional, Dict, Any, Tuple, FrozenSet
+import requests
+
+from upstream import call_upstream
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Scopes published by the Translator /languages endpoint
+LANGUAGE_SCOPES = ("translation", "transliteration", "dictionary")
+
+class SupportedLanguagesCache:
+    """In-memory copy of the Translator languages list, revalidated upstream with its ETag"""
+
+    def __init__(self):
+        self._data: Optional[Dict[str, Any]] = None
+        self._upstream_etag: Optional[str] = None
+        self._fetched_at: float = 0.0
+        self._scoped: Dict[FrozenSet[str], Tuple[Dict[str, Any], str]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the list was last confirmed upstream"""
+        return time.time() - self._fetched_at if self._data is not None else None
+
+    async def get(self, scopes: FrozenSet[str]) -> Tuple[Dict[str, Any], str]:
+        """Languages for the requested scopes and their ETag, fetching once if nothing is cached"""
+        if self._data is None:
+            async with self._lock:
+                if self._data is None:
+                    await self._refresh()
+
+        scoped = self._scoped.get(scopes)
+        if scoped is None:
+            payload = {scope: self._data.get(scope) for scope in LANGUAGE_SCOPES if scope in scopes}
+            body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            scoped = (payload, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+            self._scoped[scopes] = scoped
+        return scoped
+
+    async def refresh(self) -> None:
+        """Revalidate the cached list with the Translator service"""
+        async with self._lock:
+            await self._refresh()
+
+    async def run_refresh(self) -> None:
+        """Background loop revalidating the list (runs for the life of the app)"""
+        interval = get_config().languages_refresh_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the cached copy; the next cycle tries again
+                logger.warning(f"Supported languages revalidation failed: {str(e)}")
+
+    async def _refresh(self) -> None:
+        """Conditional GET of the languages list; a 304 keeps the cached copy"""
+        config = get_config()
+        headers = {}
+        if self._data is not None and self._upstream_etag:
+            headers["If-None-Match"] = self._upstream_etag
+
+        # While the translator's circuit is open this fails fast and the cached copy stays in use
+        response = await call_upstream(
+            "translator",
+            "languages",
+            lambda timeout: requests.get(
+                f"{config.translator_text_endpoint}/languages",
+                params={"api-version": "3.0", "scope": ",".join(LANGUAGE_SCOPES)},
+                headers=headers,
+                timeout=timeout
+            ),
+            idempotent=True
+        )
+
+        if response.status_code == 304:
+            self._fetched_at = time.time()
+            return
+
+        response.raise_for_status()
+        self._data = response.json()
+        self._upstream_etag = response.headers.get("ETag")
+        self._fetched_at = time.time()
+        self._scoped.clear()
+        logger.info("Supported languages list refreshed")
+
+def parse_scopes(scope: Optional[str]) -> FrozenSet[str]:
+    """Parse a comma-separated scope parameter (defaults to every scope)"""
+    if not scope:
+        return frozenset(LANGUAGE_SCOPES)
+
+    scopes = frozenset(part.strip().lower() for part in scope.split(",") if part.strip())
+    unknown = scopes - set(LANGUAGE_SCOPES)
+    if unknown or not scopes:
+        raise ValueError(
+            f"Invalid scope '{scope}'. Supported scopes: {', '.join(LANGUAGE_SCOPES)}"
+        )
+    return scopes
+
+# Global supported languages cache instance
+supported_languages = SupportedLanguagesCache()
@@ -4,6 +4,15 @@ from datetime import datetime
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
+# Azure Document Translation accepts at most 1000 documents per batch request
+MAX_DOCUMENTS_PER_BATCH = 1000
+
+# Azure Document Translation accepts at most 10 targets per source input
+MAX_TARGETS_PER_DOCUMENT = 10
+
+# Registered glossaries one translation request may reference
+MAX_GLOSSARIES_PER_REQUEST = 10
+
 class TranslationStatus(str, Enum):
     """Translation job status enumeration"""
     PENDING = "pending"
@@ -12,19 +21,56 @@ class TranslationStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+class TranslationJobType(str, Enum):
+    """Translation job type enumeration"""
+    SINGLE = "single"
+    BATCH = "batch"
+
 class DocumentTranslationRequest(BaseModel):
     """Request model for document translation"""
-    target_language: str = Field(..., description="Target language code (e.g., 'es', 'fr', 'de')")
+    target_language: Optional[str] = Field(None, description="Target language code (e.g., 'es', 'fr', 'de')")
+    target_languages: Optional[List[str]] = Field(None, description="Target language codes, all translated in one operation")
     source_language: Optional[str] = Field(None, description="Source language code (auto-detect if not provided)")
     glossary_url: Optional[str] = Field(None, description="URL to custom glossary file")
+    glossary_ids: Optional[List[str]] = Field(None, description="IDs of glossaries registered with POST /glossaries")
     category: Optional[str] = Field(None, description="Category ID for custom models")
 
     @validator('target_language')
     def validate_target_language(cls, v):
         """Validate target language format"""
-        if not v or len(v) < 2:
+        if v is not None and len(v) < 2:
             raise ValueError("Target language must be at least 2 characters")
-        return v.lower()
+        return v.lower() if v else v
+
+    @validator('target_languages', always=True)
+    def validate_target_languages(cls, v, values):
+        """Merge target_language into target_languages so the list is always complete"""
+        languages = list(v or [])
+        if values.get('target_language'):
+            languages.insert(0, values['target_language'])
+
+        for language in languages:
+            if not language or len(language) < 2:
+                raise ValueError("Target language must be at least 2 characters")
+
+        languages = list(dict.fromkeys(language.lower() for language in languages))
+        if not languages:
+            raise ValueError("Provide target_language or target_languages")
+        if len(languages) > MAX_TARGETS_PER_DOCUMENT:
+            raise ValueError(f"At most {MAX_TARGETS_PER_DOCUMENT} target languages are supported")
+        return languages
+
+    @validator('glossary_ids')
+    def validate_glossary_ids(cls, v):
+        """Validate glossary ID format (SHA-256 hex digests)"""
+        if v is not None:
+            v = list(dict.fromkeys(glossary_id.lower() for glossary_id in v))
+            if len(v) > MAX_GLOSSARIES_PER_REQUEST:
+                raise ValueError(f"At most {MAX_GLOSSARIES_PER_REQUEST} glossaries can be referenced")
+            for glossary_id in v:
+                if len(glossary_id) != 64 or any(c not in "0123456789abcdef" for c in glossary_id):
+                    raise ValueError(f"Invalid glossary ID: {glossary_id}")
+        return v or None
 
     @validator('source_language')
     def validate_source_language(cls, v):
@@ -33,6 +79,23 @@ class DocumentTranslationRequest(BaseModel):
             raise ValueError("Source language must be at least 2 characters")
         return v.lower() if v else v
 
+class DocumentStatusDetail(BaseModel):
+    """Per-document status within a translation operation"""
+    source_blob: str
+    target_blob: Optional[str] = None
+    target_language: Optional[str] = None
+    status: str
+    characters_charged: int = 0
+    error_message: Optional[str] = None
+
+class LanguageStatusDetail(BaseModel):
+    """Aggregated status for one target language of a translation job"""
+    target_language: str
+    status: TranslationStatus
+    documents_completed: int = 0
+    documents_failed: int = 0
+    target_blobs: List[str] = Field(default_factory=list)
+
 class DocumentUploadResponse(BaseModel):
     """Response model for document upload"""
     success: bool
@@ -42,10 +105,13 @@ class DocumentUploadResponse(BaseModel):
     file_size: int
     content_type: str
     message: str
+    content_hash: Optional[str] = None
+    deduplicated: bool = False
 
 class TranslationJobResponse(BaseModel):
     """Response model for translation job"""
     job_id: str
+    job_type: TranslationJobType = TranslationJobType.SINGLE
     status: TranslationStatus
     source_container: str
     target_container: str
@@ -53,17 +119,100 @@ class TranslationJobResponse(BaseModel):
     target_blob: Optional[str] = None
     source_language: Optional[str] = None
     target_language: str
+    target_languages: List[str] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
     documents_total: int = 0
     documents_completed: int = 0
     documents_failed: int = 0
+    documents: List[DocumentStatusDetail] = Field(default_factory=list)
+    languages: List[LanguageStatusDetail] = Field(default_factory=list)
+    queue_position: Optional[int] = None
+    cache_hit: bool = False
     error_message: Optional[str] = None
 
 class TranslationJobRequest(BaseModel):
     """Request model for starting translation job"""
     source_blob_name: str = Field(..., description="Name of the source document blob")
     translation_config: DocumentTranslationRequest = Field(..., description="Translation configuration")
+    priority: int = Field(0, ge=0, le=9, description="Scheduling priority class (0 runs first)")
+    split_pdf: bool = Field(False, description="Translate a large PDF as page ranges in parallel and merge the results")
+
+class BatchTranslationJobRequest(BaseModel):
+    """Request model for translating many documents in a single Azure operation"""
+    blob_names: Optional[List[str]] = Field(None, description="Names of the source document blobs")
+    prefix: Optional[str] = Field(None, description="Translate every source blob whose name starts with this prefix")
+    translation_config: DocumentTranslationRequest = Field(..., description="Translation configuration")
+    priority: int = Field(0, ge=0, le=9, description="Scheduling priority class (0 runs first)")
+
+    @validator('blob_names')
+    def validate_blob_names(cls, v):
+        """Validate the explicit document list"""
+        if v is not None:
+            if not v:
+                raise ValueError("blob_names must not be empty")
+            if len(v) > MAX_DOCUMENTS_PER_BATCH:
+                raise ValueError(f"A batch can contain at most {MAX_DOCUMENTS_PER_BATCH} documents")
+            v = list(dict.fromkeys(v))  # Drop duplicates, keep order
+        return v
+
+    @validator('prefix', always=True)
+    def validate_selection(cls, v, values):
+        """Require exactly one of blob_names or prefix"""
+        if (v is None) == (values.get('blob_names') is None):
+            raise ValueError("Provide exactly one of 'blob_names' or 'prefix'")
+        return v
+
+class BulkCopyRequest(BaseModel):
+    """Request model for server-side copies between the service containers"""
+    blob_names: Optional[List[str]] = Field(None, description="Names of the blobs to copy")
+    prefix: Optional[str] = Field(None, description="Copy every blob whose name starts with this prefix")
+    source_container: Optional[str] = Field(None, description="Container to copy from (default: source container)")
+    target_container: Optional[str] = Field(None, description="Container to copy to (default: target container)")
+    target_prefix: str = Field("", description="Prefix prepended to every copied blob name")
+
+    @validator('blob_names')
+    def validate_blob_names(cls, v):
+        """Validate the explicit blob list"""
+        if v is not None:
+            if not v:
+                raise ValueError("blob_names must not be empty")
+            if len(v) > MAX_DOCUMENTS_PER_BATCH:
+                raise ValueError(f"A copy request can contain at most {MAX_DOCUMENTS_PER_BATCH} blobs")
+            v = list(dict.fromkeys(v))  # Drop duplicates, keep order
+        return v
+
+    @validator('prefix', always=True)
+    def validate_selection(cls, v, values):
+        """Require exactly one of blob_names or prefix"""
+        if (v is None) == (values.get('blob_names') is None):
+            raise ValueError("Provide exactly one of 'blob_names' or 'prefix'")
+        return v
+
+class BlobCopyResult(BaseModel):
+    """Outcome of one server-side blob copy"""
+    source_blob: str
+    target_blob: str
+    status: str  # success, failed, aborted or timeout
+    error_message: Optional[str] = None
+
+class BulkCopyResponse(BaseModel):
+    """Response model for a bulk copy"""
+    source_container: str
+    target_container: str
+    copies_total: int
+    copies_succeeded: int
+    copies_failed: int
+    duration_seconds: float
+    copies: List[BlobCopyResult]
+
+class GlossaryResponse(BaseModel):
+    """Response model for glossary registration"""
+    glossary_id: str
+    file_format: str
+    file_size: int
+    original_filename: Optional[str] = None
+    deduplicated: bool = False
 
 class DownloadResponse(BaseModel):
     """Response model for document download"""
@@ -74,6 +223,21 @@ class DownloadResponse(BaseModel):
     file_size: int
     content_type: str
 
+class BlobInfo(BaseModel):
+    """A blob in one of the service containers"""
+    name: str
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+    content_type: Optional[str] = None
+    metadata: Optional[Dict[str, str]] = None
+
+class BlobListResponse(BaseModel):
+    """One page of a blob listing"""
+    container_name: str
+    blobs: List[BlobInfo]
+    continuation_token: Optional[str] = None
+
 class JobStatusResponse(BaseModel):
     """Response model for job status check"""
     job_id: str
@@ -86,10 +250,15 @@ class JobStatusResponse(BaseModel):
     updated_at: datetime
     estimated_completion: Optional[datetime] = None
     error_details: Optional[List[str]] = None
+    documents: Optional[List[DocumentStatusDetail]] = None
+    languages: Optional[List[LanguageStatusDetail]] = None
+    queue_position: Optional[int] = None
+    suggested_poll_seconds: Optional[float] = None
+    cache_hit: bool = False
 
 class SupportedLanguagesResponse(BaseModel):
     """Response model for supported languages"""
-    translation: Dict[str, Dict[str, Any]]
+    translation: Optional[Dict[str, Dict[str, Any]]] = None
     transliteration: Optional[Dict[str, Dict[str, Any]]] = None
     dictionary: Optional[Dict[str, Dict[str, Any]]] = None
 
@@ -101,6 +270,18 @@ class ErrorResponse(BaseModel):
     details: Optional[Dict[str, Any]] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+class RetentionCleanupResult(BaseModel):
+    """Outcome and throughput of a retention cleanup run"""
+    days_old: int
+    containers: List[str]
+    blobs_scanned: int = 0
+    blobs_deleted: int = 0
+    blobs_failed: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+    blobs_per_second: float = 0.0
+    finished_at: datetime = Field(default_factory=datetime.utcnow)
+
 class HealthCheckResponse(BaseModel):
     """Health check response model"""
     service: str = "Document Intelligence"
@@ -111,6 +292,7 @@ class HealthCheckResponse(BaseModel):
     managed_identity_enabled: bool
     supported_formats: List[str]
     max_file_size_mb: int
+    last_retention: Optional[RetentionCleanupResult] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 class FileValidationResponse(BaseModel):
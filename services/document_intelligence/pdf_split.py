@@ -0,0 +1,88 @@
+"""Page-range splitting and merging of large PDFs for parallel translation"""
+import io
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# pypdf is optional; without it split requests fall back to whole-document translation
+try:
+    from pypdf import PdfReader, PdfWriter
+    PDF_SPLIT_AVAILABLE = True
+except ImportError:
+    PDF_SPLIT_AVAILABLE = False
+
+def split_pdf(content: bytes, pages_per_part: int, min_pages: int) -> Tuple[int, Optional[List[bytes]]]:
+    """Page count and consecutive page-range parts of a PDF; no parts if it has fewer than min_pages pages
+
+    Runs in a worker process, so it only takes and returns picklable values.
+    """
+    reader = PdfReader(io.BytesIO(content))
+    page_count = len(reader.pages)
+    if page_count < max(min_pages, 2):
+        return page_count, None
+
+    parts = []
+    for start in range(0, page_count, pages_per_part):
+        writer = PdfWriter()
+        for page_number in range(start, min(start + pages_per_part, page_count)):
+            writer.add_page(reader.pages[page_number])
+        output = io.BytesIO()
+        writer.write(output)
+        parts.append(output.getvalue())
+    return page_count, parts
+
+def merge_pdfs(parts: List[bytes]) -> bytes:
+    """Concatenate PDFs in the given order (runs in a worker process)"""
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(io.BytesIO(part)))
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+class PdfSplitter:
+    """Runs PDF splitting and merging in a process pool so CPU-bound page work stays off the event loop"""
+
+    def __init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether pypdf is installed"""
+        return PDF_SPLIT_AVAILABLE
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Worker processes, started on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=get_config().pdf_split_processes)
+        return self._pool
+
+    async def split(self, content: bytes) -> Tuple[int, Optional[List[bytes]]]:
+        """Page count and page-range parts of a PDF (None if it is too short to be worth splitting)"""
+        config = get_config()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.pool,
+            split_pdf,
+            content,
+            config.pdf_split_pages_per_part,
+            config.pdf_split_min_pages
+        )
+
+    async def merge(self, parts: List[bytes]) -> bytes:
+        """One PDF made of the parts in order"""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, merge_pdfs, parts)
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# Global PDF splitter instance
+pdf_splitter = PdfSplitter()
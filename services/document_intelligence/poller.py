@@ -0,0 +1,230 @@
+"""Central poller for in-flight Azure Document Translation operations"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional, Dict, List
+from azure.ai.translation.document.aio import DocumentTranslationClient
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceNotFoundError
+
+from .config import get_config
+from .models import TranslationStatus, DocumentStatusDetail
+from .jobs import translation_jobs, to_document_detail, apply_document_statuses
+
+logger = logging.getLogger(__name__)
+
+# Azure operation statuses that will not change any more
+TERMINAL_OPERATION_STATUSES = {"Succeeded", "Failed", "Cancelled", "ValidationFailed"}
+
+# Polling interval bounds in seconds
+MIN_POLL_INTERVAL_SECONDS = 2.0
+MAX_POLL_INTERVAL_SECONDS = 60.0
+
+# Extra seconds between checks per MB of source content
+POLL_SECONDS_PER_MB = 0.5
+
+# Age (seconds) after which the base interval has doubled
+POLL_BACKOFF_AGE_SECONDS = 300.0
+
+# Maximum number of status checks sent to Azure at the same time
+MAX_CONCURRENT_CHECKS = 16
+
+# Consecutive failed status checks after which an operation is given up as failed
+MAX_CONSECUTIVE_CHECK_FAILURES = 10
+
+# Seconds after which an operation that has not finished is given up as failed
+OPERATION_DEADLINE_SECONDS = 6 * 3600
+
+@dataclass
+class OperationResult:
+    """Final state of a translation operation"""
+    status: str
+    documents: List[DocumentStatusDetail]
+    error_message: Optional[str] = None
+
+@dataclass
+class TrackedOperation:
+    """An in-flight translation operation watched by the poller"""
+    job_id: str
+    operation_id: str
+    source_bytes: int
+    started_at: float
+    next_check_at: float
+    future: asyncio.Future
+    documents_finished: int = -1
+    check_failures: int = 0
+
+    def poll_interval(self, now: float) -> float:
+        """Adaptive delay: larger documents and older operations are checked less often"""
+        size_mb = self.source_bytes / (1024 * 1024)
+        base = MIN_POLL_INTERVAL_SECONDS + size_mb * POLL_SECONDS_PER_MB
+        age_factor = 1 + (now - self.started_at) / POLL_BACKOFF_AGE_SECONDS
+        return min(base * age_factor, MAX_POLL_INTERVAL_SECONDS)
+
+class TranslationOperationPoller:
+    """Tracks every in-flight translation operation from a single background task"""
+
+    def __init__(self):
+        self._operations: Dict[str, TrackedOperation] = {}
+        self._client: Optional[DocumentTranslationClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._check_slots = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+
+    @property
+    def client(self) -> DocumentTranslationClient:
+        """Shared async Document Translation client"""
+        if self._client is None:
+            config = get_config()
+            self._client = DocumentTranslationClient(
+                endpoint=config.translator_endpoint,
+                credential=AzureKeyCredential(config.translator_api_key)
+            )
+        return self._client
+
+    @property
+    def in_flight(self) -> int:
+        """Number of operations currently tracked"""
+        return len(self._operations)
+
+    async def start(self) -> None:
+        """Start the polling task (called at application startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and close the translation client"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        for tracked in self._operations.values():
+            if not tracked.future.done():
+                tracked.future.cancel()
+        self._operations.clear()
+
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def track(self, job_id: str, operation_id: str, source_bytes: int = 0) -> "asyncio.Future[OperationResult]":
+        """Watch an operation; the returned future resolves once it reaches a final state"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        tracked = TrackedOperation(
+            job_id=job_id,
+            operation_id=operation_id,
+            source_bytes=source_bytes,
+            started_at=now,
+            next_check_at=now + MIN_POLL_INTERVAL_SECONDS,
+            future=loop.create_future()
+        )
+        self._operations[operation_id] = tracked
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+        return tracked.future
+
+    def _give_up(self, tracked: TrackedOperation, reason: str) -> None:
+        """Stop watching an operation that will not resolve, reporting it as failed to its waiter"""
+        logger.error(f"Giving up on translation operation {tracked.operation_id}: {reason}")
+        self._operations.pop(tracked.operation_id, None)
+        if not tracked.future.done():
+            tracked.future.set_result(OperationResult(status="Failed", documents=[], error_message=reason))
+
+    def untrack(self, operation_id: str) -> None:
+        """Stop watching an operation, resolving its waiter as cancelled"""
+        tracked = self._operations.pop(operation_id, None)
+        if tracked is not None and not tracked.future.done():
+            tracked.future.set_result(OperationResult(status="Cancelled", documents=[]))
+
+    async def _run(self) -> None:
+        """Check due operations, then sleep until the next one is due or a new one arrives"""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            due = [tracked for tracked in self._operations.values() if tracked.next_check_at <= now]
+            if due:
+                await asyncio.gather(*(self._check(tracked) for tracked in due))
+
+            now = loop.time()
+            next_due = min((tracked.next_check_at for tracked in self._operations.values()), default=None)
+            timeout = None if next_due is None else max(next_due - now, 0)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, tracked: TrackedOperation) -> None:
+        """Refresh one operation's status and publish any progress"""
+        loop = asyncio.get_running_loop()
+        try:
+            job = translation_jobs.get(tracked.job_id)
+            if job is None or job["status"] == TranslationStatus.CANCELLED:
+                self.untrack(tracked.operation_id)
+                return
+
+            async with self._check_slots:
+                status = await self.client.get_translation_status(tracked.operation_id)
+
+                finished = (
+                    status.documents_succeeded_count
+                    + status.documents_failed_count
+                    + status.documents_cancelled_count
+                )
+                is_final = status.status in TERMINAL_OPERATION_STATUSES
+
+                # The document list is only read when something actually changed
+                if finished != tracked.documents_finished or is_final:
+                    documents = await self._list_documents(tracked.operation_id)
+                    tracked.documents_finished = finished
+                    if not is_final:
+                        apply_document_statuses(tracked.job_id, documents)
+
+            if is_final:
+                self._operations.pop(tracked.operation_id, None)
+                error = getattr(status, "error", None)
+                if not tracked.future.done():
+                    tracked.future.set_result(OperationResult(
+                        status=status.status,
+                        documents=documents,
+                        error_message=error.message if error else None
+                    ))
+                return
+            tracked.check_failures = 0
+
+        except ResourceNotFoundError:
+            self._give_up(tracked, "Translation operation no longer exists")
+            return
+        except Exception as e:
+            tracked.check_failures += 1
+            logger.warning(
+                f"Status check for translation operation {tracked.operation_id} failed "
+                f"({tracked.check_failures}/{MAX_CONSECUTIVE_CHECK_FAILURES}): {str(e)}"
+            )
+            if tracked.check_failures >= MAX_CONSECUTIVE_CHECK_FAILURES:
+                self._give_up(tracked, f"Status checks failed {tracked.check_failures} times in a row: {str(e)}")
+                return
+
+        now = loop.time()
+        if now - tracked.started_at > OPERATION_DEADLINE_SECONDS:
+            self._give_up(tracked, f"Translation did not finish within {OPERATION_DEADLINE_SECONDS // 3600} hours")
+            return
+        tracked.next_check_at = now + tracked.poll_interval(now)
+
+    async def _list_documents(self, operation_id: str) -> List[DocumentStatusDetail]:
+        """Read an operation's per-document statuses"""
+        documents = [
+            to_document_detail(document)
+            async for document in self.client.list_document_statuses(operation_id)
+        ]
+        documents.sort(key=lambda doc: (doc.source_blob, doc.target_language or ""))
+        return documents
+
+# Global translation operation poller instance
+translation_poller = TranslationOperationPoller()
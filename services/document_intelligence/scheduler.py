@@ -0,0 +1,165 @@
+"""Bounded, prioritized worker pool for translation jobs"""
+import asyncio
+import heapq
+import itertools
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Set, Callable, Awaitable
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Queue wait one MB of source content is worth: within a priority class a job runs ahead of
+# a newer job once it has waited this many seconds per MB longer than the newer job is small
+QUEUE_SECONDS_PER_MB = 2.0
+
+def queue_rank(enqueued_at: float, source_bytes: int) -> float:
+    """Rank within a priority class (lower runs first): enqueue time plus a size handicap
+
+    Because the handicap is fixed while newer jobs arrive with later enqueue times, a
+    waiting job's rank improves relative to every newcomer, so large jobs cannot starve.
+    """
+    return enqueued_at + source_bytes / (1024 * 1024) * QUEUE_SECONDS_PER_MB
+
+class QueueFullError(Exception):
+    """Raised when the translation queue cannot accept more jobs"""
+
+@dataclass(order=True)
+class QueuedJob:
+    """A translation job waiting for a worker; ordering decides who runs first"""
+    priority: int
+    rank: float
+    sequence: int
+    job_id: str = field(compare=False)
+    run: Callable[[], Awaitable[None]] = field(compare=False)
+    source_bytes: int = field(default=0, compare=False)
+
+class TranslationScheduler:
+    """Runs translation jobs on a fixed number of workers, highest priority first, then by aged size"""
+
+    def __init__(self):
+        self._heap: List[QueuedJob] = []
+        self._queued: Dict[str, QueuedJob] = {}
+        self._running: Set[str] = set()
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return len(self._queued)
+
+    @property
+    def running_count(self) -> int:
+        """Number of jobs currently held by a worker"""
+        return len(self._running)
+
+    @property
+    def running_job_ids(self) -> List[str]:
+        """Jobs currently held by a worker"""
+        return list(self._running)
+
+    @property
+    def worker_count(self) -> int:
+        """Configured number of workers"""
+        return get_config().translation_workers
+
+    async def start(self) -> None:
+        """Start the worker tasks (called at application startup)"""
+        if self._workers:
+            return
+        for index in range(self.worker_count):
+            self._workers.append(asyncio.create_task(self._worker(index)))
+        logger.info(f"Translation scheduler started with {len(self._workers)} workers")
+
+    async def stop(self) -> None:
+        """Stop all workers; queued jobs are dropped"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._heap.clear()
+        self._queued.clear()
+
+    async def submit(
+        self,
+        job_id: str,
+        run: Callable[[], Awaitable[None]],
+        priority: int = 0,
+        source_bytes: int = 0
+    ) -> int:
+        """Queue a job and return its queue position (1-based)"""
+        if len(self._queued) >= get_config().translation_queue_max_size:
+            raise QueueFullError("Translation queue is full, try again later")
+
+        if not self._workers:
+            await self.start()
+
+        queued = QueuedJob(
+            priority,
+            queue_rank(time.monotonic(), source_bytes),
+            next(self._sequence),
+            job_id,
+            run,
+            source_bytes
+        )
+        async with self._changed:
+            heapq.heappush(self._heap, queued)
+            self._queued[job_id] = queued
+            self._changed.notify()
+
+        return self.queue_position(job_id)
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position of a waiting job, or None if it is not queued"""
+        queued = self._queued.get(job_id)
+        if queued is None:
+            return None
+        return 1 + sum(1 for other in self._queued.values() if other < queued)
+
+    def jobs_ahead(self, job_id: str) -> List[str]:
+        """Waiting jobs that will run before the given one, in run order"""
+        queued = self._queued.get(job_id)
+        if queued is None:
+            return []
+        return [other.job_id for other in sorted(self._queued.values()) if other < queued]
+
+    def is_queued(self, job_id: str) -> bool:
+        """Check if a job is still waiting for a worker"""
+        return job_id in self._queued
+
+    def cancel_queued(self, job_id: str) -> bool:
+        """Remove a waiting job; returns False if it already left the queue"""
+        # The heap entry is skipped lazily when a worker reaches it
+        return self._queued.pop(job_id, None) is not None
+
+    async def _next_job(self) -> QueuedJob:
+        """Wait for the best queued job that has not been cancelled"""
+        async with self._changed:
+            while True:
+                while self._heap:
+                    queued = heapq.heappop(self._heap)
+                    if self._queued.get(queued.job_id) is queued:
+                        del self._queued[queued.job_id]
+                        return queued
+                await self._changed.wait()
+
+    async def _worker(self, index: int) -> None:
+        """Run jobs one at a time until cancelled"""
+        while True:
+            queued = await self._next_job()
+            self._running.add(queued.job_id)
+            try:
+                await queued.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Translation worker {index} failed running job {queued.job_id}: {str(e)}")
+            finally:
+                self._running.discard(queued.job_id)
+
+# Global translation scheduler instance
+translation_scheduler = TranslationScheduler()
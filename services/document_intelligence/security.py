@@ -1,33 +1,66 @@
 """Security utilities for Document Intelligence service"""
-import os
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
-from azure.storage.blob import BlobServiceClient, generate_blob_sas, BlobSasPermissions, generate_container_sas, ContainerSasPermissions
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+from typing import Optional, Dict, Any, Tuple
+from azure.storage.blob import generate_blob_sas, BlobSasPermissions, generate_container_sas, ContainerSasPermissions
+from azure.storage.blob.aio import BlobServiceClient
+from azure.identity.aio import DefaultAzureCredential
 from azure.core.exceptions import AzureError
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Refresh the user delegation key this long before it can no longer cover a new SAS
+DELEGATION_KEY_REFRESH_MARGIN = timedelta(minutes=10)
+
+# Backdate key and SAS start times to tolerate clock skew with the storage service
+CLOCK_SKEW_ALLOWANCE = timedelta(minutes=5)
+
+# Maximum number of issued SAS tokens kept for reuse
+SAS_CACHE_SIZE = 1024
+
 class SecurityManager:
     """Manages security operations for Document Intelligence"""
 
     def __init__(self):
         self.config = get_config()
         self._blob_service_client: Optional[BlobServiceClient] = None
+        self._credential: Optional[DefaultAzureCredential] = None
+
+        # Cached user delegation key, refreshed before it expires
+        self._user_delegation_key = None
+        self._user_delegation_key_expiry: Optional[datetime] = None
+        self._user_delegation_key_lock = asyncio.Lock()
+
+        # Issued SAS tokens keyed by (container, blob, permissions) -> (token, expiry)
+        self._sas_cache: "OrderedDict[Tuple[str, Optional[str], str], Tuple[str, datetime]]" = OrderedDict()
+
+    async def open(self) -> None:
+        """Open the shared async blob service client (called at application startup)"""
+        self.get_blob_service_client()
+
+    async def close(self) -> None:
+        """Close the shared async blob service client and its credential"""
+        if self._blob_service_client is not None:
+            await self._blob_service_client.close()
+            self._blob_service_client = None
+        if self._credential is not None:
+            await self._credential.close()
+            self._credential = None
 
     def get_blob_service_client(self) -> BlobServiceClient:
-        """Get blob service client with appropriate authentication"""
+        """Get the shared async blob service client with appropriate authentication"""
         if self._blob_service_client is None:
             try:
                 if self.config.use_managed_identity:
                     # Use managed identity for authentication
-                    credential = DefaultAzureCredential()
+                    self._credential = DefaultAzureCredential()
                     account_url = f"https://{self.config.storage_account_name}.blob.core.windows.net"
                     self._blob_service_client = BlobServiceClient(
                         account_url=account_url,
-                        credential=credential
+                        credential=self._credential
                     )
                     logger.info("Using managed identity for blob storage authentication")
                 else:
@@ -48,27 +81,80 @@ class SecurityManager:
 
         return self._blob_service_client
 
-    def generate_user_delegation_sas(
+    def _delegation_key_needs_refresh(self, now: datetime) -> bool:
+        """Check if the cached key can still cover a full-length SAS issued now"""
+        if self._user_delegation_key is None:
+            return True
+        sas_lifetime = timedelta(hours=self.config.sas_token_expiry_hours)
+        return self._user_delegation_key_expiry - now < sas_lifetime + DELEGATION_KEY_REFRESH_MARGIN
+
+    async def refresh_user_delegation_key(self) -> None:
+        """Request a new user delegation key from the storage service"""
+        blob_service_client = self.get_blob_service_client()
+
+        key_start_time = datetime.now(timezone.utc) - CLOCK_SKEW_ALLOWANCE
+        key_expiry_time = datetime.now(timezone.utc) + \
+            timedelta(hours=self.config.user_delegation_key_lifetime_hours)
+
+        user_delegation_key = await blob_service_client.get_user_delegation_key(
+            key_start_time=key_start_time,
+            key_expiry_time=key_expiry_time
+        )
+
+        self._user_delegation_key = user_delegation_key
+        self._user_delegation_key_expiry = key_expiry_time
+
+        logger.info(f"Refreshed user delegation key, valid until {key_expiry_time.isoformat()}")
+
+    async def get_user_delegation_key(self):
+        """Get the cached user delegation key, fetching it only when missing or near expiry"""
+        if self._delegation_key_needs_refresh(datetime.now(timezone.utc)):
+            async with self._user_delegation_key_lock:
+                if self._delegation_key_needs_refresh(datetime.now(timezone.utc)):
+                    await self.refresh_user_delegation_key()
+        return self._user_delegation_key
+
+    async def run_delegation_key_refresh(self) -> None:
+        """Keep the user delegation key fresh so SAS signing never waits on storage"""
+        while True:
+            try:
+                await self.get_user_delegation_key()
+
+                # Sleep until the key is about to become too short-lived for a new SAS
+                sas_lifetime = timedelta(hours=self.config.sas_token_expiry_hours)
+                refresh_at = self._user_delegation_key_expiry - sas_lifetime - DELEGATION_KEY_REFRESH_MARGIN
+                delay = (refresh_at - datetime.now(timezone.utc)).total_seconds()
+                await asyncio.sleep(max(delay, 1))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"User delegation key refresh failed: {str(e)}")
+                await asyncio.sleep(60)
+
+    async def generate_user_delegation_sas(
         self,
         container_name: str,
         blob_name: Optional[str] = None,
         permissions: str = "r"
     ) -> str:
         """Generate user delegation SAS token (most secure)"""
+        return (await self._generate_user_delegation_sas(container_name, blob_name, permissions))[0]
+
+    async def _generate_user_delegation_sas(
+        self,
+        container_name: str,
+        blob_name: Optional[str],
+        permissions: str
+    ) -> Tuple[str, datetime]:
+        """Sign a user delegation SAS locally with the cached key"""
         try:
             if not self.config.use_managed_identity:
                 raise ValueError("User delegation SAS requires managed identity authentication")
 
-            blob_service_client = self.get_blob_service_client()
-
-            # Get user delegation key
-            key_start_time = datetime.now(timezone.utc)
-            key_expiry_time = key_start_time + timedelta(hours=self.config.sas_token_expiry_hours)
+            user_delegation_key = await self.get_user_delegation_key()
 
-            user_delegation_key = blob_service_client.get_user_delegation_key(
-                key_start_time=key_start_time,
-                key_expiry_time=key_expiry_time
-            )
+            start_time = datetime.now(timezone.utc) - CLOCK_SKEW_ALLOWANCE
+            expiry_time = datetime.now(timezone.utc) + timedelta(hours=self.config.sas_token_expiry_hours)
 
             # Generate SAS token
             if blob_name:
@@ -79,8 +165,8 @@ class SecurityManager:
                     blob_name=blob_name,
                     user_delegation_key=user_delegation_key,
                     permission=BlobSasPermissions.from_string(permissions),
-                    expiry=key_expiry_time,
-                    start=key_start_time
+                    expiry=expiry_time,
+                    start=start_time
                 )
             else:
                 # Container-level SAS
@@ -89,12 +175,12 @@ class SecurityManager:
                     container_name=container_name,
                     user_delegation_key=user_delegation_key,
                     permission=ContainerSasPermissions.from_string(permissions),
-                    expiry=key_expiry_time,
-                    start=key_start_time
+                    expiry=expiry_time,
+                    start=start_time
                 )
 
-            logger.info(f"Generated user delegation SAS for container: {container_name}")
-            return sas_token
+            logger.debug(f"Generated user delegation SAS for container: {container_name}")
+            return sas_token, expiry_time
 
         except Exception as e:
             logger.error(f"Failed to generate user delegation SAS: {str(e)}")
@@ -107,6 +193,15 @@ class SecurityManager:
         permissions: str = "r"
     ) -> str:
         """Generate account key SAS token (fallback option)"""
+        return self._generate_account_sas(container_name, blob_name, permissions)[0]
+
+    def _generate_account_sas(
+        self,
+        container_name: str,
+        blob_name: Optional[str],
+        permissions: str
+    ) -> Tuple[str, datetime]:
+        """Sign an account key SAS"""
         try:
             if not self.config.storage_account_key:
                 raise ValueError("Storage account key required for account SAS")
@@ -137,51 +232,81 @@ class SecurityManager:
                 )
 
             logger.warning(f"Using account key SAS for container: {container_name}")
-            return sas_token
+            return sas_token, expiry_time
 
         except Exception as e:
             logger.error(f"Failed to generate account SAS: {str(e)}")
             raise
 
-    def get_secure_sas_token(
+    async def get_secure_sas_token(
         self,
         container_name: str,
         blob_name: Optional[str] = None,
         permissions: str = "r"
     ) -> str:
         """Get the most secure SAS token available"""
+        return (await self.get_secure_sas_token_with_expiry(container_name, blob_name, permissions))[0]
+
+    async def get_secure_sas_token_with_expiry(
+        self,
+        container_name: str,
+        blob_name: Optional[str] = None,
+        permissions: str = "r"
+    ) -> Tuple[str, datetime]:
+        """Get the most secure SAS token available, reusing one issued earlier while it is fresh"""
         try:
+            cache_key = (container_name, blob_name, permissions)
+            now = datetime.now(timezone.utc)
+            half_lifetime = timedelta(hours=self.config.sas_token_expiry_hours) / 2
+
+            cached = self._sas_cache.get(cache_key)
+            if cached and cached[1] - now > half_lifetime:
+                self._sas_cache.move_to_end(cache_key)
+                return cached
+
             if self.config.use_managed_identity:
-                return self.generate_user_delegation_sas(container_name, blob_name, permissions)
+                issued = await self._generate_user_delegation_sas(container_name, blob_name, permissions)
             else:
-                return self.generate_account_sas(container_name, blob_name, permissions)
+                issued = self._generate_account_sas(container_name, blob_name, permissions)
+
+            self._sas_cache[cache_key] = issued
+            self._sas_cache.move_to_end(cache_key)
+            while len(self._sas_cache) > SAS_CACHE_SIZE:
+                self._sas_cache.popitem(last=False)
+
+            return issued
         except Exception as e:
             logger.error(f"Failed to generate secure SAS token: {str(e)}")
             raise
 
-    def get_upload_sas_url(self, container_name: str, blob_name: str) -> str:
+    async def get_upload_sas_url(self, container_name: str, blob_name: str) -> str:
         """Generate secure SAS URL for file upload"""
-        sas_token = self.get_secure_sas_token(container_name, blob_name, "rcw")  # read, create, write
+        sas_token = await self.get_secure_sas_token(container_name, blob_name, "rcw")  # read, create, write
         return f"https://{self.config.storage_account_name}.blob.core.windows.net/{container_name}/{blob_name}?{sas_token}"
 
-    def get_download_sas_url(self, container_name: str, blob_name: str) -> str:
+    async def get_download_sas_url(self, container_name: str, blob_name: str) -> str:
         """Generate secure SAS URL for file download"""
-        sas_token = self.get_secure_sas_token(container_name, blob_name, "r")  # read only
-        return f"https://{self.config.storage_account_name}.blob.core.windows.net/{container_name}/{blob_name}?{sas_token}"
+        return (await self.get_download_sas_url_with_expiry(container_name, blob_name))[0]
+
+    async def get_download_sas_url_with_expiry(self, container_name: str, blob_name: str) -> Tuple[str, datetime]:
+        """Generate secure SAS URL for file download along with its expiry time"""
+        sas_token, expires_at = await self.get_secure_sas_token_with_expiry(container_name, blob_name, "r")  # read only
+        url = f"https://{self.config.storage_account_name}.blob.core.windows.net/{container_name}/{blob_name}?{sas_token}"
+        return url, expires_at
 
-    def get_container_sas_url(self, container_name: str, permissions: str = "rl") -> str:
+    async def get_container_sas_url(self, container_name: str, permissions: str = "rl") -> str:
         """Generate secure container SAS URL"""
-        sas_token = self.get_secure_sas_token(container_name, None, permissions)
+        sas_token = await self.get_secure_sas_token(container_name, None, permissions)
         return f"https://{self.config.storage_account_name}.blob.core.windows.net/{container_name}?{sas_token}"
 
-    def validate_sas_token(self, sas_url: str) -> bool:
+    async def validate_sas_token(self, sas_url: str) -> bool:
         """Validate if SAS token is still valid"""
         try:
             # This is a basic validation - in production, you might want more sophisticated checks
-            blob_service_client = BlobServiceClient(account_url=sas_url)
-            # Try to list containers to test the token
-            containers = blob_service_client.list_containers(max_results=1)
-            next(containers, None)  # Try to get the first container
+            async with BlobServiceClient(account_url=sas_url) as blob_service_client:
+                # Try to list containers to test the token
+                async for _ in blob_service_client.list_containers(results_per_page=1):
+                    break
             return True
         except AzureError:
             return False
@@ -10,6 +10,8 @@ from pydantic import BaseModel
 from openai import AzureOpenAI
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -21,7 +23,9 @@ def get_image_client():
     return AzureOpenAI(
         azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
         api_key=os.getenv("AZURE_OPENAI_IMAGE_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_IMAGE_API_VERSION", "2024-04-01-preview")
+        api_version=os.getenv("AZURE_OPENAI_IMAGE_API_VERSION", "2024-04-01-preview"),
+        # Retries are handled by the shared upstream policy, which also sees every 429
+        max_retries=0
     )
 
 # Pydantic models for request/response
@@ -49,14 +53,22 @@ async def generate_image(request: Request, image_request: ImageGenerationRequest
         deployment = os.getenv("AZURE_OPENAI_IMAGE_DEPLOYMENT_NAME", "dall-e-3")
         
         # Generate image using DALL-E 3
-        result = client.images.generate(
-            model=deployment,
-            prompt=image_request.prompt,
-            size=image_request.size,
-            quality=image_request.quality,
-            style=image_request.style,
-            n=image_request.n
+        # Raw responses carry the status and quota headers the rate limiter adapts to
+        response = await call_upstream(
+            "image_generation",
+            "generate",
+            lambda timeout: client.images.with_raw_response.generate(
+                model=deployment,
+                prompt=image_request.prompt,
+                size=image_request.size,
+                quality=image_request.quality,
+                style=image_request.style,
+                n=image_request.n,
+                timeout=timeout
+            ),
+            deployment=deployment
         )
+        result = response.parse()
         
         # Extract image URL from response
         image_data = json.loads(result.model_dump_json())
@@ -74,6 +86,8 @@ async def generate_image(request: Request, image_request: ImageGenerationRequest
             }
         }
         
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         error_message = str(e)
         logger.error(f"Image generation error: {error_message}")
@@ -83,8 +97,6 @@ async def generate_image(request: Request, image_request: ImageGenerationRequest
             error_message = "The image prompt was rejected due to content policy. Please try a different description."
         elif "insufficient_quota" in error_message.lower():
             error_message = "Insufficient quota to generate image. Please try again later."
-        elif "rate_limit" in error_message.lower():
-            error_message = "Rate limit exceeded. Please wait a moment before generating another image."
         
         raise HTTPException(status_code=500, detail=error_message)
 
@@ -146,4 +158,4 @@ async def health():
         "configured": configured,
         "deployment": os.getenv("AZURE_OPENAI_IMAGE_DEPLOYMENT_NAME", "Not configured"),
         "api_version": os.getenv("AZURE_OPENAI_IMAGE_API_VERSION", "Not configured")
-    }
\ No newline at end of file
+    }
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 import requests
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -40,13 +42,20 @@ async def analyze_sentiment(request: Request, sentiment_request: SentimentReques
             }]
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        # Submitting creates an analysis job, so it is not retried
+        response = await call_upstream(
+            "language",
+            "analyze_jobs",
+            lambda timeout: requests.post(url, headers=headers, json=data, timeout=timeout)
+        )
         response.raise_for_status()
         
         return {
             "success": True,
             "data": response.json()
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Language API error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -78,4 +87,4 @@ async def health():
     return {
         "service": "Azure Language Services",
         "configured": configured
-    }
\ No newline at end of file
+    }
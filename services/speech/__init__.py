@@ -6,6 +6,8 @@ from pydantic import BaseModel
 import requests
 import logging
 
+from upstream import call_upstream, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -26,7 +28,12 @@ async def get_speech_token(request: Request):
             'Content-Type': 'application/x-www-form-urlencoded'
         }
         
-        response = requests.post(url, headers=headers)
+        response = await call_upstream(
+            "speech",
+            "token",
+            lambda timeout: requests.post(url, headers=headers, timeout=timeout),
+            idempotent=True
+        )
         response.raise_for_status()
         
         return {
@@ -34,6 +41,8 @@ async def get_speech_token(request: Request):
             "token": response.text,
             "region": region
         }
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Speech token error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -49,4 +58,4 @@ async def health():
         "service": "Azure Speech Services",
         "configured": configured,
         "region": os.getenv("AZURE_SPEECH_REGION", "Not configured")
-    }
\ No newline at end of file
+    }
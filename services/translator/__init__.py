@@ -6,6 +6,8 @@ from pydantic import BaseModel
 import requests
 import logging
 
+from upstream import call_upstream, CircuitOpenError, UpstreamThrottledError
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -62,7 +64,13 @@ async def translate_text(request: Request, translation_request: TranslationReque
 
                 data = [{'text': translation_request.text}]
 
-                response = requests.post(url, headers=headers, json=data, timeout=5)
+                response = await call_upstream(
+                    "translator",
+                    "translate",
+                    lambda timeout: requests.post(url, headers=headers, json=data, timeout=timeout),
+                    idempotent=True,
+                    hedge=True
+                )
                 response.raise_for_status()
 
                 # Format response
@@ -76,6 +84,12 @@ async def translate_text(request: Request, translation_request: TranslationReque
                             "raw": result
                         }
                     }
+            except CircuitOpenError:
+                # The service is known to be degraded; serve the demo translation without waiting
+                logger.info("Azure Translator circuit is open, serving simulated translation")
+            except UpstreamThrottledError:
+                # Throttling is reported to the client rather than hidden behind a demo translation
+                raise
             except Exception as e:
                 logger.warning(f"Azure Translator failed, falling back to simulation: {str(e)}")
 
@@ -128,6 +142,8 @@ async def translate_text(request: Request, translation_request: TranslationReque
             }
         }
 
+    except UpstreamThrottledError:
+        raise
     except Exception as e:
         logger.error(f"Translation error: {str(e)}")
         # Return a graceful error response with the original text
@@ -151,4 +167,4 @@ async def health():
         "service": "Azure Translator",
         "configured": configured,
         "region": os.getenv("AZURE_TRANSLATOR_REGION", "Not configured")
-    }
\ No newline at end of file
+    }
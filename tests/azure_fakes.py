@@ -0,0 +1,249 @@
+"""In-memory stand-ins for the Azure SDK clients the document service talks to"""
+import asyncio
+import itertools
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import unquote, urlsplit
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+ACCOUNT_URL = "https://teststorage.blob.core.windows.net"
+
+_etags = itertools.count(1)
+
+class FakeBlob:
+    """A stored blob; also serves as its own properties object"""
+
+    def __init__(self, name: str, content: bytes, metadata: Optional[Dict[str, str]], content_type: Optional[str]):
+        self.name = name
+        self.content = content
+        self.size = len(content)
+        self.metadata = dict(metadata or {})
+        self.content_settings = SimpleNamespace(content_type=content_type)
+        self.etag = f'"0x{next(_etags):08X}"'
+        self.last_modified = datetime.now(timezone.utc)
+
+class FakeDownloader:
+    """Result of download_blob: a byte range of one blob"""
+
+    def __init__(self, blob: FakeBlob, offset: int, length: Optional[int], chunk_size: int):
+        end = blob.size if length is None else min(offset + length, blob.size)
+        self.properties = blob
+        self._data = blob.content[offset:end]
+        self.size = len(self._data)
+        self._chunk_size = chunk_size
+
+    async def readall(self) -> bytes:
+        return self._data
+
+    async def chunks(self):
+        for start in range(0, len(self._data), self._chunk_size):
+            yield self._data[start:start + self._chunk_size]
+
+class FakeBlobClient:
+    def __init__(self, service: "FakeBlobServiceClient", container: str, name: str):
+        self._service = service
+        self.container_name = container
+        self.blob_name = name
+        self.url = f"{ACCOUNT_URL}/{container}/{name}"
+
+    def _blob(self) -> FakeBlob:
+        blob = self._service.containers[self.container_name].get(self.blob_name)
+        if blob is None:
+            raise ResourceNotFoundError(f"Blob {self.blob_name} not found")
+        return blob
+
+    async def upload_blob(self, data, length=None, metadata=None, content_settings=None, overwrite=False, **kwargs):
+        if not overwrite and self.blob_name in self._service.containers[self.container_name]:
+            raise ResourceExistsError(f"Blob {self.blob_name} already exists")
+        if isinstance(data, (bytes, bytearray)):
+            content = bytes(data)
+        else:
+            content = b"".join([chunk async for chunk in data])
+        blob = self._service.put(
+            self.container_name,
+            self.blob_name,
+            content,
+            metadata,
+            content_settings.content_type if content_settings else None
+        )
+        return {"etag": blob.etag, "last_modified": blob.last_modified}
+
+    async def get_blob_properties(self, **kwargs) -> FakeBlob:
+        return self._blob()
+
+    async def download_blob(self, offset: int = 0, length: Optional[int] = None, **kwargs) -> FakeDownloader:
+        return FakeDownloader(self._blob(), offset or 0, length, self._service.chunk_size)
+
+    async def delete_blob(self, **kwargs) -> None:
+        self._blob()
+        del self._service.containers[self.container_name][self.blob_name]
+
+class FakeBlobPages:
+    """Pages of a listing, resumable from a continuation token (the index of the next blob)"""
+
+    def __init__(self, blobs: List[FakeBlob], page_size: int, continuation_token: Optional[str]):
+        self._blobs = blobs
+        self._page_size = page_size
+        self._next = int(continuation_token or 0)
+        self.continuation_token = continuation_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._next >= len(self._blobs) and self._next > 0:
+            raise StopAsyncIteration
+        page = self._blobs[self._next:self._next + self._page_size]
+        self._next += self._page_size
+        self.continuation_token = str(self._next) if self._next < len(self._blobs) else None
+        return FakeAsyncList(page)
+
+class FakeAsyncList:
+    def __init__(self, items: List[Any]):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+class FakeBlobListing(FakeAsyncList):
+    """Result of list_blobs: iterable blob by blob, or page by page"""
+
+    def __init__(self, blobs: List[FakeBlob], page_size: Optional[int]):
+        super().__init__(blobs)
+        self._blobs = blobs
+        self._page_size = page_size or 5000
+
+    def by_page(self, continuation_token: Optional[str] = None) -> FakeBlobPages:
+        return FakeBlobPages(self._blobs, self._page_size, continuation_token)
+
+class FakeContainerClient:
+    def __init__(self, service: "FakeBlobServiceClient", name: str):
+        self._service = service
+        self.container_name = name
+
+    def list_blobs(self, name_starts_with: Optional[str] = None, include=None, results_per_page=None, **kwargs):
+        blobs = sorted(
+            (blob for name, blob in self._service.containers[self.container_name].items()
+             if name.startswith(name_starts_with or "")),
+            key=lambda blob: blob.name
+        )
+        return FakeBlobListing(blobs, results_per_page)
+
+    async def get_container_properties(self, **kwargs) -> Dict[str, Any]:
+        return {"name": self.container_name}
+
+    async def create_container(self, **kwargs) -> None:
+        raise ResourceExistsError(f"Container {self.container_name} already exists")
+
+    def get_blob_client(self, blob: str) -> FakeBlobClient:
+        return FakeBlobClient(self._service, self.container_name, blob)
+
+class FakeBlobServiceClient:
+    """Every container exists and starts empty"""
+
+    def __init__(self, chunk_size: int = 4):
+        self.containers: Dict[str, Dict[str, FakeBlob]] = defaultdict(dict)
+        self.chunk_size = chunk_size
+
+    def put(
+        self,
+        container: str,
+        name: str,
+        content: bytes,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = "application/octet-stream"
+    ) -> FakeBlob:
+        blob = self.containers[container][name] = FakeBlob(name, content, metadata, content_type)
+        return blob
+
+    def get_blob_client(self, container: str, blob: str) -> FakeBlobClient:
+        return FakeBlobClient(self, container, blob)
+
+    def get_container_client(self, container: str) -> FakeContainerClient:
+        return FakeContainerClient(self, container)
+
+    async def close(self) -> None:
+        pass
+
+def _container_and_name(url: str):
+    container, _, name = unquote(urlsplit(url).path).lstrip("/").partition("/")
+    return container, name
+
+class FakeTranslationClient:
+    """Document Translation that finishes every operation at once, writing its target blobs
+
+    Sources listed in fail_sources fail instead of being translated. Setting hold to an
+    asyncio.Event keeps begin_translation waiting until the event is set.
+    """
+
+    def __init__(self, storage: FakeBlobServiceClient):
+        self.storage = storage
+        self.submitted: List[List[Any]] = []
+        self.cancelled: List[str] = []
+        self.fail_sources: Set[str] = set()
+        self.hold: Optional[asyncio.Event] = None
+        self._operations: Dict[str, List[SimpleNamespace]] = {}
+        self._ids = itertools.count(1)
+
+    async def begin_translation(self, inputs, **kwargs) -> SimpleNamespace:
+        if self.hold is not None:
+            await self.hold.wait()
+        self.submitted.append(list(inputs))
+        documents = []
+        for document_input in inputs:
+            source_container, source_name = _container_and_name(document_input.source_url)
+            source = self.storage.containers[source_container].get(source_name)
+            for target in document_input.targets:
+                failed = source is None or source_name in self.fail_sources
+                target_container, target_name = _container_and_name(target.target_url)
+                if not failed:
+                    self.storage.put(
+                        target_container,
+                        target_name,
+                        f"[{target.language}] ".encode() + source.content,
+                        content_type=source.content_settings.content_type
+                    )
+                documents.append(SimpleNamespace(
+                    source_document_url=document_input.source_url,
+                    translated_document_url=None if failed else target.target_url,
+                    translated_to=target.language,
+                    status="Failed" if failed else "Succeeded",
+                    characters_charged=0 if failed else len(source.content),
+                    error=SimpleNamespace(message="Translation failed") if failed else None
+                ))
+
+        operation_id = f"operation-{next(self._ids)}"
+        self._operations[operation_id] = documents
+        return SimpleNamespace(id=operation_id)
+
+    async def get_translation_status(self, operation_id: str) -> SimpleNamespace:
+        documents = self._operations.get(operation_id)
+        if documents is None:
+            raise ResourceNotFoundError(f"Operation {operation_id} not found")
+        succeeded = sum(1 for doc in documents if doc.status == "Succeeded")
+        return SimpleNamespace(
+            status="Succeeded" if succeeded else "Failed",
+            documents_succeeded_count=succeeded,
+            documents_failed_count=len(documents) - succeeded,
+            documents_cancelled_count=0,
+            error=None
+        )
+
+    async def list_document_statuses(self, operation_id: str):
+        for document in self._operations[operation_id]:
+            yield document
+
+    async def cancel_translation(self, operation_id: str) -> None:
+        self.cancelled.append(operation_id)
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,110 @@
+"""Shared test setup: the document service refuses to load without its Azure settings"""
+import os
+import sys
+import base64
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_state_dir = tempfile.mkdtemp()
+for name, value in {
+    "AZURE_TRANSLATOR_ENDPOINT": "https://translator.test",
+    "AZURE_TRANSLATOR_API_KEY": "test-key",
+    "AZURE_TRANSLATOR_REGION": "test-region",
+    "AZURE_STORAGE_ACCOUNT_NAME": "teststorage",
+    # Account-key SAS tokens are signed locally, so no storage round trip is needed
+    "USE_MANAGED_IDENTITY": "false",
+    "AZURE_STORAGE_ACCOUNT_KEY": base64.b64encode(b"test-account-key").decode(),
+    "DOCUMENT_INDEX_DB": os.path.join(_state_dir, "document_index.db"),
+    "DOWNLOAD_CACHE_DIR": os.path.join(_state_dir, "download_cache"),
+}.items():
+    os.environ.setdefault(name, value)
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def document_service(monkeypatch, tmp_path):
+    """The document service API backed by in-memory storage and Document Translation fakes
+
+    Every test gets its own index database and fresh scheduler and poller, since those hold
+    asyncio primitives bound to the test's event loop.
+    """
+    import httpx
+    from fastapi import FastAPI
+
+    from azure_fakes import FakeBlobServiceClient, FakeTranslationClient
+    from services.document_intelligence import router
+    from services.document_intelligence import full_service, poller, scheduler
+    from services.document_intelligence.blob_index import blob_index
+    from services.document_intelligence.content_index import content_index
+    from services.document_intelligence.eta import throughput_model
+    from services.document_intelligence.jobs import translation_jobs
+    from services.document_intelligence.security import security_manager
+
+    monkeypatch.setenv("DOCUMENT_INDEX_DB", str(tmp_path / "document_index.db"))
+    for index in (blob_index, content_index, throughput_model):
+        index.close()
+    monkeypatch.setattr(blob_index, "_cursors", {})
+    monkeypatch.setattr(blob_index, "_ready", type(blob_index._ready)())
+
+    storage = FakeBlobServiceClient()
+    translator = FakeTranslationClient(storage)
+    monkeypatch.setattr(security_manager, "_blob_service_client", storage)
+    monkeypatch.setattr(security_manager, "_sas_cache", type(security_manager._sas_cache)())
+
+    operation_poller = poller.TranslationOperationPoller()
+    operation_poller._client = translator
+    monkeypatch.setattr(poller, "MIN_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(poller, "POLL_SECONDS_PER_MB", 0.0)
+    monkeypatch.setattr(full_service, "translation_poller", operation_poller)
+
+    job_scheduler = scheduler.TranslationScheduler()
+    monkeypatch.setattr(full_service, "translation_scheduler", job_scheduler)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/document-intelligence")
+    async with httpx.AsyncClient(app=app, base_url="http://test/api/document-intelligence") as client:
+        yield SimpleNamespace(
+            client=client,
+            storage=storage,
+            translator=translator,
+            poller=operation_poller,
+            scheduler=job_scheduler,
+            jobs=translation_jobs,
+            source=full_service.get_config().source_container_name,
+            target=full_service.get_config().target_container_name
+        )
+
+    await job_scheduler.stop()
+    await operation_poller.stop()
+    translation_jobs.clear()
+    for index in (blob_index, content_index, throughput_model):
+        index.close()
+
+async def wait_for_job(service, job_id: str, timeout: float = 5.0) -> dict:
+    """Poll the job status route until the job reaches a final status"""
+    import anyio
+
+    with anyio.fail_after(timeout):
+        while True:
+            response = await service.client.get(f"/job/{job_id}")
+            assert response.status_code == 200, response.text
+            body = response.json()
+            if body["status"] in ("completed", "failed", "cancelled"):
+                return body
+            await anyio.sleep(0.01)
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fresh upstream rate limiters, circuit breakers and latency trackers"""
+    from upstream import circuit_breakers, rate_limiters, upstream_policy
+
+    monkeypatch.setattr(circuit_breakers, "_breakers", {})
+    monkeypatch.setattr(rate_limiters, "_limiters", {})
+    monkeypatch.setattr(upstream_policy, "_trackers", {})
+    return SimpleNamespace(breakers=circuit_breakers, limiters=rate_limiters, policy=upstream_policy)
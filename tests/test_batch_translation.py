@@ -0,0 +1,83 @@
+"""Multi-document batch translation jobs"""
+import pytest
+
+from conftest import wait_for_job
+from services.document_intelligence import full_service
+
+pytestmark = pytest.mark.anyio
+
+def batch(languages=("es",), **selection):
+    return {"translation_config": {"target_languages": list(languages)}, **selection}
+
+async def test_list_batch_translates_every_document_in_one_operation(document_service):
+    for name in ("a.docx", "b.docx"):
+        document_service.storage.put(document_service.source, name, b"hello")
+
+    response = await document_service.client.post("/translate/batch", json=batch(blob_names=["a.docx", "b.docx"]))
+    assert response.status_code == 200, response.text
+    job = await wait_for_job(document_service, response.json()["job_id"])
+
+    assert len(document_service.translator.submitted) == 1
+    assert len(document_service.translator.submitted[0]) == 2
+    assert job["status"] == "completed"
+    assert job["documents_completed"] == 2
+    assert sorted(doc["target_blob"] for doc in job["documents"]) == ["es/translated_a.docx", "es/translated_b.docx"]
+
+async def test_prefix_batch_uses_the_same_target_names_as_list_batches(document_service):
+    storage = document_service.storage
+    storage.put(document_service.source, "reports/q1.docx", b"q1")
+    storage.put(document_service.source, "reports/q2.docx", b"q2")
+    storage.put(document_service.source, "other/skip.docx", b"skip")
+
+    response = await document_service.client.post("/translate/batch", json=batch(prefix="reports/"))
+    assert response.status_code == 200, response.text
+    assert response.json()["documents_total"] == 2
+    job = await wait_for_job(document_service, response.json()["job_id"])
+
+    assert job["status"] == "completed"
+    assert sorted(doc["target_blob"] for doc in job["documents"]) == [
+        full_service._target_blob_name("reports/q1.docx", "es"),
+        full_service._target_blob_name("reports/q2.docx", "es")
+    ]
+    assert sorted(document_service.storage.containers[document_service.target]) == [
+        "es/translated_reports/q1.docx",
+        "es/translated_reports/q2.docx"
+    ]
+
+async def test_prefix_batch_skips_staged_pdf_parts(document_service):
+    storage = document_service.storage
+    storage.put(document_service.source, "contract.pdf", b"pdf")
+    storage.put(document_service.source, f"{full_service.PDF_PARTS_FOLDER}/job/part-0001.pdf", b"part")
+
+    response = await document_service.client.post("/translate/batch", json=batch(prefix=""))
+    assert response.status_code == 200, response.text
+    job = await wait_for_job(document_service, response.json()["job_id"])
+
+    assert [doc["source_blob"] for doc in job["documents"]] == ["contract.pdf"]
+
+async def test_prefix_batch_without_documents_is_rejected(document_service):
+    response = await document_service.client.post("/translate/batch", json=batch(prefix="missing/"))
+    assert response.status_code == 400
+    assert "No source documents" in response.json()["detail"]
+    assert document_service.jobs == {}
+
+async def test_prefix_batch_over_the_document_limit_is_rejected(document_service, monkeypatch):
+    monkeypatch.setattr(full_service, "MAX_DOCUMENTS_PER_BATCH", 2)
+    for index in range(3):
+        document_service.storage.put(document_service.source, f"many/{index}.docx", b"x")
+
+    response = await document_service.client.post("/translate/batch", json=batch(prefix="many/"))
+    assert response.status_code == 400
+    assert document_service.jobs == {}
+
+async def test_failed_documents_are_reported_without_failing_the_batch(document_service):
+    for name in ("good.docx", "bad.docx"):
+        document_service.storage.put(document_service.source, name, b"x")
+    document_service.translator.fail_sources.add("bad.docx")
+
+    response = await document_service.client.post("/translate/batch", json=batch(blob_names=["good.docx", "bad.docx"]))
+    job = await wait_for_job(document_service, response.json()["job_id"])
+
+    assert job["status"] == "completed"
+    assert (job["documents_completed"], job["documents_failed"]) == (1, 1)
+    assert job["error_details"] == ["bad.docx (es): Translation failed"]
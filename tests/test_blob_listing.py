@@ -0,0 +1,116 @@
+"""Blob listings served from the local blob index"""
+import pytest
+
+from services.document_intelligence import blob_index as blob_index_module
+from services.document_intelligence.blob_index import blob_index
+from services.document_intelligence.blob_storage import blob_storage
+
+pytestmark = pytest.mark.anyio
+
+def fill(service, count: int = 5) -> None:
+    for index in range(count):
+        owner = "alice" if index % 2 == 0 else "bob"
+        service.storage.put(
+            service.source,
+            f"docs/{index}.txt",
+            b"x" * (index + 1),
+            metadata={"owner": owner, "job_id": f"job-{index % 3}", "original_filename": f"{index}.txt"}
+        )
+    service.storage.put(service.source, "other/readme.txt", b"readme")
+
+async def list_all(service, **params):
+    """Every name of a listing, following continuation tokens, and the tokens seen"""
+    names, tokens, token = [], [], None
+    while True:
+        query = {**params, **({"continuation_token": token} if token else {})}
+        response = await service.client.get("/blobs", params=query)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        names.extend(blob["name"] for blob in body["blobs"])
+        token = body["continuation_token"]
+        if token is None:
+            return names, tokens
+        tokens.append(token)
+
+async def test_listing_pages_through_storage_until_the_index_is_ready(document_service):
+    fill(document_service)
+
+    names, tokens = await list_all(document_service, page_size=2)
+
+    assert not blob_index.ready
+    assert names == sorted(names) and len(names) == 6
+    assert tokens and not any(token.startswith("idx:") for token in tokens)
+
+async def test_filters_wait_for_the_index(document_service):
+    response = await document_service.client.get("/blobs", params={"owner": "alice"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "30"
+
+async def test_index_listing_pages_by_name(document_service):
+    fill(document_service)
+    await blob_index.sweep(blob_storage, None)
+
+    names, tokens = await list_all(document_service, page_size=2)
+
+    assert blob_index.ready
+    assert names == ["docs/0.txt", "docs/1.txt", "docs/2.txt", "docs/3.txt", "docs/4.txt", "other/readme.txt"]
+    assert tokens == ["idx:docs/1.txt", "idx:docs/3.txt", "idx:other/readme.txt"]
+
+async def test_index_listing_filters_by_prefix_owner_and_job(document_service):
+    fill(document_service)
+    await blob_index.sweep(blob_storage, None)
+
+    assert (await list_all(document_service, prefix="other/"))[0] == ["other/readme.txt"]
+    assert (await list_all(document_service, owner="bob"))[0] == ["docs/1.txt", "docs/3.txt"]
+    assert (await list_all(document_service, job_id="job-0"))[0] == ["docs/0.txt", "docs/3.txt"]
+    assert (await list_all(document_service, owner="alice", job_id="job-1", page_size=1))[0] == ["docs/4.txt"]
+
+async def test_metadata_is_only_returned_on_request(document_service):
+    fill(document_service, 1)
+    await blob_index.sweep(blob_storage, None)
+
+    plain = (await document_service.client.get("/blobs", params={"prefix": "docs/"})).json()["blobs"][0]
+    detailed = (await document_service.client.get(
+        "/blobs", params={"prefix": "docs/", "include_metadata": "true"}
+    )).json()["blobs"][0]
+
+    assert (plain["name"], plain["size"]) == ("docs/0.txt", 1)
+    assert not plain.get("metadata")
+    assert detailed["metadata"] == {"original_filename": "0.txt", "job_id": "job-0", "owner": "alice"}
+
+async def test_sweep_drops_blobs_deleted_outside_the_service(document_service):
+    fill(document_service)
+    await blob_index.sweep(blob_storage, None)
+    del document_service.storage.containers[document_service.source]["docs/2.txt"]
+
+    await blob_index.sweep(blob_storage, None)
+
+    assert "docs/2.txt" not in (await list_all(document_service))[0]
+
+async def test_incremental_sweeps_resume_where_they_stopped(document_service, monkeypatch):
+    monkeypatch.setattr(blob_index_module, "SWEEP_PAGE_SIZE", 2)
+    fill(document_service)
+    await blob_index.sweep(blob_storage, None)
+    storage = document_service.storage.containers[document_service.source]
+    del storage["docs/0.txt"]
+    del storage["docs/4.txt"]
+
+    # One page per run: the first run only covers the start of the listing
+    await blob_index.sweep(blob_storage, 1)
+    names = (await list_all(document_service))[0]
+    assert "docs/0.txt" not in names and "docs/4.txt" in names
+
+    await blob_index.sweep(blob_storage, 1)
+    await blob_index.sweep(blob_storage, 1)
+    assert (await list_all(document_service))[0] == ["docs/1.txt", "docs/2.txt", "docs/3.txt", "other/readme.txt"]
+
+async def test_uploads_are_listed_before_the_next_sweep(document_service):
+    await blob_index.sweep(blob_storage, None)
+
+    response = await document_service.client.post(
+        "/upload", files={"file": ("new.txt", b"new", "text/plain")}, data={"owner": "carol"}
+    )
+    name = response.json()["blob_name"]
+
+    assert (await list_all(document_service, owner="carol"))[0] == [name]
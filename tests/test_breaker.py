@@ -0,0 +1,113 @@
+"""Circuit breaker state transitions"""
+import pytest
+
+from upstream import breaker as breaker_module
+from upstream.breaker import BreakerState, CircuitBreaker, CircuitOpenError
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+def make_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "test", window_seconds=30, min_calls=4, error_rate=0.5, slow_rate=0.75, open_seconds=10, probes=2
+    )
+
+def record(breaker: CircuitBreaker, failed, slow: bool = False) -> None:
+    breaker.allow()
+    breaker.release(failed, slow)
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for failed in (False, False, True, True):
+        record(breaker, failed)
+    assert breaker.state == BreakerState.OPEN
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        record(breaker, True)
+    assert breaker.state == BreakerState.CLOSED
+
+def test_opens_at_error_rate(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    assert breaker.opened == 1
+
+def test_opens_at_slow_call_rate(clock):
+    breaker = make_breaker()
+    for slow in (True, True, False, True):
+        record(breaker, False, slow)
+    assert breaker.state == BreakerState.OPEN
+
+def test_outcomes_without_health_signal_are_ignored(clock):
+    breaker = make_breaker()
+    for _ in range(10):
+        record(breaker, None)
+    assert breaker.snapshot()["calls_in_window"] == 0
+
+def test_old_outcomes_leave_the_window(clock):
+    breaker = make_breaker()
+    record(breaker, True)
+    record(breaker, True)
+    clock[0] += 31
+    record(breaker, True)
+    record(breaker, False)
+    record(breaker, False)
+    record(breaker, False)
+    # Only 1 of the 4 calls in the window failed
+    assert breaker.state == BreakerState.CLOSED
+
+def test_open_breaker_fails_fast_until_open_period_ends(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 4
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.check()
+    assert raised.value.retry_after == pytest.approx(6)
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.rejected == 2
+
+    clock[0] += 6
+    breaker.check()
+    breaker.allow()
+    assert breaker.state == BreakerState.HALF_OPEN
+
+def test_half_open_admits_only_probe_slots(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 10
+    breaker.allow()
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    # A probe that says nothing about health frees its slot
+    breaker.release(None)
+    breaker.allow()
+    assert breaker.state == BreakerState.HALF_OPEN
+
+def test_passing_probes_close_the_breaker(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 10
+    breaker.allow()
+    breaker.allow()
+    breaker.release(False)
+    assert breaker.state == BreakerState.HALF_OPEN
+    breaker.release(False)
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.snapshot()["calls_in_window"] == 0
+
+def test_failed_probe_reopens_the_breaker(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 10
+    breaker.allow()
+    breaker.release(True)
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.opened == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
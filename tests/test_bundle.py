@@ -0,0 +1,103 @@
+"""ZIP bundles of a job's translated documents"""
+import io
+import zipfile
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from conftest import wait_for_job
+from services.document_intelligence.bundle import stream_bundle
+
+pytestmark = pytest.mark.anyio
+
+async def run_batch(service, names, languages=("es", "fr")) -> str:
+    for name in names:
+        service.storage.put(service.source, name, f"content of {name}".encode())
+    response = await service.client.post("/translate/batch", json={
+        "blob_names": list(names),
+        "translation_config": {"target_languages": list(languages)}
+    })
+    assert response.status_code == 200, response.text
+    job_id = response.json()["job_id"]
+    await wait_for_job(service, job_id)
+    return job_id
+
+async def test_bundle_contains_every_translated_document(document_service):
+    job_id = await run_batch(document_service, ["a.docx", "b.docx"])
+
+    response = await document_service.client.get(f"/job/{job_id}/bundle")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert f'filename="translation-{job_id}.zip"' in response.headers["content-disposition"]
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert sorted(archive.namelist()) == [
+        "es/translated_a.docx", "es/translated_b.docx", "fr/translated_a.docx", "fr/translated_b.docx"
+    ]
+    assert archive.read("fr/translated_b.docx") == b"[fr] content of b.docx"
+    assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+
+async def test_failed_documents_are_left_out(document_service):
+    document_service.translator.fail_sources.add("bad.docx")
+    job_id = await run_batch(document_service, ["good.docx", "bad.docx"], languages=("es",))
+
+    response = await document_service.client.get(f"/job/{job_id}/bundle")
+
+    assert zipfile.ZipFile(io.BytesIO(response.content)).namelist() == ["es/translated_good.docx"]
+
+async def test_job_without_translations_has_no_bundle(document_service):
+    document_service.translator.fail_sources.add("bad.docx")
+    job_id = await run_batch(document_service, ["bad.docx"], languages=("es",))
+
+    response = await document_service.client.get(f"/job/{job_id}/bundle")
+
+    assert response.status_code == 409
+
+async def test_unknown_job_has_no_bundle(document_service):
+    response = await document_service.client.get("/job/missing/bundle")
+    assert response.status_code == 404
+
+async def test_archive_is_streamed_in_pieces(document_service):
+    for index in range(3):
+        document_service.storage.put(document_service.target, f"doc{index}.txt", bytes(range(256)) * 4)
+
+    pieces = [
+        piece async for piece in stream_bundle(
+            [(f"doc{index}.txt", f"renamed/{index}.txt") for index in range(3)], document_service.target
+        )
+    ]
+
+    assert len(pieces) > 3
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(pieces)))
+    assert archive.namelist() == ["renamed/0.txt", "renamed/1.txt", "renamed/2.txt"]
+    assert archive.read("renamed/2.txt") == bytes(range(256)) * 4
+
+async def test_missing_blob_aborts_the_stream(document_service):
+    document_service.storage.put(document_service.target, "present.txt", b"here")
+
+    with pytest.raises(ResourceNotFoundError):
+        async for _ in stream_bundle([("present.txt", "present.txt"), ("gone.txt", "gone.txt")], document_service.target):
+            pass
+
+async def test_failure_inside_an_entry_aborts_the_stream(document_service, monkeypatch):
+    from services.document_intelligence.blob_storage import blob_storage
+
+    class BrokenDownload:
+        async def chunks(self):
+            yield b"partial"
+            raise ConnectionError("connection reset")
+
+    async def open_blob_download(blob_name, container_name):
+        return BrokenDownload()
+
+    monkeypatch.setattr(blob_storage, "open_blob_download", open_blob_download)
+
+    pieces = []
+    with pytest.raises(ConnectionError):
+        async for piece in stream_bundle([("doc.txt", "doc.txt")], document_service.target):
+            pieces.append(piece)
+
+    # Whatever was sent is not a complete archive
+    with pytest.raises(zipfile.BadZipFile):
+        zipfile.ZipFile(io.BytesIO(b"".join(pieces)))
@@ -0,0 +1,47 @@
+"""Range header parsing of the document content proxy"""
+import pytest
+
+from services.document_intelligence.download_cache import RangeNotSatisfiable, parse_range
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=10-", (10, 999)),
+    ("bytes=999-999", (999, 999)),
+    (" BYTES = 5-9 ", (5, 9)),
+])
+def test_explicit_ranges(header, expected):
+    assert parse_range(header, 1000) == expected
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=-100", (900, 999)),
+    ("bytes=-1", (999, 999)),
+    # A suffix longer than the resource means all of it
+    ("bytes=-5000", (0, 999)),
+])
+def test_suffix_ranges(header, expected):
+    assert parse_range(header, 1000) == expected
+
+def test_end_past_eof_is_clamped():
+    assert parse_range("bytes=900-5000", 1000) == (900, 999)
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=1000-1200", "bytes=5000-6000"])
+def test_start_past_eof_is_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 1000)
+
+@pytest.mark.parametrize("header", ["bytes=-0", "bytes=20-10"])
+def test_empty_or_inverted_ranges_are_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 1000)
+
+def test_any_range_of_empty_resource_is_not_satisfiable():
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range("bytes=-10", 0)
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-9", "bytes=0-1, -5"])
+def test_multiple_ranges_fall_back_to_full_content(header):
+    assert parse_range(header, 1000) is None
+
+@pytest.mark.parametrize("header", [None, "", "items=0-9", "bytes=abc", "bytes=a-9", "bytes=0-b", "bytes=-x", "bytes"])
+def test_missing_or_malformed_header_means_full_content(header):
+    assert parse_range(header, 1000) is None
@@ -0,0 +1,127 @@
+"""The document content proxy and its local download cache"""
+import os
+from collections import OrderedDict
+
+import pytest
+
+from services.document_intelligence import download_cache as download_cache_module
+from services.document_intelligence.download_cache import CachedFileResponse, DownloadCache, download_cache
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = b"0123456789abcdef"
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("DOWNLOAD_CACHE_DIR", str(directory))
+    monkeypatch.setenv("DOWNLOAD_CACHE_MAX_MB", "1")
+    return directory
+
+@pytest.fixture
+def cache(cache_dir, monkeypatch):
+    """The shared download cache, empty and writing to the test's directory"""
+    monkeypatch.setattr(download_cache, "_entries", OrderedDict())
+    monkeypatch.setattr(download_cache, "_downloads", OrderedDict())
+    monkeypatch.setattr(download_cache, "_size", 0)
+    monkeypatch.setattr(download_cache, "_directory", None)
+    monkeypatch.setattr(download_cache, "hits", 0)
+    monkeypatch.setattr(download_cache, "misses", 0)
+    return download_cache
+
+def cache_blob(cache: DownloadCache, name: str = "doc.txt", etag: str = '"1"', content: bytes = CONTENT) -> None:
+    fd, temp_path = cache.open_temp()
+    with os.fdopen(fd, "wb") as file:
+        file.write(content)
+    cache.commit("target", name, etag, temp_path, len(content))
+
+async def send_response(response: CachedFileResponse, method: str = "GET"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await response({"type": "http", "method": method, "extensions": {}}, None, send)
+    return messages
+
+def test_only_the_caches_own_leftovers_are_removed(cache_dir):
+    cache_dir.mkdir()
+    (cache_dir / "notes.txt").write_text("operator file")
+    (cache_dir / "subdir").mkdir()
+    (cache_dir / "subdir" / ("a" * 64)).write_text("nested")
+    (cache_dir / ("a" * 64)).write_text("stale entry")
+    (cache_dir / f"{download_cache_module.TEMP_PREFIX}x1{download_cache_module.TEMP_SUFFIX}").write_text("stale part")
+    (cache_dir / "other.part").write_text("not ours")
+
+    DownloadCache().directory
+
+    assert sorted(os.listdir(cache_dir)) == ["notes.txt", "other.part", "subdir"]
+    assert os.listdir(cache_dir / "subdir") == ["a" * 64]
+
+def test_open_entry_survives_eviction(cache):
+    cache_blob(cache)
+
+    file = cache.open_entry("target", "doc.txt", '"1"')
+    cache.invalidate("target", "doc.txt")
+
+    with file:
+        assert file.read() == CONTENT
+    assert cache.open_entry("target", "doc.txt", '"1"') is None
+
+def test_open_entry_misses_on_a_changed_etag(cache):
+    cache_blob(cache)
+
+    assert cache.open_entry("target", "doc.txt", '"2"') is None
+    assert cache.open_entry("target", "doc.txt", '"1"') is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+async def test_response_streams_a_file_evicted_after_it_was_opened(cache):
+    cache_blob(cache)
+    file = cache.open_entry("target", "doc.txt", '"1"')
+    response = CachedFileResponse(file, 4, 8, 206)
+
+    cache.invalidate("target", "doc.txt")
+    messages = await send_response(response)
+
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 206
+    assert b"".join(message.get("body", b"") for message in messages[1:]) == CONTENT[4:12]
+    assert file.closed
+
+async def test_head_response_closes_the_file(cache):
+    cache_blob(cache)
+    file = cache.open_entry("target", "doc.txt", '"1"')
+
+    messages = await send_response(CachedFileResponse(file, 0, len(CONTENT)), method="HEAD")
+
+    assert messages[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+    assert file.closed
+
+async def test_content_route_serves_ranges(document_service, cache):
+    document_service.storage.put(document_service.target, "es/doc.txt", CONTENT, content_type="text/plain")
+
+    full = await document_service.client.get("/download/es/doc.txt/content")
+    partial = await document_service.client.get("/download/es/doc.txt/content", headers={"Range": "bytes=4-7"})
+    beyond = await document_service.client.get("/download/es/doc.txt/content", headers={"Range": "bytes=100-"})
+    unchanged = await document_service.client.get(
+        "/download/es/doc.txt/content", headers={"If-None-Match": full.headers["etag"]}
+    )
+
+    assert (full.status_code, full.content) == (200, CONTENT)
+    assert (partial.status_code, partial.content) == (206, CONTENT[4:8])
+    assert partial.headers["content-range"] == f"bytes 4-7/{len(CONTENT)}"
+    assert beyond.status_code == 416
+    assert unchanged.status_code == 304
+
+async def test_repeated_downloads_are_served_from_the_cache(document_service, cache):
+    document_service.storage.put(document_service.target, "es/doc.txt", CONTENT, content_type="text/plain")
+
+    for _ in range(download_cache_module.ADMIT_AFTER_DOWNLOADS):
+        response = await document_service.client.get("/download/es/doc.txt/content")
+        assert response.content == CONTENT
+    assert cache.hits == 0
+
+    cached = await document_service.client.get("/download/es/doc.txt/content", headers={"Range": "bytes=-4"})
+
+    assert cache.hits == 1
+    assert (cached.status_code, cached.content) == (206, CONTENT[-4:])
@@ -0,0 +1,81 @@
+"""Small text documents translated with one Text Translator call"""
+import json
+
+import pytest
+import requests
+
+from conftest import wait_for_job
+from upstream import BreakerState
+
+pytestmark = pytest.mark.anyio
+
+def translator_response(translations, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["content-type"] = "application/json"
+    response._content = json.dumps([{"translations": translations}]).encode()
+    return response
+
+@pytest.fixture
+def text_translator(monkeypatch):
+    """Records Text Translator requests and answers each target with an upper-cased copy"""
+    calls = []
+
+    def post(url, params=None, headers=None, json=None, timeout=None):
+        calls.append({"url": url, "params": params, "json": json, "timeout": timeout})
+        languages = [value for name, value in params if name == "to"]
+        return translator_response([{"to": language, "text": json[0]["text"].upper()} for language in languages])
+
+    monkeypatch.setattr(requests, "post", post)
+    return calls
+
+async def start(service, name: str, languages) -> str:
+    response = await service.client.post("/translate", json={
+        "source_blob_name": name,
+        "translation_config": {"target_languages": languages}
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["job_id"]
+
+async def test_small_text_document_is_translated_in_one_call(document_service, text_translator, upstream):
+    document_service.storage.put(document_service.source, "note.txt", b"hello", content_type="text/plain")
+
+    job = await wait_for_job(document_service, await start(document_service, "note.txt", ["es", "fr"]))
+
+    assert job["status"] == "completed"
+    assert len(text_translator) == 1
+    assert document_service.translator.submitted == []
+    outputs = document_service.storage.containers[document_service.target]
+    assert outputs["es/translated_note.txt"].content == b"HELLO"
+    assert outputs["fr/translated_note.txt"].content == b"HELLO"
+
+async def test_text_translation_goes_through_the_upstream_policy(document_service, text_translator, upstream):
+    document_service.storage.put(document_service.source, "note.txt", b"hello", content_type="text/plain")
+
+    await wait_for_job(document_service, await start(document_service, "note.txt", ["es"]))
+
+    # The timeout comes from the translator's adaptive policy rather than a fixed value
+    assert text_translator[0]["timeout"] == upstream.policy.tracker("translator", "translate_text").timeout
+    assert upstream.policy.snapshot()["translator.translate_text"]["samples"] == 1
+    assert "translator" in upstream.limiters.snapshot()
+
+async def test_open_translator_circuit_fails_the_job_without_calling_azure(document_service, text_translator, upstream):
+    document_service.storage.put(document_service.source, "note.txt", b"hello", content_type="text/plain")
+    breaker = upstream.breakers.get("translator")
+    breaker._open()
+    assert breaker.state == BreakerState.OPEN
+
+    job = await wait_for_job(document_service, await start(document_service, "note.txt", ["es"]))
+
+    assert job["status"] == "failed"
+    assert "circuit open" in job["error_details"][0]
+    assert text_translator == []
+
+async def test_non_text_content_falls_back_to_the_batch_api(document_service, text_translator, upstream):
+    document_service.storage.put(document_service.source, "binary.txt", b"\xff\xfe\x00bad", content_type="text/plain")
+
+    job = await wait_for_job(document_service, await start(document_service, "binary.txt", ["es"]))
+
+    assert job["status"] == "completed"
+    assert text_translator == []
+    assert len(document_service.translator.submitted) == 1
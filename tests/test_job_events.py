@@ -0,0 +1,86 @@
+"""Server-Sent Events stream of a translation job's progress"""
+import asyncio
+import json
+
+import pytest
+
+from conftest import wait_for_job
+from services.document_intelligence.jobs import job_events
+
+pytestmark = pytest.mark.anyio
+
+def parse_events(body: str):
+    """(event, data) pairs from an SSE body, skipping keep-alive comments"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+async def start(service, name: str = "report.docx", languages=("es",)) -> str:
+    service.storage.put(service.source, name, b"report")
+    response = await service.client.post("/translate", json={
+        "source_blob_name": name,
+        "translation_config": {"target_languages": list(languages)}
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["job_id"]
+
+async def subscribed(job_id: str) -> None:
+    while job_events.subscriber_count(job_id) == 0:
+        await asyncio.sleep(0.01)
+
+async def test_stream_reports_status_documents_and_completion(document_service):
+    document_service.translator.hold = asyncio.Event()
+    job_id = await start(document_service, languages=("es", "fr"))
+
+    stream = asyncio.create_task(document_service.client.get(f"/job/{job_id}/events"))
+    await asyncio.wait_for(subscribed(job_id), 5)
+    document_service.translator.hold.set()
+    response = await asyncio.wait_for(stream, 5)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    names = [event for event, _ in events]
+    assert names[0] == "status"
+    assert names[-1] == "completed"
+    assert names.count("completed") == 1
+
+    documents = [data for event, data in events if event == "document"]
+    assert {(doc["target_language"], doc["status"]) for doc in documents} >= {("es", "Succeeded"), ("fr", "Succeeded")}
+
+    completed = events[-1][1]
+    assert completed["job_id"] == job_id
+    assert completed["status"] == "completed"
+    assert completed["progress_percentage"] == 100.0
+    assert {language["target_language"] for language in completed["languages"]} == {"es", "fr"}
+    assert job_events.subscriber_count(job_id) == 0
+
+async def test_finished_job_streams_only_its_completion(document_service):
+    job_id = await start(document_service)
+    await wait_for_job(document_service, job_id)
+
+    response = await document_service.client.get(f"/job/{job_id}/events")
+
+    events = parse_events(response.text)
+    assert [event for event, _ in events] == ["completed"]
+    assert events[0][1]["documents"][0]["target_blob"] == "es/translated_report.docx"
+
+async def test_failed_job_completes_the_stream(document_service):
+    document_service.translator.hold = asyncio.Event()
+    document_service.translator.fail_sources.add("report.docx")
+    job_id = await start(document_service)
+
+    stream = asyncio.create_task(document_service.client.get(f"/job/{job_id}/events"))
+    await asyncio.wait_for(subscribed(job_id), 5)
+    document_service.translator.hold.set()
+    events = parse_events((await asyncio.wait_for(stream, 5)).text)
+
+    assert events[-1][0] == "completed"
+    assert events[-1][1]["status"] == "failed"
+
+async def test_unknown_job_has_no_event_stream(document_service):
+    response = await document_service.client.get("/job/missing/events")
+    assert response.status_code == 404
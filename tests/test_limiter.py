@@ -0,0 +1,81 @@
+"""Adaptive upstream rate limiter feedback"""
+import pytest
+
+from upstream import limiter as limiter_module
+from upstream.limiter import AdaptiveRateLimiter, parse_retry_after
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+def make_limiter(rate: float = 10.0) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter("test", initial_rate=rate, min_rate=1.0, max_rate=20.0, burst=5)
+
+def test_accepted_requests_raise_rate_additively(clock):
+    limiter = make_limiter()
+    for _ in range(3):
+        limiter.feedback(200, {})
+    assert limiter.rate == pytest.approx(10.0 + 3 * limiter_module.ADDITIVE_INCREASE_RPS)
+
+def test_increase_stops_at_max_rate(clock):
+    limiter = make_limiter(rate=19.95)
+    limiter.feedback(200, {})
+    limiter.feedback(200, {})
+    assert limiter.rate == 20.0
+
+def test_server_errors_leave_rate_unchanged(clock):
+    limiter = make_limiter()
+    limiter.feedback(503, {})
+    assert limiter.rate == 10.0
+
+def test_throttling_halves_rate_and_pauses_for_retry_after(clock):
+    limiter = make_limiter()
+    limiter.feedback(429, {"retry-after": "3"})
+    assert limiter.rate == 5.0
+    assert limiter.throttled == 1
+    assert limiter.tokens <= 0
+    assert limiter.snapshot()["paused_seconds"] == 3.0
+    assert limiter.try_acquire() is False
+
+    # The bucket refills from empty once the pause is over
+    clock[0] += 3.0
+    assert limiter.try_acquire() is True
+
+def test_throttling_without_retry_after_pauses_one_request_interval(clock):
+    limiter = make_limiter()
+    limiter.feedback(429, {})
+    assert limiter.snapshot()["paused_seconds"] == pytest.approx(1 / 5.0)
+
+def test_decrease_stops_at_min_rate(clock):
+    limiter = make_limiter(rate=1.5)
+    limiter.feedback(429, {"retry-after": "0"})
+    limiter.feedback(429, {"retry-after": "0"})
+    assert limiter.rate == 1.0
+
+@pytest.mark.parametrize("headers", [
+    {"x-ratelimit-remaining-requests": "5"},
+    {"x-ratelimit-remaining-tokens": "900", "x-ratelimit-limit-tokens": "10000"},
+])
+def test_low_quota_slows_down_before_throttling(clock, headers):
+    limiter = make_limiter()
+    limiter.feedback(200, headers)
+    assert limiter.rate == pytest.approx(10.0 * limiter_module.LOW_QUOTA_DECREASE)
+
+def test_ample_quota_still_increases(clock):
+    limiter = make_limiter()
+    limiter.feedback(200, {"x-ratelimit-remaining-requests": "500", "x-ratelimit-remaining-tokens": "9000",
+                           "x-ratelimit-limit-tokens": "10000"})
+    assert limiter.rate == pytest.approx(10.0 + limiter_module.ADDITIVE_INCREASE_RPS)
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after-ms": "1500"}, 1.5),
+    ({"x-ms-retry-after-ms": "250", "retry-after": "9"}, 0.25),
+    ({"retry-after": "2"}, 2.0),
+    ({"retry-after": "-4"}, 0.0),
+    ({"retry-after": "soon"}, None),
+    ({}, None),
+])
+def test_parse_retry_after(headers, expected):
+    assert parse_retry_after(headers) == expected
@@ -0,0 +1,66 @@
+"""One document translated into several languages, and downloading its outputs"""
+from urllib.parse import quote
+
+import pytest
+
+from conftest import wait_for_job
+
+pytestmark = pytest.mark.anyio
+
+async def translate(service, name: str, languages) -> dict:
+    response = await service.client.post("/translate", json={
+        "source_blob_name": name,
+        "translation_config": {"target_languages": languages}
+    })
+    assert response.status_code == 200, response.text
+    return await wait_for_job(service, response.json()["job_id"])
+
+async def test_all_languages_are_translated_in_one_operation(document_service):
+    document_service.storage.put(document_service.source, "report.docx", b"report")
+
+    job = await translate(document_service, "report.docx", ["es", "fr", "de"])
+
+    assert len(document_service.translator.submitted) == 1
+    targets = document_service.translator.submitted[0][0].targets
+    assert [target.language for target in targets] == ["es", "fr", "de"]
+    assert job["status"] == "completed"
+    assert {summary["target_language"]: summary["target_blobs"] for summary in job["languages"]} == {
+        "es": ["es/translated_report.docx"],
+        "fr": ["fr/translated_report.docx"],
+        "de": ["de/translated_report.docx"]
+    }
+    assert all(summary["status"] == "completed" for summary in job["languages"])
+
+async def test_each_language_gets_its_own_output(document_service):
+    document_service.storage.put(document_service.source, "report.docx", b"report")
+
+    await translate(document_service, "report.docx", ["es", "fr"])
+
+    outputs = document_service.storage.containers[document_service.target]
+    assert outputs["es/translated_report.docx"].content == b"[es] report"
+    assert outputs["fr/translated_report.docx"].content == b"[fr] report"
+
+@pytest.mark.parametrize("path", ["es/translated_a.pdf", quote("es/translated_a.pdf", safe="")])
+async def test_download_url_route_accepts_names_with_slashes(document_service, path):
+    document_service.storage.put(document_service.target, "es/translated_a.pdf", b"pdf", content_type="application/pdf")
+
+    response = await document_service.client.get(f"/download/{path}")
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["blob_name"] == "es/translated_a.pdf"
+    assert body["download_url"].startswith(
+        f"https://teststorage.blob.core.windows.net/{document_service.target}/es/translated_a.pdf?"
+    )
+
+async def test_download_url_route_reports_missing_documents(document_service):
+    response = await document_service.client.get("/download/es/translated_missing.pdf")
+    assert response.status_code == 404
+
+async def test_content_route_is_not_shadowed_by_the_url_route(document_service):
+    document_service.storage.put(document_service.target, "es/translated_a.txt", b"hola", content_type="text/plain")
+
+    response = await document_service.client.get("/download/es/translated_a.txt/content")
+
+    assert response.status_code == 200
+    assert response.content == b"hola"
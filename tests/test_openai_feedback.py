@@ -0,0 +1,74 @@
+"""Azure OpenAI quota headers reaching the adaptive rate limiter"""
+import httpx
+import pytest
+from fastapi import FastAPI
+from openai import AzureOpenAI
+
+import services.azure_openai as azure_openai
+import services.image_generation as image_generation
+
+pytestmark = pytest.mark.anyio
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "hello"},
+        "finish_reason": "stop"
+    }]
+}
+
+IMAGES = {"created": 0, "data": [{"url": "https://images.test/1.png"}]}
+
+def fake_client(monkeypatch, module, factory: str, body: dict, headers: dict) -> None:
+    """Point a service's Azure OpenAI client at a canned response"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body, headers=headers)
+
+    client = AzureOpenAI(
+        azure_endpoint="https://openai.test",
+        api_key="test-key",
+        api_version="2024-05-01-preview",
+        max_retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(module, factory, lambda: client)
+
+async def post(router, path: str, payload: dict) -> httpx.Response:
+    app = FastAPI()
+    app.include_router(router)
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        return await client.post(path, json=payload)
+
+@pytest.mark.parametrize("headers, slows_down", [
+    ({"x-ratelimit-remaining-requests": "1"}, True),
+    ({"x-ratelimit-remaining-tokens": "100", "x-ratelimit-limit-tokens": "100000"}, True),
+    ({"x-ratelimit-remaining-requests": "500"}, False),
+])
+async def test_chat_quota_headers_adjust_the_rate(monkeypatch, upstream, headers, slows_down):
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "chat-deployment")
+    fake_client(monkeypatch, azure_openai, "get_openai_client", CHAT_COMPLETION, headers)
+    limiter = upstream.limiters.get("openai", "chat-deployment")
+    initial_rate = limiter.rate
+
+    response = await post(azure_openai.router, "/chat", {"messages": [{"role": "user", "content": "hi"}]})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["content"] == "hello"
+    assert (limiter.rate < initial_rate) is slows_down
+    assert (limiter.rate > initial_rate) is not slows_down
+
+async def test_image_quota_headers_slow_the_rate(monkeypatch, upstream):
+    monkeypatch.setenv("AZURE_OPENAI_IMAGE_DEPLOYMENT_NAME", "image-deployment")
+    fake_client(monkeypatch, image_generation, "get_image_client", IMAGES, {"x-ratelimit-remaining-requests": "0"})
+    limiter = upstream.limiters.get("image_generation", "image-deployment")
+    initial_rate = limiter.rate
+
+    response = await post(image_generation.router, "/generate", {"prompt": "a lighthouse at dusk"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["image_url"] == "https://images.test/1.png"
+    assert limiter.rate < initial_rate
@@ -0,0 +1,212 @@
+"""Central polling of in-flight Document Translation operations"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from services.document_intelligence import full_service, poller as poller_module
+from services.document_intelligence.jobs import translation_jobs
+from services.document_intelligence.models import (
+    DocumentTranslationRequest, TranslationJobType, TranslationStatus
+)
+from services.document_intelligence.poller import TrackedOperation, TranslationOperationPoller
+
+pytestmark = pytest.mark.anyio
+
+SOURCE_URL = "https://teststorage.blob.core.windows.net/{container}/{name}"
+
+class ScriptedTranslationClient:
+    """Replays a fixed sequence of operation states, repeating the last one
+
+    Each state is either a list of per-document statuses or an exception to raise.
+    """
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.status_checks = 0
+        self.document_listings = 0
+        self._current = None
+
+    async def get_translation_status(self, operation_id):
+        self.status_checks += 1
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if isinstance(state, Exception):
+            raise state
+        self._current = state
+        finished = [status for status in state if status != "Running"]
+        succeeded = state.count("Succeeded")
+        return SimpleNamespace(
+            status="Succeeded" if len(finished) == len(state) else "Running",
+            documents_succeeded_count=succeeded,
+            documents_failed_count=len(finished) - succeeded,
+            documents_cancelled_count=0,
+            error=None
+        )
+
+    async def list_document_statuses(self, operation_id):
+        self.document_listings += 1
+        config = full_service.get_config()
+        for index, status in enumerate(self._current):
+            name = f"doc{index}.docx"
+            yield SimpleNamespace(
+                source_document_url=SOURCE_URL.format(container=config.source_container_name, name=name),
+                translated_document_url=(
+                    SOURCE_URL.format(container=config.target_container_name, name=f"es/translated_{name}")
+                    if status == "Succeeded" else None
+                ),
+                translated_to="es",
+                status=status,
+                characters_charged=10 if status == "Succeeded" else 0,
+                error=None
+            )
+
+    async def close(self):
+        pass
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(poller_module, "MIN_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(poller_module, "POLL_SECONDS_PER_MB", 0.0)
+
+@pytest.fixture
+def job():
+    """A running two-document job in the job store"""
+    job_id = "job-1"
+    translation_jobs[job_id] = full_service._new_job_record(
+        job_id,
+        TranslationJobType.BATCH,
+        "",
+        DocumentTranslationRequest(target_language="es"),
+        ["doc0.docx", "doc1.docx"]
+    )
+    translation_jobs[job_id]["status"] = TranslationStatus.RUNNING
+    yield job_id
+    translation_jobs.clear()
+
+async def run_poller(client, fn):
+    poller = TranslationOperationPoller()
+    poller._client = client
+    try:
+        return await asyncio.wait_for(fn(poller), 5)
+    finally:
+        await poller.stop()
+
+async def test_finished_operation_resolves_its_waiter(fast_polling, job):
+    client = ScriptedTranslationClient([["Running", "Running"], ["Succeeded", "Succeeded"]])
+
+    async def scenario(poller):
+        result = await poller.track(job, "operation-1")
+        return result, poller.in_flight
+
+    result, in_flight = await run_poller(client, scenario)
+
+    assert result.status == "Succeeded"
+    assert [doc.target_blob for doc in result.documents] == ["es/translated_doc0.docx", "es/translated_doc1.docx"]
+    assert in_flight == 0
+
+async def test_progress_is_published_only_when_documents_finish(fast_polling, job):
+    client = ScriptedTranslationClient([
+        ["Running", "Running"],
+        ["Running", "Running"],
+        ["Succeeded", "Running"],
+        ["Succeeded", "Running"],
+        ["Succeeded", "Succeeded"]
+    ])
+    progress = []
+
+    async def scenario(poller):
+        future = poller.track(job, "operation-1")
+        while not future.done():
+            record = translation_jobs[job]
+            progress.append((record["documents_completed"], [doc.status for doc in record["documents"]]))
+            await asyncio.sleep(0.005)
+        return await future
+
+    await run_poller(client, scenario)
+
+    assert (1, ["Succeeded", "Running"]) in progress
+    # Five status checks, but the document list is only read when the finished count changed
+    assert client.status_checks == 5
+    assert client.document_listings == 3
+
+async def test_operation_gone_from_azure_is_given_up(fast_polling, job):
+    client = ScriptedTranslationClient([ResourceNotFoundError("gone")])
+
+    result = await run_poller(client, lambda poller: poller.track(job, "operation-1"))
+
+    assert result.status == "Failed"
+    assert result.error_message == "Translation operation no longer exists"
+
+async def test_repeatedly_failing_checks_are_given_up(fast_polling, job, monkeypatch):
+    monkeypatch.setattr(poller_module, "MAX_CONSECUTIVE_CHECK_FAILURES", 3)
+    client = ScriptedTranslationClient([RuntimeError("unavailable")])
+
+    result = await run_poller(client, lambda poller: poller.track(job, "operation-1"))
+
+    assert result.status == "Failed"
+    assert "failed 3 times in a row" in result.error_message
+    assert client.status_checks == 3
+
+async def test_a_successful_check_resets_the_failure_count(fast_polling, job, monkeypatch):
+    monkeypatch.setattr(poller_module, "MAX_CONSECUTIVE_CHECK_FAILURES", 2)
+    client = ScriptedTranslationClient([
+        RuntimeError("unavailable"),
+        ["Running", "Running"],
+        RuntimeError("unavailable"),
+        ["Succeeded", "Succeeded"]
+    ])
+
+    result = await run_poller(client, lambda poller: poller.track(job, "operation-1"))
+
+    assert result.status == "Succeeded"
+
+async def test_cancelled_job_stops_being_polled(fast_polling, job):
+    client = ScriptedTranslationClient([["Running", "Running"]])
+
+    async def scenario(poller):
+        future = poller.track(job, "operation-1")
+        translation_jobs[job]["status"] = TranslationStatus.CANCELLED
+        return await future, poller.in_flight
+
+    result, in_flight = await run_poller(client, scenario)
+
+    assert result.status == "Cancelled"
+    assert in_flight == 0
+    assert client.status_checks == 0
+
+async def test_untrack_resolves_the_waiter_as_cancelled(job):
+    client = ScriptedTranslationClient([["Running", "Running"]])
+
+    async def scenario(poller):
+        future = poller.track(job, "operation-1")
+        poller.untrack("operation-1")
+        return await future
+
+    result = await run_poller(client, scenario)
+
+    assert result.status == "Cancelled"
+
+async def test_one_task_polls_every_operation(fast_polling, job):
+    client = ScriptedTranslationClient([["Running", "Running"], ["Succeeded", "Succeeded"]])
+
+    async def scenario(poller):
+        futures = [poller.track(job, f"operation-{index}") for index in range(3)]
+        task = poller._task
+        results = await asyncio.gather(*futures)
+        return results, task is poller._task
+
+    results, same_task = await run_poller(client, scenario)
+
+    assert [result.status for result in results] == ["Succeeded"] * 3
+    assert same_task
+
+def test_poll_interval_grows_with_size_and_age():
+    mb = 1024 * 1024
+    small = TrackedOperation("job", "small", 0, started_at=0.0, next_check_at=0.0, future=None)
+    large = TrackedOperation("job", "large", 20 * mb, started_at=0.0, next_check_at=0.0, future=None)
+
+    assert small.poll_interval(0.0) == poller_module.MIN_POLL_INTERVAL_SECONDS
+    assert large.poll_interval(0.0) == poller_module.MIN_POLL_INTERVAL_SECONDS + 20 * poller_module.POLL_SECONDS_PER_MB
+    assert small.poll_interval(poller_module.POLL_BACKOFF_AGE_SECONDS) == 2 * poller_module.MIN_POLL_INTERVAL_SECONDS
+    assert small.poll_interval(1e9) == poller_module.MAX_POLL_INTERVAL_SECONDS
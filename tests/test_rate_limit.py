@@ -0,0 +1,74 @@
+"""Sliding-window maths and the in-memory backend of the inbound rate limiter"""
+import asyncio
+
+import pytest
+
+from rate_limit import MemoryRateLimitBackend, _client_key, _retry_after, _weighted_usage, route_cost
+
+@pytest.mark.parametrize("previous, current, elapsed_fraction, expected", [
+    (0, 0, 0.0, 0.0),
+    (10, 0, 0.0, 10.0),
+    (10, 4, 0.25, 11.5),
+    (10, 4, 0.5, 9.0),
+    (10, 4, 1.0, 4.0),
+])
+def test_weighted_usage_fades_previous_window(previous, current, elapsed_fraction, expected):
+    assert _weighted_usage(previous, current, elapsed_fraction) == pytest.approx(expected)
+
+def test_retry_after_waits_for_next_window_when_current_window_is_full():
+    assert _retry_after(limit=10, previous=0, current=10, cost=1, window=60, elapsed=15) == 45
+
+def test_retry_after_waits_for_next_window_without_previous_traffic():
+    assert _retry_after(limit=10, previous=0, current=5, cost=8, window=60, elapsed=20) == 40
+
+def test_retry_after_waits_until_previous_window_slides_out():
+    # 20 * 0.5 + 2 = 12 units now; 20 * 0.35 + 2 + 1 fits the limit of 10 at 65% of the window
+    assert _retry_after(limit=10, previous=20, current=2, cost=1, window=60, elapsed=30) == pytest.approx(9.0)
+
+@pytest.mark.parametrize("previous, current, cost, elapsed", [(20, 2, 1, 30), (50, 0, 3, 10), (11, 9, 1, 1)])
+def test_request_fits_exactly_after_retry_after(previous, current, cost, elapsed):
+    limit, window = 10, 60
+    wait = _retry_after(limit, previous, current, cost, window, elapsed)
+    assert _weighted_usage(previous, current, (elapsed + wait) / window) + cost == pytest.approx(limit)
+
+def test_retry_after_is_never_negative():
+    assert _retry_after(limit=10, previous=20, current=0, cost=1, window=60, elapsed=59) == 0.0
+
+def hit(backend, now, cost=1, key="ip:1.2.3.4"):
+    return asyncio.run(backend.hit(key, cost, limit=10, window=60, now=now))
+
+def test_memory_backend_rejects_over_budget_without_charging():
+    backend = MemoryRateLimitBackend()
+    assert hit(backend, 600.0, cost=10) == (True, 10, 0.0)
+    allowed, usage, retry_after = hit(backend, 610.0)
+    assert (allowed, usage, retry_after) == (False, 10, 50.0)
+    assert hit(backend, 610.0, key="ip:5.6.7.8")[0] is True
+
+def test_memory_backend_carries_previous_window_into_the_next():
+    backend = MemoryRateLimitBackend()
+    hit(backend, 600.0, cost=10)
+    # 45 seconds into the next window a quarter of the previous count remains
+    allowed, usage, _ = hit(backend, 705.0, cost=2)
+    assert allowed is True
+    assert usage == pytest.approx(10 * 0.25 + 2)
+
+def test_memory_backend_forgets_counts_older_than_one_window():
+    backend = MemoryRateLimitBackend()
+    hit(backend, 600.0, cost=10)
+    assert hit(backend, 730.0, cost=10) == (True, 10, 0.0)
+
+def test_client_key_ignores_client_chosen_headers():
+    scope = {"headers": [(b"x-api-key", b"anything")], "client": ("10.0.0.1", 5000)}
+    assert _client_key(scope) == "ip:10.0.0.1"
+    assert _client_key({"headers": [], "client": None}) == "ip:unknown"
+
+@pytest.mark.parametrize("path, cost", [
+    ("/index.html", 0),
+    ("/api/health", 0),
+    ("/api/openai/health", 0),
+    ("/api/image-generation/generate", 20),
+    ("/api/openai/chat", 3),
+    ("/api/anything-else", 1),
+])
+def test_route_cost(path, cost):
+    assert route_cost(path) == cost
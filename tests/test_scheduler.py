@@ -0,0 +1,100 @@
+"""Translation scheduler ordering and cancellation"""
+import asyncio
+
+import pytest
+
+from services.document_intelligence import scheduler as scheduler_module
+from services.document_intelligence.scheduler import QueuedJob, TranslationScheduler, queue_rank
+
+async def _noop() -> None:
+    pass
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Enqueue times under test control"""
+    now = [1000.0]
+    monkeypatch.setattr(scheduler_module.time, "monotonic", lambda: now[0])
+    return now
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """A scheduler whose workers are never started, so jobs stay queued"""
+    instance = TranslationScheduler()
+
+    async def start() -> None:
+        pass
+
+    monkeypatch.setattr(instance, "start", start)
+    return instance
+
+def test_queue_rank_adds_size_handicap():
+    assert queue_rank(100.0, 0) == 100.0
+    assert queue_rank(100.0, 1024 * 1024) == 100.0 + scheduler_module.QUEUE_SECONDS_PER_MB
+
+def test_queued_jobs_order_by_priority_then_rank_then_sequence():
+    urgent = QueuedJob(-1, 50.0, 2, "urgent", _noop)
+    early = QueuedJob(0, 10.0, 1, "early", _noop)
+    late = QueuedJob(0, 20.0, 0, "late", _noop)
+    tie = QueuedJob(0, 20.0, 3, "tie", _noop)
+    assert sorted([tie, late, early, urgent]) == [urgent, early, late, tie]
+
+def test_higher_priority_runs_first(scheduler, clock):
+    async def scenario():
+        await scheduler.submit("normal", _noop)
+        await scheduler.submit("urgent", _noop, priority=-1)
+        return scheduler.jobs_ahead("normal"), scheduler.queue_position("urgent")
+
+    ahead, position = asyncio.run(scenario())
+    assert ahead == ["urgent"]
+    assert position == 1
+
+def test_large_job_waits_behind_newer_small_jobs_until_aged(scheduler, clock):
+    ten_mb = 10 * 1024 * 1024
+
+    async def scenario():
+        await scheduler.submit("large", _noop, source_bytes=ten_mb)
+        clock[0] += 5
+        await scheduler.submit("small_soon", _noop)
+        clock[0] += 30
+        await scheduler.submit("small_late", _noop)
+        return scheduler.jobs_ahead("large"), scheduler.jobs_ahead("small_late")
+
+    ahead_of_large, ahead_of_late = asyncio.run(scenario())
+    # 10 MB is a 20 second handicap: it yields to a job 5 seconds newer but not to one 35 seconds newer
+    assert ahead_of_large == ["small_soon"]
+    assert ahead_of_late == ["small_soon", "large"]
+
+def test_cancel_queued_removes_waiting_job(scheduler, clock):
+    async def scenario():
+        await scheduler.submit("first", _noop)
+        await scheduler.submit("second", _noop)
+        cancelled = scheduler.cancel_queued("first")
+        return cancelled, scheduler.cancel_queued("first"), scheduler.is_queued("first")
+
+    cancelled, cancelled_again, still_queued = asyncio.run(scenario())
+    assert cancelled is True
+    assert cancelled_again is False
+    assert still_queued is False
+    assert scheduler.queue_depth == 1
+    assert scheduler.queue_position("second") == 1
+    assert scheduler.queue_position("first") is None
+
+def test_cancelled_job_is_skipped_by_workers(scheduler, clock):
+    async def scenario():
+        await scheduler.submit("cancelled", _noop)
+        await scheduler.submit("kept", _noop)
+        scheduler.cancel_queued("cancelled")
+        return await asyncio.wait_for(scheduler._next_job(), timeout=1)
+
+    assert asyncio.run(scenario()).job_id == "kept"
+    assert scheduler.queue_depth == 0
+
+def test_submit_rejects_when_queue_is_full(scheduler, clock, monkeypatch):
+    monkeypatch.setenv("TRANSLATION_QUEUE_MAX_SIZE", "1")
+
+    async def scenario():
+        await scheduler.submit("first", _noop)
+        await scheduler.submit("second", _noop)
+
+    with pytest.raises(scheduler_module.QueueFullError):
+        asyncio.run(scenario())
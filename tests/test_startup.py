@@ -0,0 +1,103 @@
+"""Service startup with slow or unreachable storage, and the service health routes"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from health import health_monitor
+from services.content_safety import router as content_safety_router
+from services.document_intelligence import full_service, router
+from services.document_intelligence.blob_storage import blob_storage
+
+pytestmark = pytest.mark.anyio
+
+async def idle(*args) -> None:
+    await asyncio.Event().wait()
+
+@pytest.fixture
+def quiet_background_loops(monkeypatch):
+    """Background loops that never touch Azure"""
+    monkeypatch.setattr(full_service.supported_languages, "run_refresh", idle)
+    monkeypatch.setattr(full_service.blob_index, "run_sweep", idle)
+    monkeypatch.setattr(blob_storage, "run_retention", idle)
+    monkeypatch.setattr(blob_storage, "_containers_ready", False)
+
+async def run_handlers(handlers) -> None:
+    for handler in handlers:
+        await asyncio.wait_for(handler(), 1)
+
+@pytest.fixture
+async def lifespan():
+    """Runs the service's startup hooks when called; shutdown hooks always run afterwards"""
+    yield lambda: run_handlers(router.on_startup)
+    await run_handlers(router.on_shutdown)
+
+async def test_startup_does_not_wait_for_unreachable_storage(document_service, quiet_background_loops, lifespan, monkeypatch):
+    bootstrap_started = asyncio.Event()
+
+    async def hanging_bootstrap() -> bool:
+        bootstrap_started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(blob_storage, "_bootstrap_containers", hanging_bootstrap)
+
+    await lifespan()
+    await asyncio.wait_for(bootstrap_started.wait(), 1)
+
+    # Requests are served while the bootstrap is still waiting on storage
+    response = await document_service.client.get("/jobs")
+    assert response.status_code == 200
+    assert not blob_storage._containers_ready
+    assert not all(task.done() for task in full_service._background_tasks)
+
+async def test_first_upload_retries_a_failed_bootstrap(document_service, quiet_background_loops, lifespan, monkeypatch):
+    attempts = []
+    bootstrap_containers = blob_storage._bootstrap_containers
+
+    async def flaky_bootstrap() -> bool:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            return False
+        return await bootstrap_containers()
+
+    monkeypatch.setattr(blob_storage, "_bootstrap_containers", flaky_bootstrap)
+
+    await lifespan()
+    while not attempts:
+        await asyncio.sleep(0.01)
+    assert not blob_storage._containers_ready
+
+    response = await document_service.client.post("/upload", files={"file": ("note.txt", b"hello", "text/plain")})
+
+    assert response.status_code == 200, response.text
+    assert len(attempts) == 2
+    assert blob_storage._containers_ready
+
+async def test_document_service_health_serves_the_cached_storage_probe(document_service, monkeypatch):
+    checks = []
+
+    async def check_storage_access() -> bool:
+        checks.append(True)
+        return True
+
+    monkeypatch.setattr(blob_storage, "check_storage_access", check_storage_access)
+    await health_monitor.probe("document_intelligence")
+
+    first = (await document_service.client.get("/health")).json()
+    second = (await document_service.client.get("/health")).json()
+
+    assert first["storage_accessible"] is True
+    assert first["checked_at"] == second["checked_at"]
+    assert len(checks) == 1
+
+async def test_configuration_health_is_reported_live(monkeypatch):
+    app = FastAPI()
+    app.include_router(content_safety_router, prefix="/api/content-safety")
+    async with httpx.AsyncClient(app=app, base_url="http://test/api/content-safety") as client:
+        monkeypatch.delenv("AZURE_CONTENT_SAFETY_API_KEY", raising=False)
+        assert (await client.get("/health")).json()["configured"] is False
+
+        monkeypatch.setenv("AZURE_CONTENT_SAFETY_API_KEY", "key")
+        monkeypatch.setenv("AZURE_CONTENT_SAFETY_ENDPOINT", "https://safety.test")
+        assert (await client.get("/health")).json()["configured"] is True
@@ -0,0 +1,66 @@
+"""Content-hash deduplication of uploads"""
+import pytest
+
+from services.document_intelligence.blob_index import blob_index
+from services.document_intelligence.blob_storage import blob_storage
+
+pytestmark = pytest.mark.anyio
+
+async def upload(service, content: bytes = b"same content", owner=None, filename: str = "report.txt") -> dict:
+    response = await service.client.post(
+        "/upload",
+        files={"file": (filename, content, "text/plain")},
+        data={"owner": owner} if owner else None
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+async def test_same_owner_reuses_the_existing_blob(document_service):
+    first = await upload(document_service, owner="alice")
+    second = await upload(document_service, owner="alice", filename="copy.txt")
+
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert second["blob_name"] == first["blob_name"]
+    assert second["content_hash"] == first["content_hash"]
+    assert list(document_service.storage.containers[document_service.source]) == [first["blob_name"]]
+
+async def test_other_owners_get_their_own_blob(document_service):
+    alice = await upload(document_service, owner="alice")
+    bob = await upload(document_service, owner="bob")
+
+    assert bob["deduplicated"] is False
+    assert bob["blob_name"] != alice["blob_name"]
+    stored = document_service.storage.containers[document_service.source]
+    assert stored[bob["blob_name"]].metadata["owner"] == "bob"
+
+    await blob_index.sweep(blob_storage, None)
+    response = await document_service.client.get("/blobs", params={"owner": "bob"})
+    assert [blob["name"] for blob in response.json()["blobs"]] == [bob["blob_name"]]
+
+async def test_anonymous_uploads_are_not_matched_with_owned_ones(document_service):
+    owned = await upload(document_service, owner="alice")
+    anonymous = await upload(document_service)
+    again = await upload(document_service)
+
+    assert anonymous["blob_name"] != owned["blob_name"]
+    assert anonymous["deduplicated"] is False
+    assert again["deduplicated"] is True
+    assert again["blob_name"] == anonymous["blob_name"]
+
+async def test_deleted_blob_is_not_reused(document_service):
+    first = await upload(document_service, owner="alice")
+    del document_service.storage.containers[document_service.source][first["blob_name"]]
+    await blob_index.sweep(blob_storage, None)
+
+    second = await upload(document_service, owner="alice")
+
+    assert second["deduplicated"] is False
+    assert second["blob_name"] in document_service.storage.containers[document_service.source]
+
+async def test_different_content_is_stored_separately(document_service):
+    first = await upload(document_service, b"one", owner="alice")
+    second = await upload(document_service, b"two", owner="alice")
+
+    assert second["deduplicated"] is False
+    assert second["content_hash"] != first["content_hash"]
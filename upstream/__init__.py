@@ -0,0 +1,27 @@
+"""
+Upstream Call Management
+Shared handling of calls from the service routers to Azure
+"""
+from .limiter import (
+    AdaptiveRateLimiter, RateLimiterRegistry, UpstreamThrottledError,
+    rate_limiters, parse_retry_after
+)
+from .breaker import BreakerState, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, circuit_breakers
+from .policy import UpstreamPolicy, LatencyTracker, upstream_policy, call_upstream
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "RateLimiterRegistry",
+    "UpstreamThrottledError",
+    "rate_limiters",
+    "parse_retry_after",
+    "BreakerState",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "circuit_breakers",
+    "UpstreamPolicy",
+    "LatencyTracker",
+    "upstream_policy",
+    "call_upstream"
+]
@@ -0,0 +1,188 @@
+"""
+Upstream Circuit Breakers
+Per-service breakers that stop sending requests to a degraded Azure service and probe its recovery
+"""
+import time
+import logging
+from collections import deque
+from enum import Enum
+from typing import Dict, Any, Optional
+
+from config import get_config
+from .limiter import UpstreamThrottledError
+
+logger = logging.getLogger(__name__)
+
+# Outcomes kept per breaker, however short the window
+MAX_WINDOW_OUTCOMES = 1000
+
+class BreakerState(str, Enum):
+    """Circuit breaker state enumeration"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitOpenError(UpstreamThrottledError):
+    """Raised instead of calling an upstream service whose circuit breaker is open"""
+
+    def __init__(self, service: str, retry_after: float):
+        super().__init__(service, retry_after, reason="is unavailable (circuit open)")
+
+class CircuitBreaker:
+    """Opens on a high rolling error or slow-call rate, then lets a few probes decide recovery"""
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float,
+        min_calls: int,
+        error_rate: float,
+        slow_rate: float,
+        open_seconds: float,
+        probes: int
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self.probes = probes
+        self.state = BreakerState.CLOSED
+        self.opened = 0
+        self.rejected = 0
+        # Rolling outcomes as (time, failed, slow) with running totals
+        self._outcomes: deque = deque()
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probes_passed = 0
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets probes through"""
+        return max(self._opened_at + self.open_seconds - time.monotonic(), 0.0)
+
+    def check(self) -> None:
+        """Fail fast while the breaker is open (takes no probe slot)"""
+        if self.state == BreakerState.OPEN and self.retry_after > 0:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.retry_after)
+
+    def allow(self) -> None:
+        """Admit one request; every admitted request must be followed by release()"""
+        if self.state == BreakerState.CLOSED:
+            return
+        if self.state == BreakerState.OPEN:
+            self.check()
+            self.state = BreakerState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probes_passed = 0
+            logger.info(f"{self.name} circuit half-open, probing recovery")
+        if self._probes_in_flight + self._probes_passed >= self.probes:
+            # Probe slots are taken; the rest wait for their verdict
+            self.rejected += 1
+            raise CircuitOpenError(self.name, 1.0)
+        self._probes_in_flight += 1
+
+    def release(self, failed: Optional[bool], slow: bool = False) -> None:
+        """Record the outcome of an admitted request (None when it says nothing about health)"""
+        if self.state == BreakerState.HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            if failed:
+                self._open()
+            elif failed is False:
+                self._probes_passed += 1
+                if self._probes_passed >= self.probes:
+                    self._close()
+            return
+
+        if failed is None or self.state != BreakerState.CLOSED:
+            return
+
+        now = time.monotonic()
+        self._outcomes.append((now, failed, slow))
+        self._failures += failed
+        self._slow += slow
+        self._prune(now)
+
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and (
+            self._failures / calls >= self.error_rate or self._slow / calls >= self.slow_rate
+        ):
+            self._open()
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes that left the rolling window"""
+        while self._outcomes and (
+            self._outcomes[0][0] < now - self.window_seconds or len(self._outcomes) > MAX_WINDOW_OUTCOMES
+        ):
+            _, failed, slow = self._outcomes.popleft()
+            self._failures -= failed
+            self._slow -= slow
+
+    def _open(self) -> None:
+        calls = len(self._outcomes)
+        logger.warning(
+            f"{self.name} circuit opened for {self.open_seconds:.0f}s "
+            f"({self._failures}/{calls} failed, {self._slow}/{calls} slow)"
+        )
+        self.state = BreakerState.OPEN
+        self.opened += 1
+        self._opened_at = time.monotonic()
+        self._reset_window()
+
+    def _close(self) -> None:
+        logger.info(f"{self.name} circuit closed after {self._probes_passed} successful probes")
+        self.state = BreakerState.CLOSED
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current breaker state for health output"""
+        self._prune(time.monotonic())
+        calls = len(self._outcomes)
+        return {
+            "state": self.state.value,
+            "calls_in_window": calls,
+            "error_rate": round(self._failures / calls, 3) if calls else 0.0,
+            "slow_rate": round(self._slow / calls, 3) if calls else 0.0,
+            "retry_after_seconds": round(self.retry_after, 1) if self.state == BreakerState.OPEN else 0.0,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per upstream service"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, service: str) -> CircuitBreaker:
+        """Breaker for a service (shared by all of its operations and deployments)"""
+        breaker = self._breakers.get(service)
+        if breaker is None:
+            settings = get_config().upstream
+            breaker = CircuitBreaker(
+                service,
+                window_seconds=settings.breaker_window_seconds,
+                min_calls=settings.breaker_min_calls,
+                error_rate=settings.breaker_error_rate,
+                slow_rate=settings.breaker_slow_rate,
+                open_seconds=settings.breaker_open_seconds,
+                probes=settings.breaker_probes
+            )
+            self._breakers[service] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """State of every breaker in use"""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
+
+# Global circuit breaker registry
+circuit_breakers = CircuitBreakerRegistry()
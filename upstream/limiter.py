@@ -0,0 +1,180 @@
+"""
+Adaptive Upstream Rate Limiting
+Per-service token buckets whose rate follows Azure's throttling feedback (AIMD)
+"""
+import time
+import asyncio
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Rate gained (requests/second) for every request Azure accepts without warning
+ADDITIVE_INCREASE_RPS = 0.1
+
+# Rate kept after a 429
+MULTIPLICATIVE_DECREASE = 0.5
+
+# Rate kept when Azure reports the quota is nearly used up
+LOW_QUOTA_DECREASE = 0.9
+
+# Remaining requests (or fraction of remaining tokens) below which the limiter slows down early
+LOW_REMAINING_REQUESTS = 5
+LOW_REMAINING_TOKEN_FRACTION = 0.1
+
+class UpstreamThrottledError(Exception):
+    """Raised when an upstream service has no capacity within the caller's wait budget"""
+
+    def __init__(self, service: str, retry_after: float, reason: str = "is rate limited"):
+        super().__init__(f"{service} {reason}, retry in {retry_after:.1f}s")
+        self.service = service
+        self.retry_after = retry_after
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait according to Retry-After (seconds or HTTP date) or its millisecond variants"""
+    for header in ("retry-after-ms", "x-ms-retry-after-ms"):
+        value = headers.get(header)
+        if value:
+            try:
+                return max(float(value) / 1000, 0.0)
+            except ValueError:
+                pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+def _quota_low(headers: Mapping[str, str]) -> bool:
+    """Whether x-ratelimit-remaining-* headers say the quota is about to run out"""
+    remaining_requests = _header_number(headers, "x-ratelimit-remaining-requests")
+    if remaining_requests is not None and remaining_requests <= LOW_REMAINING_REQUESTS:
+        return True
+
+    remaining_tokens = _header_number(headers, "x-ratelimit-remaining-tokens")
+    limit_tokens = _header_number(headers, "x-ratelimit-limit-tokens")
+    return bool(
+        remaining_tokens is not None and limit_tokens
+        and remaining_tokens / limit_tokens <= LOW_REMAINING_TOKEN_FRACTION
+    )
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate grows additively while Azure accepts requests and halves on 429"""
+
+    def __init__(self, name: str, initial_rate: float, min_rate: float, max_rate: float, burst: int):
+        self.name = name
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Waiters queue on the lock, so capacity is handed out first come, first served
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, max_wait: float) -> None:
+        """Take one request slot, waiting up to max_wait seconds for it"""
+        deadline = time.monotonic() + max_wait
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(self._paused_until - now, 0.0)
+                if wait == 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                if now + wait > deadline:
+                    raise UpstreamThrottledError(self.name, wait)
+                await asyncio.sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take one request slot only if it is free right now (never waits)"""
+        if self._lock.locked():
+            # Queued callers come first
+            return False
+        now = time.monotonic()
+        self._refill(now)
+        if self._paused_until > now or self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def feedback(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjust the rate from one upstream response"""
+        if status_code == 429:
+            self.throttled += 1
+            self.rate = max(self.rate * MULTIPLICATIVE_DECREASE, self.min_rate)
+            self.tokens = min(self.tokens, 0.0)
+            pause = parse_retry_after(headers)
+            if pause is None:
+                pause = 1 / self.rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            logger.warning(f"{self.name} throttled (429); rate lowered to {self.rate:.2f}/s, pausing {pause:.1f}s")
+        elif _quota_low(headers):
+            # Slow down before Azure starts rejecting requests
+            self.rate = max(self.rate * LOW_QUOTA_DECREASE, self.min_rate)
+        elif status_code < 500:
+            self.rate = min(self.rate + ADDITIVE_INCREASE_RPS, self.max_rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limiter state for health output"""
+        return {
+            "rate_per_second": round(self.rate, 2),
+            "available": round(min(self.burst, self.tokens + (time.monotonic() - self._updated) * self.rate), 2),
+            "paused_seconds": round(max(self._paused_until - time.monotonic(), 0.0), 2),
+            "throttled": self.throttled
+        }
+
+class RateLimiterRegistry:
+    """One adaptive limiter per upstream service and deployment"""
+
+    def __init__(self):
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def get(self, service: str, deployment: Optional[str] = None) -> AdaptiveRateLimiter:
+        """Limiter for a service (and deployment, whose quotas are separate in Azure OpenAI)"""
+        name = f"{service}/{deployment}" if deployment else service
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            settings = get_config().upstream
+            limiter = AdaptiveRateLimiter(
+                name,
+                initial_rate=settings.initial_rps,
+                min_rate=settings.min_rps,
+                max_rate=settings.max_rps,
+                burst=settings.burst
+            )
+            self._limiters[name] = limiter
+        return limiter
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """State of every limiter in use"""
+        return {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+
+# Global rate limiter registry
+rate_limiters = RateLimiterRegistry()
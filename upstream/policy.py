@@ -0,0 +1,308 @@
+"""
+Upstream Call Policy
+Circuit breaking, rate limiting, retries, adaptive timeouts and request hedging for calls to Azure
+"""
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Any, Optional, Callable, TypeVar, Tuple, Mapping
+
+import requests
+
+from config import get_config
+from metrics import metrics
+from .limiter import AdaptiveRateLimiter, rate_limiters
+from .breaker import BreakerState, CircuitBreaker, circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Status codes worth retrying: Azure did not produce an answer, but might on the next attempt
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+
+# Errors raised before any response arrived (connection failures and timeouts)
+TRANSIENT_ERRORS: Tuple[type, ...] = (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)
+try:
+    import openai
+    TRANSIENT_ERRORS += (openai.APIConnectionError,)  # Includes APITimeoutError
+except ImportError:
+    pass
+
+# Jittered exponential backoff between retries
+RETRY_BASE_DELAY_SECONDS = 0.2
+RETRY_MAX_DELAY_SECONDS = 2.0
+
+# Latency samples kept per operation, and how many are needed before percentiles are trusted
+LATENCY_WINDOW = 512
+MIN_LATENCY_SAMPLES = 20
+
+# Percentiles are recomputed after this many new samples
+PERCENTILE_REFRESH_SAMPLES = 16
+
+# Adaptive timeouts are this multiple of the observed p99, never below the floor
+TIMEOUT_P99_MULTIPLIER = 3.0
+MIN_TIMEOUT_SECONDS = 1.0
+
+# Calls slower than this fraction of the service's timeout ceiling count as slow for its circuit breaker
+SLOW_CALL_FRACTION = 0.5
+
+# Timeout ceilings for services whose calls are slow by nature; others use UPSTREAM_DEFAULT_TIMEOUT_SECONDS
+SERVICE_TIMEOUT_CEILINGS = {
+    "translator": 10.0,
+    "openai": 90.0,
+    "image_generation": 120.0
+}
+
+def _response_details(response: Any) -> Tuple[Optional[int], Mapping[str, str]]:
+    """Status code and headers of a requests/httpx response or raw SDK response (None for parsed SDK results)"""
+    status_code = getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None)
+    return status_code, headers if headers is not None else {}
+
+def is_transient(error: Exception) -> bool:
+    """Whether a failed call may succeed if repeated"""
+    status_code = _response_details(getattr(error, "response", None))[0] or getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code in TRANSIENT_STATUS_CODES
+    return isinstance(error, TRANSIENT_ERRORS)
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before the given retry (0-based)"""
+    return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+
+class LatencyTracker:
+    """Recent latencies of one upstream operation, with cached tail percentiles"""
+
+    def __init__(self, service: str, operation: str, timeout_ceiling: float):
+        self.service = service
+        self.operation = operation
+        self.timeout_ceiling = timeout_ceiling
+        self.p95: Optional[float] = None
+        self.p99: Optional[float] = None
+        self.retries = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self._samples: deque = deque(maxlen=LATENCY_WINDOW)
+        self._new_samples = 0
+
+    def record(self, seconds: float) -> None:
+        """Add one observed latency"""
+        self._samples.append(seconds)
+        self._new_samples += 1
+        if self._new_samples >= PERCENTILE_REFRESH_SAMPLES or (self.p99 is None and len(self._samples) >= MIN_LATENCY_SAMPLES):
+            self._new_samples = 0
+            if len(self._samples) >= MIN_LATENCY_SAMPLES:
+                ordered = sorted(self._samples)
+                self.p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+                self.p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+
+    @property
+    def timeout(self) -> float:
+        """Per-attempt timeout: a multiple of the observed p99, or the ceiling until enough is known"""
+        if self.p99 is None:
+            return self.timeout_ceiling
+        return min(max(self.p99 * TIMEOUT_P99_MULTIPLIER, MIN_TIMEOUT_SECONDS), self.timeout_ceiling)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current latency statistics"""
+        return {
+            "samples": len(self._samples),
+            "p95_seconds": round(self.p95, 3) if self.p95 is not None else None,
+            "p99_seconds": round(self.p99, 3) if self.p99 is not None else None,
+            "timeout_seconds": round(self.timeout, 3),
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won
+        }
+
+class UpstreamPolicy:
+    """Applies the shared call policy to every upstream request of the service routers"""
+
+    def __init__(self):
+        self._trackers: Dict[str, LatencyTracker] = {}
+
+    def tracker(self, service: str, operation: str) -> LatencyTracker:
+        """Latency tracker of one service operation"""
+        name = f"{service}.{operation}"
+        tracker = self._trackers.get(name)
+        if tracker is None:
+            ceiling = SERVICE_TIMEOUT_CEILINGS.get(service, get_config().upstream.default_timeout_seconds)
+            tracker = self._trackers[name] = LatencyTracker(service, operation, ceiling)
+        return tracker
+
+    async def call(
+        self,
+        service: str,
+        operation: str,
+        call: Callable[[float], T],
+        idempotent: bool = False,
+        hedge: bool = False,
+        deployment: Optional[str] = None
+    ) -> T:
+        """Run a blocking upstream call (given its timeout in seconds) in a worker thread
+
+        Calls fail fast with CircuitOpenError while the service's breaker is open. Every
+        attempt passes the service's rate limiter. Idempotent calls are retried on transient
+        failures, and hedged calls get a second concurrent attempt once the first outlives
+        the operation's p95 latency.
+        """
+        settings = get_config().upstream
+        breaker = circuit_breakers.get(service)
+        breaker.check()
+        limiter = rate_limiters.get(service, deployment)
+        tracker = self.tracker(service, operation)
+        deadline = time.monotonic() + settings.max_wait_seconds
+        retries = settings.max_retries if idempotent else 0
+        hedge = hedge and idempotent and settings.hedging
+
+        for attempt in range(retries + 1):
+            try:
+                if hedge:
+                    result = await self._hedged(breaker, limiter, tracker, call, deadline)
+                else:
+                    result = await self._attempt(breaker, limiter, tracker, call, deadline)
+            except Exception as e:
+                if attempt < retries and is_transient(e):
+                    tracker.retries += 1
+                    logger.info(f"Retrying {service}.{operation} after transient error: {str(e)}")
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                raise
+
+            status_code = _response_details(result)[0]
+            if attempt < retries and status_code in TRANSIENT_STATUS_CODES:
+                tracker.retries += 1
+                logger.info(f"Retrying {service}.{operation} after HTTP {status_code}")
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            return result
+
+    async def _attempt(
+        self,
+        breaker: CircuitBreaker,
+        limiter: AdaptiveRateLimiter,
+        tracker: LatencyTracker,
+        call: Callable[[float], T],
+        deadline: float
+    ) -> T:
+        """One attempt; throttled (429) responses were not processed, so they are repeated within the wait budget"""
+        while True:
+            await limiter.acquire(max(deadline - time.monotonic(), 0.0))
+            result, throttled = await self._send(breaker, limiter, tracker, call)
+            if not throttled:
+                return result
+
+    async def _send(
+        self,
+        breaker: CircuitBreaker,
+        limiter: AdaptiveRateLimiter,
+        tracker: LatencyTracker,
+        call: Callable[[float], T]
+    ) -> Tuple[Optional[T], bool]:
+        """Send one request that already holds a rate limiter slot; returns (result, throttled)"""
+        breaker.allow()
+        # Outcome for the breaker: None (throttled or cancelled) says nothing about the service's health
+        failed: Optional[bool] = None
+        status = "error"
+        timeout = tracker.timeout
+        started = time.monotonic()
+        metrics.upstream_started(tracker.service)
+        try:
+            try:
+                result = await asyncio.to_thread(call, timeout)
+            except asyncio.CancelledError:
+                # A hedged request lost the race
+                status = "cancelled"
+                raise
+            except Exception as e:
+                elapsed = time.monotonic() - started
+                if elapsed >= timeout:
+                    # Timeouts count as latency samples so a slowing service raises its own timeout
+                    tracker.record(elapsed)
+                    status = "timeout"
+                status_code, headers = _response_details(getattr(e, "response", None))
+                if status_code is not None:
+                    status = str(status_code)
+                if status_code != 429:
+                    # Client errors (4xx) mean the service answered; only transient errors count against it
+                    failed = is_transient(e)
+                if status_code is None:
+                    raise
+                limiter.feedback(status_code, headers)
+                if status_code == 429:
+                    return None, True
+                raise
+
+            status_code, headers = _response_details(result)
+            status = str(status_code or 200)
+            limiter.feedback(status_code or 200, headers)
+            if status_code == 429:
+                return None, True
+            failed = status_code in TRANSIENT_STATUS_CODES
+            tracker.record(time.monotonic() - started)
+            return result, False
+        finally:
+            elapsed = time.monotonic() - started
+            metrics.upstream_finished(tracker.service)
+            metrics.observe_upstream(tracker.service, tracker.operation, status, elapsed)
+            breaker.release(failed, elapsed > tracker.timeout_ceiling * SLOW_CALL_FRACTION)
+
+    async def _hedged(
+        self,
+        breaker: CircuitBreaker,
+        limiter: AdaptiveRateLimiter,
+        tracker: LatencyTracker,
+        call: Callable[[float], T],
+        deadline: float
+    ) -> T:
+        """Start a second attempt once the first passes the p95 latency; the first answer wins"""
+        first = asyncio.ensure_future(self._attempt(breaker, limiter, tracker, call, deadline))
+        delay = tracker.p95
+        if delay is None:
+            return await first
+
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        # Hedges only use spare capacity of a healthy service; they never wait for the rate limiter
+        if done or breaker.state != BreakerState.CLOSED or not limiter.try_acquire():
+            return await first
+
+        tracker.hedges += 1
+        second = asyncio.ensure_future(self._send(breaker, limiter, tracker, call))
+        pending = {first, second}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if first in done and first.exception() is None:
+                    return first.result()
+                if second in done and second.exception() is None:
+                    result, throttled = second.result()
+                    if not throttled:
+                        tracker.hedges_won += 1
+                        return result
+            # Both attempts failed; report the original one's error
+            return first.result()
+        finally:
+            for task in pending:
+                # The losing request's thread finishes on its own; its result is ignored
+                task.cancel()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Latency statistics of every operation called so far"""
+        return {name: tracker.snapshot() for name, tracker in self._trackers.items()}
+
+# Global upstream call policy
+upstream_policy = UpstreamPolicy()
+
+async def call_upstream(
+    service: str,
+    operation: str,
+    call: Callable[[float], T],
+    idempotent: bool = False,
+    hedge: bool = False,
+    deployment: Optional[str] = None
+) -> T:
+    """Call an upstream Azure service under the shared policy (see UpstreamPolicy.call)"""
+    return await upstream_policy.call(service, operation, call, idempotent, hedge, deployment)